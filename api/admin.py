@@ -1,9 +1,43 @@
-from django.contrib import admin
+from django import forms
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ActionForm
 from django.contrib.auth.admin import UserAdmin
-from django.utils.safestring import mark_safe
-from .models import Creator, CreatorProfile, Campaign, ContentSubmission, InviteCode
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.html import format_html
+from .models import Creator, CreatorProfile, Campaign, ContentSubmission, InviteCode, MediaJob, PayoutEntry, SocialHandle
+from .pagination import EstimatedCountPaginator
+from .payouts import mark_paid, sync_ledger
+from .reviews import bulk_review
+from .search import matching_creator_ids
+from .social import normalize_handle
 
-class CreatorAdmin(UserAdmin):
+
+def blob_image_tag(key, size=150):
+    """
+    Link to the cached thumbnail instead of inlining the image bytes.
+    """
+    if not key:
+        return "No Image"
+    url = reverse('verification_thumbnail', args=[key])
+    return format_html(
+        '<img src="{}?size={}" width="{}" height="auto" loading="lazy" />', url, size, size
+    )
+
+class IndexedSearchMixin:
+    """
+    Changelist search through the creator search index (api/search.py)
+    instead of a LIKE scan per search field. `search_fields` still has to
+    be set for the admin to show the search box.
+    """
+    search_creator_lookup = 'pk__in'
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        return queryset.filter(**{self.search_creator_lookup: matching_creator_ids(search_term)}), False
+
+class CreatorAdmin(IndexedSearchMixin, UserAdmin):
     model = Creator
     # 1. Update list_display to remove non-existent fields if necessary (though these look okay from your previous code)
     list_display = ('email', 'username', 'is_staff', 'date_joined')
@@ -29,70 +63,190 @@ class CreatorAdmin(UserAdmin):
         }),
     )
 
-class CreatorProfileAdmin(admin.ModelAdmin):
+class CreatorProfileAdmin(IndexedSearchMixin, admin.ModelAdmin):
     # Added new helper fields to list_display
     list_display = ('creator', 'verification_status', 'tier', 'contract_signed', 'product_shipped', 'id_front_image_tag')
     list_editable = ('verification_status', 'tier', 'contract_signed', 'product_shipped')
-    search_fields = ('creator__email', 'creator__username')
+    search_fields = ('creator__email', 'creator__username', 'bio', 'social_links')
+    search_creator_lookup = 'creator_id__in'
+    list_select_related = ('creator',)
+    paginator = EstimatedCountPaginator
+    # Skip the second, unfiltered COUNT(*) on filtered/searched pages
+    show_full_result_count = False
     
     # FIX: Add the custom methods to readonly_fields so Django knows they are fields on the Admin class, not the model.
-    readonly_fields = ('w9_data_encrypted', 'id_front_image_tag', 'id_back_image_tag', 'selfie_image_tag') 
+    readonly_fields = (
+        'w9_data_encrypted', 'id_front_blob', 'id_back_blob', 'selfie_blob',
+        'id_front_image_detail_tag', 'id_back_image_tag', 'selfie_image_tag'
+    )
 
-    # Updated fieldsets to include both the raw data and the helper preview
+    # Updated fieldsets to include both the blob keys and the helper preview
     fieldsets = (
         ('Creator Info', {'fields': ('creator', 'bio', 'social_links', 'profile_picture_url')}),
         ('Status', {'fields': ('tier', 'verification_status')}),
         ('Onboarding & Tracking', {'fields': ('contract_signed', 'product_shipped', 'tracking_number', 'tracking_url')}),
-        # NEW SECTION: Viewable Base64 Data
-        ('Legal & Verification', {'fields': ('w9_complete', 'w9_data_encrypted', 
-                                            'id_front_image', 'id_front_image_tag', 
-                                            'id_back_image', 'id_back_image_tag', 
-                                            'selfie_image', 'selfie_image_tag')}),
+        ('Legal & Verification', {'fields': ('w9_complete', 'w9_data_encrypted',
+                                            'id_front_blob', 'id_front_image_detail_tag',
+                                            'id_back_blob', 'id_back_image_tag',
+                                            'selfie_blob', 'selfie_image_tag')}),
     )
 
-    # Helper method to display ID Front image in Admin
+    def get_queryset(self, request):
+        # The default manager defers the verification columns; the change form shows them
+        queryset = super().get_queryset(request).with_verification()
+        if request.resolver_match and request.resolver_match.url_name.endswith('_changelist'):
+            # The list only previews the ID front
+            queryset = queryset.defer('w9_data_encrypted', 'id_back_blob', 'selfie_blob')
+        return queryset
+
+    # Helper method to display ID Front image in Admin (small in the changelist)
     def id_front_image_tag(self, obj):
-        if obj.id_front_image:
-            # We wrap the Base64 string in an HTML img tag
-            return mark_safe(f'<img src="{obj.id_front_image}" width="150" height="auto" />')
-        return "No Image"
+        return blob_image_tag(obj.id_front_blob)
     id_front_image_tag.short_description = 'ID Front Preview'
-    id_front_image_tag.allow_tags = True
-    
+
+    def id_front_image_detail_tag(self, obj):
+        return blob_image_tag(obj.id_front_blob, size=600)
+    id_front_image_detail_tag.short_description = 'ID Front Preview'
+
     # Helper method to display ID Back image in Admin
     def id_back_image_tag(self, obj):
-        if obj.id_back_image:
-            return mark_safe(f'<img src="{obj.id_back_image}" width="150" height="auto" />')
-        return "No Image"
+        return blob_image_tag(obj.id_back_blob, size=600)
     id_back_image_tag.short_description = 'ID Back Preview'
-    id_back_image_tag.allow_tags = True
-    
+
     # Helper method to display Selfie image in Admin
     def selfie_image_tag(self, obj):
-        if obj.selfie_image:
-            return mark_safe(f'<img src="{obj.selfie_image}" width="150" height="auto" />')
-        return "No Image"
+        return blob_image_tag(obj.selfie_blob, size=600)
     selfie_image_tag.short_description = 'Selfie Preview'
-    selfie_image_tag.allow_tags = True
 
 
 class CampaignAdmin(admin.ModelAdmin):
-    list_display = ('title', 'phase', 'is_active', 'deadline')
+    list_display = ('title', 'phase', 'is_active', 'deadline', 'compensation_rate', 'compensation_amount')
     list_editable = ('is_active', 'phase', 'deadline')
 
+class ReviewActionForm(ActionForm):
+    feedback = forms.CharField(required=False, help_text="Optional, applied to every selected submission.")
+
 class SubmissionAdmin(admin.ModelAdmin):
     # Added 'platform' back since the model is confirmed to have it
-    list_display = ('creator', 'campaign', 'platform', 'status', 'created_at')
+    list_display = ('creator', 'campaign', 'platform', 'status', 'created_at', 'preview_tag')
     list_filter = ('status', 'platform')
     list_editable = ('status',)
+    list_select_related = ('creator', 'campaign')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    # Bulk review: one UPDATE for the whole selection instead of a save per row
+    action_form = ReviewActionForm
+    actions = ['approve_selected', 'request_changes_selected']
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        if request.resolver_match and request.resolver_match.url_name.endswith('_changelist'):
+            # Only the creator's and campaign's names are shown
+            queryset = queryset.defer('feedback', 'campaign__description', 'campaign__usage_rights')
+        return queryset
+
+    def save_model(self, request, obj, form, change):
+        # Staff edits (change form and list_editable) are reviews too: book or
+        # drop the payout in the same transaction
+        super().save_model(request, obj, form, change)
+        sync_ledger([obj.pk])
+
+    # Poster frame made by the media worker, so reviewers don't open the raw file
+    def preview_tag(self, obj):
+        if obj.preview_blob:
+            return blob_image_tag(obj.preview_blob)
+        # Processed without a poster, e.g. a file hosted elsewhere
+        return "Processing" if obj.media_processed_at is None else "No preview"
+    preview_tag.short_description = 'Preview'
+
+    def _review(self, request, queryset, status):
+        feedback = request.POST.get('feedback') or None
+        try:
+            result = bulk_review(queryset.values_list('pk', flat=True), status, feedback=feedback)
+        except ValueError as e:
+            self.message_user(request, str(e), level=messages.ERROR)
+            return
+        self.message_user(request, f"Marked {result['updated']} submissions as {status}.")
+
+    @admin.action(description='Approve selected submissions')
+    def approve_selected(self, request, queryset):
+        self._review(request, queryset, 'approved')
+
+    @admin.action(description='Request changes on selected submissions')
+    def request_changes_selected(self, request, queryset):
+        self._review(request, queryset, 'rejected')
+
+class MediaJobAdmin(admin.ModelAdmin):
+    list_display = ('submission', 'status', 'attempts', 'run_after', 'locked_by', 'finished_at')
+    list_filter = ('status',)
+    list_select_related = ('submission__creator',)
+    readonly_fields = ('last_error',)
+    actions = ['retry_now']
+
+    @admin.action(description='Retry selected jobs now')
+    def retry_now(self, request, queryset):
+        count = queryset.exclude(status='running').update(
+            status='queued', attempts=0, run_after=timezone.now(), locked_by=''
+        )
+        self.message_user(request, f"Requeued {count} jobs.")
 
 class InviteCodeAdmin(admin.ModelAdmin):
     list_display = ('code', 'email', 'first_name', 'is_used', 'created_at')
     list_filter = ('is_used', 'tier')
+    # Case-insensitive substring match; on PostgreSQL the UPPER() trigram
+    # indexes from migration 0021 serve it
     search_fields = ('code', 'email')
 
+class SocialHandleAdmin(admin.ModelAdmin):
+    # Derived from CreatorProfile.social_links; edit the profile instead
+    list_display = ('handle', 'platform', 'creator')
+    list_filter = ('platform',)
+    list_select_related = ('creator',)
+    search_fields = ('handle',)
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        # Exact match on the normalized handle, so '@Name' and profile URLs work too
+        handle = normalize_handle(search_term)
+        if not handle:
+            return queryset, False
+        return queryset.filter(handle=handle), False
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+class PayoutEntryAdmin(admin.ModelAdmin):
+    # Written by the review flow (api/payouts.py); only payment is recorded here
+    list_display = ('submission', 'creator', 'campaign', 'tier', 'amount', 'approved_at', 'paid_at')
+    list_filter = ('tier', ('paid_at', admin.EmptyFieldListFilter), 'campaign')
+    list_select_related = ('submission__creator', 'creator', 'campaign')
+    date_hierarchy = 'approved_at'
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ['mark_paid_selected']
+
+    @admin.action(description='Mark selected payouts as paid', permissions=['mark_paid'])
+    def mark_paid_selected(self, request, queryset):
+        self.message_user(request, f"Marked {mark_paid(queryset)} payouts as paid.")
+
+    def has_mark_paid_permission(self, request):
+        # A custom permission (PayoutEntry.Meta), so view access alone can't pay out
+        return request.user.has_perm(f'{self.opts.app_label}.mark_paid')
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
 admin.site.register(Creator, CreatorAdmin)
 admin.site.register(CreatorProfile, CreatorProfileAdmin)
 admin.site.register(Campaign, CampaignAdmin)
 admin.site.register(ContentSubmission, SubmissionAdmin)
-admin.site.register(InviteCode, InviteCodeAdmin)
\ No newline at end of file
+admin.site.register(InviteCode, InviteCodeAdmin)
+admin.site.register(MediaJob, MediaJobAdmin)
+admin.site.register(SocialHandle, SocialHandleAdmin)
+admin.site.register(PayoutEntry, PayoutEntryAdmin)
\ No newline at end of file
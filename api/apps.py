@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self):
+        # Dashboard snapshot, search index, social handle and payout ledger signal handlers
+        from . import dashboard, payouts, search, social  # noqa: F401
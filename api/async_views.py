@@ -0,0 +1,101 @@
+"""
+Async variants of the dashboard read endpoints, for running under ASGI
+(e.g. `uvicorn creator_portal_backend.asgi:application`).
+
+Payloads match the DRF views in api/views.py. Authentication, cache reads
+and queries are awaited, so a slow database round-trip parks the request
+instead of pinning a worker. Mounted under /api/async/.
+"""
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponseNotModified, JsonResponse
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+
+from .authentication import CachedJWTAuthentication
+from .serializers import (
+    CreatorProfileSerializer,
+    CreatorSerializer,
+    aget_active_campaign_data,
+    aget_campaign_list_data,
+    submission_status_queryset
+)
+from .views import etag_matches, paginated_submissions
+
+
+def _json(data, status=200):
+    # Compact separators, like DRF's JSONRenderer
+    return JsonResponse(
+        data, encoder=JSONEncoder, safe=False, status=status,
+        json_dumps_params={'separators': (',', ':'), 'ensure_ascii': False},
+    )
+
+
+def jwt_required(view):
+    """
+    Authenticate with the same JWT + cached user lookup as the DRF views,
+    returning DRF-shaped 401 responses on failure.
+    """
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        auth = CachedJWTAuthentication()
+        try:
+            result = await auth.aauthenticate(request)
+        except AuthenticationFailed as exc:
+            detail = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+            response = _json(detail, status=exc.status_code)
+        else:
+            if result is not None:
+                request.user = result[0]
+                return await view(request, *args, **kwargs)
+            response = _json({'detail': 'Authentication credentials were not provided.'}, status=401)
+
+        response['WWW-Authenticate'] = auth.authenticate_header(request)
+        return response
+    return wrapper
+
+
+@require_GET
+@jwt_required
+async def current_creator(request):
+    active_campaign = await aget_active_campaign_data()
+    if active_campaign is None:
+        submission_status = "no_campaign"
+    else:
+        submission_status = await submission_status_queryset(request.user, active_campaign).afirst()
+
+    serializer = CreatorSerializer(request.user, context={
+        'active_campaign': active_campaign,
+        'submission_status': submission_status or "pending_upload",
+    })
+    return _json(serializer.data)
+
+
+@require_GET
+@jwt_required
+async def creator_profile(request):
+    # The light profile was loaded with the user, so this is CPU only
+    return _json(CreatorProfileSerializer(request.user.profile).data)
+
+
+@require_GET
+@jwt_required
+async def campaign_list(request):
+    etag, data = await aget_campaign_list_data()
+    response = HttpResponseNotModified() if etag_matches(request, etag) else _json(data)
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+@require_GET
+@jwt_required
+async def submission_list(request):
+    drf_request = Request(request)
+    drf_request.user = request.user
+    # CursorPagination is sync-only; run the page query in a worker thread
+    response = await sync_to_async(paginated_submissions)(drf_request)
+    return _json(response.data)
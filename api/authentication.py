@@ -0,0 +1,102 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .cache import aversioned_key, user_namespace, versioned_key
+
+
+class ProfileJWTAuthentication(JWTAuthentication):
+    """
+    JWT auth that loads the creator and a light profile in one query,
+    so `request.user.profile` never hits the database again.
+    """
+
+    def get_user(self, validated_token):
+        user = self.load_user(self.get_user_id(validated_token))
+        self.check_user(user, validated_token)
+        return user
+
+    def get_user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+    def load_user(self, user_id):
+        try:
+            return self.user_model.objects.with_profile().get(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+
+    async def aauthenticate(self, request):
+        """
+        Async counterpart of authenticate() for plain Django async views.
+        """
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        user = await self.aload_user(self.get_user_id(validated_token))
+        self.check_user(user, validated_token)
+        return user, validated_token
+
+    async def aload_user(self, user_id):
+        try:
+            return await self.user_model.objects.with_profile().aget(**{api_settings.USER_ID_FIELD: user_id})
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+
+    def check_user(self, user, validated_token):
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+
+class CachedJWTAuthentication(ProfileJWTAuthentication):
+    """
+    For safe (read-only) requests, resolve the creator + light profile from
+    a short-lived cache entry keyed by the user's cache version. Writes
+    always load fresh rows so they never save over newer data.
+    """
+
+    def authenticate(self, request):
+        self.use_cache = request.method in SAFE_METHODS
+        return super().authenticate(request)
+
+    def load_user(self, user_id):
+        if not getattr(self, 'use_cache', False):
+            return super().load_user(user_id)
+
+        key = versioned_key(user_namespace(user_id), 'auth')
+        user = cache.get(key)
+        if user is None:
+            user = super().load_user(user_id)
+            cache.set(key, user, getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 60))
+        return user
+
+    async def aauthenticate(self, request):
+        self.use_cache = request.method in SAFE_METHODS
+        return await super().aauthenticate(request)
+
+    async def aload_user(self, user_id):
+        if not getattr(self, 'use_cache', False):
+            return await super().aload_user(user_id)
+
+        key = await aversioned_key(user_namespace(user_id), 'auth')
+        user = await cache.aget(key)
+        if user is None:
+            user = await super().aload_user(user_id)
+            await cache.aset(key, user, getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 60))
+        return user
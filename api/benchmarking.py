@@ -0,0 +1,239 @@
+"""
+Helpers for the in-process benchmark commands: a throwaway database,
+data seeding, and drivers that call the real WSGI / ASGI handlers.
+"""
+import asyncio
+import io
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, connections
+from django.db.backends.signals import connection_created
+from django.test.client import RequestFactory
+from PIL import Image
+from rest_framework_simplejwt.tokens import AccessToken
+
+from .blobstore import get_blob_store
+from .counters import reconcile_chunk
+from .payouts import sync_ledger
+from .search import index_creators
+from .social import sync_handles
+from .models import Campaign, ContentSubmission, Creator, CreatorProfile
+
+PLATFORMS = ('instagram', 'tiktok', 'youtube')
+STATUSES = ('pending', 'approved', 'rejected')
+
+
+@contextmanager
+def benchmark_database():
+    """
+    Run against a freshly migrated test database, never the real one.
+    """
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+@contextmanager
+def simulated_db_latency(seconds):
+    """
+    Add a fixed delay to every query on every connection, to model a
+    remote database on top of in-process SQLite.
+    """
+    if not seconds:
+        yield
+        return
+
+    def slow_execute(execute, sql, params, many, context):
+        time.sleep(seconds)
+        return execute(sql, params, many, context)
+
+    def install(sender, connection, **kwargs):
+        connection.execute_wrappers.append(slow_execute)
+
+    connection_created.connect(install)
+    for conn in connections.all(initialized_only=True):
+        conn.execute_wrappers.append(slow_execute)
+    try:
+        yield
+    finally:
+        connection_created.disconnect(install)
+        for conn in connections.all(initialized_only=True):
+            if slow_execute in conn.execute_wrappers:
+                conn.execute_wrappers.remove(slow_execute)
+
+
+class QueryCounter:
+    """
+    Counts queries on every connection in every thread (the async views run
+    their queries in worker threads, which CaptureQueriesContext can't see).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        with self._lock:
+            self.count += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self):
+        connection_created.connect(self._install)
+        for conn in connections.all(initialized_only=True):
+            conn.execute_wrappers.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        connection_created.disconnect(self._install)
+        for conn in connections.all(initialized_only=True):
+            if self in conn.execute_wrappers:
+                conn.execute_wrappers.remove(self)
+
+    def _install(self, sender, connection, **kwargs):
+        connection.execute_wrappers.append(self)
+
+
+def sample_jpeg(kb):
+    """
+    A decodable noise JPEG of roughly `kb` kilobytes (noise doesn't compress,
+    so it behaves like a phone photo of an ID).
+    """
+    def render(side):
+        buffer = io.BytesIO()
+        Image.effect_noise((side, side), 64).convert('RGB').save(buffer, 'JPEG', quality=85)
+        return buffer.getvalue()
+
+    data = render(256)
+    side = max(16, int(256 * math.sqrt(kb * 1024 / len(data))))
+    return render(side)
+
+
+def seed(creators=50, campaigns=3, submissions=500, blob_kb=0, batch_size=1000):
+    """
+    Bulk-insert creators with profiles, campaigns and `submissions` spread
+    randomly across creators. With `blob_kb`, every profile also gets ID
+    front/back/selfie images of about that size in the blob store.
+    Returns the created creators.
+    """
+    password = make_password('bench-password')
+    Creator.objects.bulk_create([
+        Creator(email=f'creator{i}@bench.test', username=f'creator{i}', password=password)
+        for i in range(creators)
+    ], batch_size=batch_size)
+    users = list(Creator.objects.filter(email__endswith='@bench.test').order_by('pk'))
+
+    # bulk_create skips post_save, so profiles are created explicitly
+    image = sample_jpeg(blob_kb) if blob_kb else None
+    store = get_blob_store()
+    profiles = []
+    for user in users:
+        profile = CreatorProfile(
+            creator=user, bio=f'Creator {user.pk}', social_links={'tiktok': f'@{user.username}'}
+        )
+        if image:
+            # Trailing bytes keep the JPEG decodable but make each blob unique
+            for n, field in enumerate(('id_front_blob', 'id_back_blob', 'selfie_blob')):
+                setattr(profile, field, store.save([image, f'{user.pk}:{n}'.encode()]))
+            profile.verification_status = 'pending'
+        profiles.append(profile)
+    CreatorProfile.objects.bulk_create(profiles, batch_size=batch_size)
+    index_creators([user.pk for user in users])
+    sync_handles({profile.creator_id: profile.social_links for profile in profiles})
+
+    Campaign.objects.bulk_create([
+        Campaign(
+            title=f'Campaign {i}', description='Benchmark campaign', is_active=True,
+            compensation_rate='$100.00', compensation_amount=Decimal('100.00'),
+        )
+        for i in range(campaigns)
+    ])
+    campaign_ids = list(Campaign.objects.values_list('pk', flat=True))
+
+    pending = []
+    for n in range(submissions):
+        user = random.choice(users)
+        pending.append(ContentSubmission(
+            creator=user,
+            campaign_id=random.choice(campaign_ids) if campaign_ids else None,
+            content_url=f'https://cdn.bench.test/{user.pk}/{n}.mp4',
+            platform=random.choice(PLATFORMS),
+            status=random.choice(STATUSES),
+        ))
+        if len(pending) >= batch_size:
+            ContentSubmission.objects.bulk_create(pending)
+            pending = []
+    ContentSubmission.objects.bulk_create(pending)
+    # bulk_create skips the counter and ledger updates too
+    reconcile_chunk(campaign_ids)
+    sync_ledger(ContentSubmission.objects.filter(status='approved').values_list('pk', flat=True), backfill=True)
+    return users
+
+
+def auth_header(user):
+    return f'Bearer {AccessToken.for_user(user)}'
+
+
+# --- Request drivers -------------------------------------------------------------
+
+def wsgi_get(app, path, authorization):
+    """
+    GET through a WSGI application; returns (status code, body bytes).
+    """
+    path, _, query = path.partition('?')
+    environ = RequestFactory()._base_environ(
+        PATH_INFO=path, QUERY_STRING=query, REQUEST_METHOD='GET', HTTP_AUTHORIZATION=authorization,
+    )
+    status = []
+    body = app(environ, lambda code, headers, exc_info=None: status.append(code))
+    try:
+        size = sum(len(chunk) for chunk in body)
+    finally:
+        if hasattr(body, 'close'):
+            body.close()
+    return int(status[0].split()[0]), size
+
+
+async def asgi_get(app, path, authorization):
+    """
+    GET through an ASGI application; returns (status code, body bytes).
+    """
+    path, _, query = path.partition('?')
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+        'method': 'GET', 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+        'query_string': query.encode(), 'root_path': '',
+        'headers': [(b'host', b'testserver'), (b'authorization', authorization.encode())],
+        'client': ('127.0.0.1', 50000), 'server': ('testserver', 80),
+    }
+    disconnect = asyncio.Event()
+    sent_body = False
+    status = None
+    size = 0
+
+    async def receive():
+        nonlocal sent_body
+        if not sent_body:
+            sent_body = True
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await disconnect.wait()
+        return {'type': 'http.disconnect'}
+
+    async def send(message):
+        nonlocal status, size
+        if message['type'] == 'http.response.start':
+            status = message['status']
+        elif message['type'] == 'http.response.body':
+            size += len(message.get('body', b''))
+
+    await app(scope, receive, send)
+    disconnect.set()
+    return status, size
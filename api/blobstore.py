@@ -0,0 +1,171 @@
+"""
+Content-addressed storage for verification images (ID front/back, selfie).
+
+Blobs are keyed by the SHA-256 of their bytes, so a profile only keeps a
+64-char key and identical uploads are stored once. The backend is chosen
+by settings.BLOB_STORE, so the local disk store can be swapped for an
+S3-style one without touching the views.
+"""
+import binascii
+import hashlib
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+CHUNK_SIZE = 64 * 1024
+
+# Base64 text is decoded in slices of this many characters (multiple of 4)
+B64_SLICE = 4 * 16 * 1024
+
+KEY_RE = re.compile(r'^[0-9a-f]{64}$')
+
+
+def is_valid_key(key):
+    return bool(KEY_RE.match(key or ''))
+
+
+# --- Backends ---------------------------------------------------------------
+
+class BlobStore:
+    """
+    S3-style interface: every operation is addressed by key only.
+    """
+
+    def save(self, chunks):
+        """Store an iterable of byte chunks and return its key."""
+        raise NotImplementedError
+
+    def open(self, key):
+        """Return a readable binary file object for the blob."""
+        raise NotImplementedError
+
+    def exists(self, key):
+        raise NotImplementedError
+
+    def size(self, key):
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+
+class LocalBlobStore(BlobStore):
+    """
+    Stores blobs on local disk under <root>/ab/cd/<sha256>.
+    """
+
+    def __init__(self, root=None):
+        self.root = Path(root or os.path.join(settings.MEDIA_ROOT, 'blobs'))
+
+    def path(self, key):
+        if not is_valid_key(key):
+            raise ValueError(f'Invalid blob key: {key!r}')
+        return self.root / key[:2] / key[2:4] / key
+
+    def save(self, chunks):
+        self.root.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as tmp:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    tmp.write(chunk)
+
+            key = digest.hexdigest()
+            dest = self.path(key)
+            if dest.exists():
+                # Same content already stored
+                os.remove(tmp_path)
+            else:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp_path, dest)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return key
+
+    def open(self, key):
+        return open(self.path(key), 'rb')
+
+    def exists(self, key):
+        return self.path(key).exists()
+
+    def size(self, key):
+        return self.path(key).stat().st_size
+
+    def delete(self, key):
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+
+def get_blob_store():
+    """
+    Build the backend configured in settings.BLOB_STORE.
+    """
+    config = getattr(settings, 'BLOB_STORE', {})
+    backend = import_string(config.get('BACKEND', 'api.blobstore.LocalBlobStore'))
+    return backend(**config.get('OPTIONS', {}))
+
+
+# --- Upload helpers -----------------------------------------------------------
+
+def iter_base64(text):
+    """
+    Decode a base64 string (optionally a data URI) in fixed-size slices,
+    so the decoded bytes never exist as one big object.
+    """
+    if text.startswith('data:'):
+        text = text[text.find(',') + 1:]
+
+    pending = ''
+    for start in range(0, len(text), B64_SLICE):
+        piece = pending + ''.join(text[start:start + B64_SLICE].split())
+        usable = len(piece) - len(piece) % 4
+        pending = piece[usable:]
+        if usable:
+            yield binascii.a2b_base64(piece[:usable])
+
+    if pending:
+        raise binascii.Error('Incorrect base64 padding')
+
+
+def store_upload(value, store=None):
+    """
+    Save an uploaded file or base64 string and return its key.
+    Empty values return None so callers can clear the reference.
+    """
+    if not value:
+        return None
+
+    store = store or get_blob_store()
+    if hasattr(value, 'chunks'):
+        # Django UploadedFile: large ones are already spooled to a temp file
+        return store.save(value.chunks(CHUNK_SIZE))
+    if isinstance(value, str):
+        return store.save(iter_base64(value))
+    raise ValueError('Unsupported upload type.')
+
+
+def sniff_content_type(head):
+    """
+    Guess an image MIME type from the first bytes of a blob.
+    """
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return 'image/gif'
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    if head.startswith(b'%PDF'):
+        return 'application/pdf'
+    return 'application/octet-stream'
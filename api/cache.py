@@ -0,0 +1,97 @@
+"""
+Versioned cache namespaces.
+
+Each namespace (e.g. 'campaigns') has a version number stored in the
+cache. Entries are keyed by that version, so invalidating a whole
+namespace is a single increment and stale entries simply age out.
+"""
+import time
+
+from django.core.cache import cache
+
+from .routers import primary_reads
+
+# Upper bound on how long an entry may live, even if never invalidated
+DEFAULT_TIMEOUT = 60 * 60
+
+
+def user_namespace(user_id):
+    """
+    Per-creator namespace, bumped whenever the Creator or its profile is saved.
+    """
+    return f'user:{user_id}'
+
+
+def _version_key(namespace):
+    return f'api:{namespace}:version'
+
+
+def get_version(namespace):
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        # Seed with a timestamp so a lost version can't collide with old entries
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace):
+    try:
+        cache.incr(_version_key(namespace))
+    except ValueError:
+        cache.set(_version_key(namespace), time.time_ns(), timeout=None)
+
+
+def versioned_key(namespace, *parts):
+    suffix = ':'.join(str(part) for part in parts)
+    return f'api:{namespace}:{get_version(namespace)}:{suffix}'
+
+
+def get_or_build(namespace, name, builder, timeout=DEFAULT_TIMEOUT):
+    """
+    Return the cached value for `name` in `namespace`, building it on a miss.
+    Values are wrapped so that a cached None is still a hit.
+    """
+    key = versioned_key(namespace, name)
+    hit = cache.get(key)
+    if hit is not None:
+        return hit[0]
+
+    # Shared entries are filled from the primary, so a lagging replica can't
+    # cache pre-change data under the new version
+    with primary_reads():
+        value = builder()
+    cache.set(key, (value,), timeout)
+    return value
+
+
+# --- Async variants (for the ASGI read path) -----------------------------------
+
+async def aget_version(namespace):
+    key = _version_key(namespace)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns(), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+async def aversioned_key(namespace, *parts):
+    suffix = ':'.join(str(part) for part in parts)
+    return f'api:{namespace}:{await aget_version(namespace)}:{suffix}'
+
+
+async def aget_or_build(namespace, name, builder, timeout=DEFAULT_TIMEOUT):
+    """
+    Like get_or_build(), with an async `builder`.
+    """
+    key = await aversioned_key(namespace, name)
+    hit = await cache.aget(key)
+    if hit is not None:
+        return hit[0]
+
+    with primary_reads():
+        value = await builder()
+    await cache.aset(key, (value,), timeout)
+    return value
@@ -0,0 +1,99 @@
+"""
+Per-campaign submission counters.
+
+CampaignSubmissionCounter holds one row per (campaign, status, platform).
+ContentSubmission.save(), the post_delete handler and bulk_review() adjust
+it in the same transaction as the submission write. Campaign progress is
+then a read of at most nine rows instead of a GROUP BY over every
+submission. `reconcile` rebuilds the counters from the source table, for
+backfills and for writes that bypass the model (queryset.update(), raw SQL).
+"""
+from collections import Counter
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import Count
+
+from .models import PLATFORM_CHOICES, Campaign, CampaignSubmissionCounter, ContentSubmission
+
+DEFAULT_CHUNK_SIZE = 50  # campaigns per transaction
+
+STATUSES = [status for status, _ in ContentSubmission.STATUS_CHOICES]
+PLATFORMS = [platform for platform, _ in PLATFORM_CHOICES]
+
+
+# --- Reading ------------------------------------------------------------------
+
+def campaign_progress(campaign):
+    """
+    Submission totals for a campaign, by status, by platform and both.
+    """
+    breakdown = {status: dict.fromkeys(PLATFORMS, 0) for status in STATUSES}
+    for status, platform, count in (
+        CampaignSubmissionCounter.objects.filter(campaign=campaign).values_list('status', 'platform', 'count')
+    ):
+        breakdown.setdefault(status, {})[platform] = count
+    return {
+        'campaign': campaign.pk,
+        'title': campaign.title,
+        'total': sum(sum(platforms.values()) for platforms in breakdown.values()),
+        'by_status': {status: sum(platforms.values()) for status, platforms in breakdown.items()},
+        'by_platform': {
+            platform: sum(platforms.get(platform, 0) for platforms in breakdown.values()) for platform in PLATFORMS
+        },
+        'breakdown': breakdown,
+    }
+
+
+# --- Reconciliation -------------------------------------------------------------
+
+def reconcile_chunk(campaign_ids, dry_run=False):
+    """
+    Recount the given campaigns and fix counters that drifted. Returns
+    {(campaign id, status, platform): (stored, actual)} for the drifted keys.
+
+    The stored rows are locked before counting, so a concurrent submission
+    write either lands before the count (and is included) or waits and adds
+    its delta on top of the corrected value.
+    """
+    with transaction.atomic():
+        stored = {
+            (campaign_id, status, platform): count
+            for campaign_id, status, platform, count in (
+                CampaignSubmissionCounter.objects.select_for_update().filter(campaign_id__in=campaign_ids)
+                .values_list('campaign_id', 'status', 'platform', 'count')
+            )
+        }
+        actual = Counter({
+            (row['campaign_id'], row['status'], row['platform']): row['n']
+            for row in (
+                ContentSubmission.objects.filter(campaign_id__in=campaign_ids).order_by()
+                .values('campaign_id', 'status', 'platform').annotate(n=Count('id'))
+            )
+        })
+        drift = {
+            key: (stored.get(key, 0), actual[key])
+            for key in stored.keys() | actual.keys() if stored.get(key, 0) != actual[key]
+        }
+        if drift and not dry_run:
+            CampaignSubmissionCounter.objects.bulk_create(
+                [
+                    CampaignSubmissionCounter(campaign_id=campaign_id, status=status, platform=platform, count=count)
+                    for (campaign_id, status, platform), (_, count) in sorted(drift.items())
+                ],
+                update_conflicts=True, unique_fields=['campaign', 'status', 'platform'], update_fields=['count'],
+            )
+    return drift
+
+
+def reconcile(campaign_ids=None, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False):
+    """
+    Reconcile every campaign (or just `campaign_ids`), `chunk_size` campaigns
+    per transaction. Yields (campaign ids, drift) per chunk.
+    """
+    campaigns = Campaign.objects.order_by('pk')
+    if campaign_ids:
+        campaigns = campaigns.filter(pk__in=campaign_ids)
+    iterator = campaigns.values_list('pk', flat=True).iterator(chunk_size=chunk_size)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk, reconcile_chunk(chunk, dry_run=dry_run)
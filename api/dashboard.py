@@ -0,0 +1,222 @@
+"""
+Denormalized creator dashboard.
+
+Each creator has one DashboardSnapshot row holding everything the
+dashboard shows that is specific to them:
+
+    creator      id / username / email
+    profile      CreatorProfileSerializer data
+    personalized compensation / deadline overrides
+    latest       {campaign id: latest submission {id, status, feedback, created_at}}
+
+Signal handlers below patch only the affected section, after commit. The
+active campaign is shared by everyone, so it isn't copied into snapshots.
+It is merged in at read time from the cached campaign data. That way a
+campaign change doesn't rewrite every row, and a dashboard read is one
+primary-key query.
+"""
+from itertools import groupby
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework import serializers
+
+from .models import ContentSubmission, Creator, CreatorProfile, DashboardSnapshot
+from .reviews import submissions_reviewed
+from .serializers import CreatorProfileSerializer, get_active_campaign_data
+
+SUBMISSION_FIELDS = ('id', 'campaign_id', 'status', 'feedback', 'created_at')
+
+# Same datetime format as the API's serializers
+_datetime = serializers.DateTimeField()
+
+
+# --- Sections -----------------------------------------------------------------
+
+def creator_section(creator):
+    return {'id': creator.pk, 'username': creator.username, 'email': creator.email}
+
+
+def profile_section(profile):
+    return CreatorProfileSerializer(profile).data
+
+
+def personalized_section(profile):
+    deadline = profile.personalized_deadline
+    return {
+        'compensation': profile.personalized_compensation,
+        'deadline': deadline.isoformat() if deadline else None,
+    }
+
+
+def _submission_entry(row):
+    return {
+        'id': row['id'],
+        'status': row['status'],
+        'feedback': row['feedback'],
+        'created_at': _datetime.to_representation(row['created_at']),
+    }
+
+
+def latest_by_campaign(creator_ids):
+    """
+    {creator id: {campaign id (str): latest submission entry}} in one query.
+    """
+    rows = (
+        ContentSubmission.objects.filter(creator_id__in=creator_ids, campaign__isnull=False)
+        .order_by('creator_id', 'campaign_id', '-created_at', '-id')
+        .values('creator_id', *SUBMISSION_FIELDS)
+    )
+    latest = {}
+    for (creator_id, campaign_id), group in groupby(rows, key=lambda row: (row['creator_id'], row['campaign_id'])):
+        latest.setdefault(creator_id, {})[str(campaign_id)] = _submission_entry(next(group))
+    return latest
+
+
+def build_snapshot(creator, latest=None):
+    """
+    Full snapshot data for a creator (with `profile` loaded).
+    """
+    if latest is None:
+        latest = latest_by_campaign([creator.pk]).get(creator.pk, {})
+    profile = creator.profile
+    return {
+        'creator': creator_section(creator),
+        'profile': profile_section(profile),
+        'personalized': personalized_section(profile),
+        'latest': latest,
+    }
+
+
+def rebuild_snapshots(creators):
+    """
+    Write fresh snapshots for a batch of creators: two reads, one upsert.
+    """
+    creators = list(creators)
+    latest = latest_by_campaign([creator.pk for creator in creators])
+    DashboardSnapshot.objects.bulk_create(
+        [
+            DashboardSnapshot(creator=creator, data=build_snapshot(creator, latest.get(creator.pk, {})))
+            for creator in creators
+        ],
+        update_conflicts=True, unique_fields=['creator'], update_fields=['data', 'updated_at'],
+    )
+    return len(creators)
+
+
+# --- Reading ------------------------------------------------------------------
+
+def dashboard_payload(creator):
+    """
+    The dashboard for `creator`: one primary-key read, plus the cached
+    active campaign. Missing snapshots are built on first read.
+    """
+    data = DashboardSnapshot.objects.filter(pk=creator.pk).values_list('data', flat=True).first()
+    if data is None:
+        rebuild_snapshots([Creator.objects.with_profile().get(pk=creator.pk)])
+        data = DashboardSnapshot.objects.filter(pk=creator.pk).values_list('data', flat=True).first()
+
+    campaign = get_active_campaign_data()
+    personalized = data['personalized']
+    if campaign is None:
+        submission, submission_status = None, 'no_campaign'
+    else:
+        submission = data['latest'].get(str(campaign['id']))
+        submission_status = submission['status'] if submission else 'pending_upload'
+
+    return {
+        **data['creator'],
+        'profile': data['profile'],
+        'active_campaign': campaign,
+        # Per-creator overrides win over the campaign defaults
+        'compensation': personalized['compensation'] or (campaign and campaign['compensation_rate']),
+        'deadline': personalized['deadline'] or (campaign and campaign['deadline']),
+        'submission_status': submission_status,
+        'latest_submission': submission,
+    }
+
+
+# --- Incremental updates --------------------------------------------------------
+
+def _patch(creator_ids, mutate):
+    """
+    Apply `mutate(data, creator_id)` to existing snapshots under a row lock.
+    Creators without a snapshot are skipped; theirs is built in full on first read.
+    """
+    with transaction.atomic():
+        snapshots = list(DashboardSnapshot.objects.select_for_update().filter(pk__in=creator_ids))
+        now = timezone.now()
+        for snapshot in snapshots:
+            mutate(snapshot.data, snapshot.pk)
+            snapshot.updated_at = now
+        DashboardSnapshot.objects.bulk_update(snapshots, ['data', 'updated_at'])
+
+
+def _refresh_latest(pairs):
+    """
+    Re-read the latest submission for each (creator id, campaign id) pair.
+    """
+    creator_ids = {creator_id for creator_id, _ in pairs}
+    latest = latest_by_campaign(creator_ids)
+
+    def mutate(data, creator_id):
+        for pair_creator, campaign_id in pairs:
+            if pair_creator != creator_id:
+                continue
+            entry = latest.get(creator_id, {}).get(str(campaign_id))
+            if entry:
+                data['latest'][str(campaign_id)] = entry
+            else:
+                data['latest'].pop(str(campaign_id), None)
+
+    _patch(creator_ids, mutate)
+
+
+@receiver(post_save, sender=Creator)
+def dashboard_creator_changed(sender, instance, created, **kwargs):
+    update_fields = kwargs.get('update_fields')
+    if created or (update_fields and not {'username', 'email'} & set(update_fields)):
+        # New creators get theirs from the profile signal; logins only touch last_login
+        return
+    section = creator_section(instance)
+    transaction.on_commit(lambda: _patch([instance.pk], lambda data, _: data.update(creator=section)))
+
+
+@receiver(post_save, sender=CreatorProfile)
+def dashboard_profile_changed(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: DashboardSnapshot.objects.update_or_create(
+            creator_id=instance.creator_id,
+            defaults={'data': build_snapshot(Creator.objects.with_profile().get(pk=instance.creator_id))},
+        ))
+        return
+    sections = {'profile': profile_section(instance), 'personalized': personalized_section(instance)}
+    transaction.on_commit(lambda: _patch([instance.creator_id], lambda data, _: data.update(sections)))
+
+
+@receiver(post_save, sender=ContentSubmission)
+@receiver(post_delete, sender=ContentSubmission)
+def dashboard_submission_changed(sender, instance, **kwargs):
+    # A submission moved to another campaign changes both campaigns' entries
+    campaign_ids = {instance.campaign_id, getattr(instance, '_previous_campaign_id', None)} - {None}
+    pairs = {(instance.creator_id, campaign_id) for campaign_id in campaign_ids}
+    if pairs:
+        transaction.on_commit(lambda: _refresh_latest(pairs))
+
+
+@receiver(submissions_reviewed)
+def dashboard_submissions_reviewed(sender, reviews, status, feedback, **kwargs):
+    # Bulk reviews don't fire post_save; patch in place without re-reading
+    reviewed = {submission_id for submission_id, _, _, _ in reviews}
+    creator_ids = {creator_id for _, creator_id, _, _ in reviews}
+
+    def mutate(data, creator_id):
+        for entry in data['latest'].values():
+            if entry['id'] in reviewed:
+                entry['status'] = status
+                if feedback is not None:
+                    entry['feedback'] = feedback
+
+    _patch(creator_ids, mutate)
@@ -0,0 +1,179 @@
+"""
+Streaming CSV / JSONL exports for ops reports.
+
+Rows are read with `values_list().iterator(chunk_size=...)` (a server-side
+cursor on PostgreSQL) and written out a few hundred lines at a time, so
+memory stays flat however many rows match. Used by ExportView and `manage.py export_data`.
+"""
+import csv
+import datetime
+import json
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import ContentSubmission, Creator, CreatorProfile, InviteCode
+
+FORMATS = ('csv', 'jsonl')
+CONTENT_TYPES = {'csv': 'text/csv', 'jsonl': 'application/x-ndjson'}
+DEFAULT_CHUNK_SIZE = 2000
+
+INVITE_STATUSES = {'used': True, 'available': False}
+
+
+def _campaign_creators(campaign):
+    return ContentSubmission.objects.filter(campaign_id=campaign).values('creator_id')
+
+
+def _creators(campaign, status):
+    queryset = Creator.objects.all()
+    if campaign:
+        queryset = queryset.filter(pk__in=_campaign_creators(campaign))
+    if status:
+        queryset = queryset.filter(profile__verification_status=status)
+    return queryset
+
+
+def _profiles(campaign, status):
+    queryset = CreatorProfile.objects.all()
+    if campaign:
+        queryset = queryset.filter(creator_id__in=_campaign_creators(campaign))
+    if status:
+        queryset = queryset.filter(verification_status=status)
+    return queryset
+
+
+def _submissions(campaign, status):
+    queryset = ContentSubmission.objects.all()
+    if campaign:
+        queryset = queryset.filter(campaign_id=campaign)
+    if status:
+        queryset = queryset.filter(status=status)
+    return queryset
+
+
+def _invites(campaign, status):
+    if campaign:
+        raise ValueError("Invites can't be filtered by campaign.")
+    queryset = InviteCode.objects.all()
+    if status:
+        if status not in INVITE_STATUSES:
+            raise ValueError(f"Invite status must be one of: {', '.join(INVITE_STATUSES)}.")
+        queryset = queryset.filter(is_used=INVITE_STATUSES[status])
+    return queryset
+
+
+# kind -> (filtered queryset, date field for since/until, exported columns)
+EXPORTS = {
+    'creators': (_creators, 'date_joined', (
+        'id', 'email', 'username', 'is_active', 'is_staff', 'date_joined', 'last_login',
+    )),
+    # No W-9 data or verification blob keys
+    'profiles': (_profiles, 'creator__date_joined', (
+        'id', 'creator_id', 'creator__email', 'creator__username', 'bio', 'profile_picture_url',
+        'social_links', 'tier', 'verification_status', 'w9_complete', 'contract_signed',
+        'product_shipped', 'tracking_number', 'tracking_url',
+        'personalized_compensation', 'personalized_deadline',
+    )),
+    'submissions': (_submissions, 'created_at', (
+        'id', 'creator_id', 'creator__email', 'campaign_id', 'campaign__title', 'content_url',
+        'file_type', 'platform', 'status', 'feedback', 'created_at',
+    )),
+    'invites': (_invites, 'created_at', (
+        'id', 'code', 'email', 'first_name', 'tier', 'is_used', 'created_at',
+    )),
+}
+
+
+def _parse_bound(value, end=False):
+    """
+    An ISO date or datetime. A bare date as the upper bound includes that whole day.
+    """
+    moment = parse_datetime(value)
+    if moment is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f"Invalid date: {value!r}")
+        if end:
+            day += datetime.timedelta(days=1)
+        moment = datetime.datetime.combine(day, datetime.time.min)
+        return timezone.make_aware(moment), not end
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment, True
+
+
+def export_rows(kind, campaign=None, status=None, since=None, until=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                using=None):
+    """
+    (column names, row tuple iterator) for one export, read from database
+    `using` (default: as routed). Raises ValueError for an unknown kind or
+    a bad filter.
+    """
+    if kind not in EXPORTS:
+        raise ValueError(f"Unknown export: {kind}")
+    build, date_field, columns = EXPORTS[kind]
+
+    queryset = build(campaign, status)
+    if since:
+        moment, _ = _parse_bound(since)
+        queryset = queryset.filter(**{f'{date_field}__gte': moment})
+    if until:
+        moment, inclusive = _parse_bound(until, end=True)
+        queryset = queryset.filter(**{f'{date_field}__{"lte" if inclusive else "lt"}': moment})
+
+    if using:
+        queryset = queryset.using(using)
+    rows = queryset.order_by('pk').values_list(*columns).iterator(chunk_size=chunk_size)
+    return columns, rows
+
+
+class _Echo:
+    """
+    File-like object that hands csv.writer's output straight back.
+    """
+    def write(self, value):
+        return value
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+def stream_csv(columns, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(columns)
+    for row in rows:
+        yield writer.writerow([_csv_value(value) for value in row])
+
+
+def stream_jsonl(columns, rows):
+    encoder = JSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(dict(zip(columns, row))) + '\n'
+
+
+def _batched(lines, size):
+    # Fewer, larger writes for the WSGI server than one per row
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield ''.join(batch)
+            batch = []
+    if batch:
+        yield ''.join(batch)
+
+
+def stream_export(fmt, columns, rows, lines_per_chunk=500):
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}")
+    lines = stream_csv(columns, rows) if fmt == 'csv' else stream_jsonl(columns, rows)
+    return _batched(lines, lines_per_chunk)
@@ -0,0 +1,111 @@
+"""
+Read-only fast path for list responses.
+
+A FastSerializer is built from an existing ModelSerializer. On first use it
+walks that serializer's readable fields once and turns each into a step:
+the `.values()` key to read, plus the field's own to_representation, or
+nothing when it would return the database value unchanged (char, integer,
+boolean, choice, JSON, primary-key fields). Nested serializers on a foreign
+key become a nested plan over `fk__column` keys.
+
+Rendering a row is then a loop over those steps. DRF's per-field
+get_attribute / SkipField / PKOnlyObject machinery never runs, and no model
+instance is built. Output matches the source serializer (see the parity
+tests in api/tests.py).
+
+Only plain model columns, dotted sources and nested model serializers are
+supported. A serializer with method fields or `source='*'` is rejected up front.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.functional import cached_property
+from rest_framework import fields, relations, serializers
+
+from .instrumentation import timed
+
+
+def _returns_value_unchanged(field):
+    """
+    True if field.to_representation(v) == v for any value the database hands back.
+    """
+    if isinstance(field, relations.PrimaryKeyRelatedField):
+        return field.pk_field is None
+    if isinstance(field, fields.JSONField):
+        return not field.binary
+    if isinstance(field, fields.ChoiceField):
+        return all(isinstance(key, str) for key in field.choices)
+    return type(field).to_representation in (
+        fields.CharField.to_representation,
+        fields.IntegerField.to_representation,
+        fields.BooleanField.to_representation,
+    )
+
+
+def _plan(serializer, prefix=''):
+    """
+    (values() keys, steps) for a serializer instance. Each step is
+    (output name, row key, converter or None, nested steps or None).
+    """
+    keys, steps = [], []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if isinstance(field, (fields.SerializerMethodField, serializers.ListSerializer)) or field.source == '*':
+            raise ImproperlyConfigured(
+                f"{type(serializer).__name__}.{name} can't be read from .values() rows."
+            )
+        key = prefix + field.source.replace('.', '__')
+        keys.append(key)
+        if isinstance(field, serializers.BaseSerializer):
+            # Nested object: None when the foreign key is, else its own plan
+            nested_keys, nested_steps = _plan(field, prefix=f'{key}__')
+            keys.extend(nested_keys)
+            steps.append((name, key, None, nested_steps))
+        else:
+            steps.append((name, key, None if _returns_value_unchanged(field) else field.to_representation, None))
+    return list(dict.fromkeys(keys)), steps
+
+
+def _render(steps, row):
+    data = {}
+    for name, key, convert, nested in steps:
+        value = row[key]
+        if nested is not None:
+            data[name] = None if value is None else _render(nested, row)
+        elif value is None or convert is None:
+            data[name] = value
+        else:
+            data[name] = convert(value)
+    return data
+
+
+class FastSerializer:
+    """
+    fast = FastSerializer(ContentSubmissionSerializer)
+    data = fast.serialize(fast.values(queryset))
+    """
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+
+    @cached_property
+    def _compiled(self):
+        return _plan(self.serializer_class())
+
+    @property
+    def keys(self):
+        return self._compiled[0]
+
+    def values(self, queryset):
+        """
+        The queryset as the .values() rows this serializer reads.
+        """
+        return queryset.values(*self.keys)
+
+    def to_representation(self, row):
+        with timed('serialize'):
+            return _render(self._compiled[1], row)
+
+    def serialize(self, rows):
+        steps = self._compiled[1]
+        with timed('serialize'):
+            return [_render(steps, row) for row in rows]
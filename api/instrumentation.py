@@ -0,0 +1,201 @@
+"""
+Per-request SQL and timing metrics.
+
+RequestMetricsMiddleware records, for every request, the number of SQL
+queries, total DB time, serializer time and view time. Staff users (and
+everyone when DEBUG is on) get them back as a `Server-Timing` header, and
+requests slower than SLOW_REQUEST_THRESHOLD_MS are logged to
+`api.requests` with their most expensive statements.
+
+The work per query is a perf_counter pair and a dict update, and nothing
+is formatted unless a header or log line is actually emitted, so the
+middleware is meant to stay on in production.
+"""
+import json
+import logging
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.utils.functional import SimpleLazyObject, empty
+
+logger = logging.getLogger('api.requests')
+
+_current = ContextVar('request_metrics', default=None)
+
+DEFAULT_SLOW_REQUEST_THRESHOLD_MS = 500
+DEFAULT_SLOW_REQUEST_TOP_QUERIES = 5
+
+
+class RequestMetrics:
+    """
+    Counters for one request. Queries are grouped by SQL text, so an N+1
+    shows up as one statement with a high count.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.query_count = 0
+        self.db_time = 0.0
+        self.queries = {}
+        self.sections = {}
+        self._open = set()
+
+    def add_query(self, sql, duration):
+        self.query_count += 1
+        self.db_time += duration
+        stats = self.queries.get(sql)
+        if stats is None:
+            self.queries[sql] = [1, duration]
+        else:
+            stats[0] += 1
+            stats[1] += duration
+
+    def add_time(self, name, duration):
+        self.sections[name] = self.sections.get(name, 0.0) + duration
+
+    def top_queries(self, limit):
+        ranked = sorted(self.queries.items(), key=lambda item: item[1][1], reverse=True)
+        return [
+            {'sql': sql, 'count': count, 'ms': round(total * 1000, 2)}
+            for sql, (count, total) in ranked[:limit]
+        ]
+
+
+class timed:
+    """
+    Add the time spent inside the block to a named section of the current
+    request's metrics. Nested blocks of the same name are only counted once,
+    so wrapping nested serializers doesn't double-count.
+    """
+    __slots__ = ('name', 'metrics', 'started')
+
+    def __init__(self, name):
+        self.name = name
+        self.metrics = None
+
+    def __enter__(self):
+        metrics = _current.get()
+        if metrics is not None and self.name not in metrics._open:
+            metrics._open.add(self.name)
+            self.metrics = metrics
+            self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.metrics is not None:
+            self.metrics.add_time(self.name, time.perf_counter() - self.started)
+            self.metrics._open.discard(self.name)
+            self.metrics = None
+
+
+def _record_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.add_query(sql, time.perf_counter() - started)
+
+
+def _install(connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def install_query_recorder():
+    """
+    Time queries on every database connection, including ones opened
+    later (connections are per thread, and async views query from worker
+    threads). Queries outside a request cost one ContextVar lookup.
+    """
+    connection_created.connect(_install, dispatch_uid='api.instrumentation')
+    for connection in connections.all(initialized_only=True):
+        _install(connection)
+
+
+def _is_staff(request):
+    # Don't force the lazy session user just to decide on a header
+    user = request.__dict__.get('user')
+    if isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+        return False
+    return bool(getattr(user, 'is_staff', False))
+
+
+class RequestMetricsMiddleware:
+    """
+    Place near the top of MIDDLEWARE so the total covers the other middleware.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.threshold = getattr(settings, 'SLOW_REQUEST_THRESHOLD_MS', DEFAULT_SLOW_REQUEST_THRESHOLD_MS)
+        self.top = getattr(settings, 'SLOW_REQUEST_TOP_QUERIES', DEFAULT_SLOW_REQUEST_TOP_QUERIES)
+        install_query_recorder()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.finish(request, response, metrics)
+        return response
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.finish(request, response, metrics)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.view_started = time.perf_counter()
+
+    def finish(self, request, response, metrics):
+        now = time.perf_counter()
+        total_ms = (now - metrics.started) * 1000
+        view_ms = (now - metrics.view_started) * 1000 if metrics.view_started is not None else None
+
+        if settings.DEBUG or _is_staff(request):
+            response['Server-Timing'] = self.server_timing(metrics, total_ms, view_ms)
+
+        if self.threshold is not None and total_ms >= self.threshold:
+            entry = {
+                'method': request.method,
+                'path': request.path,
+                'status': response.status_code,
+                'total_ms': round(total_ms, 2),
+                'view_ms': round(view_ms, 2) if view_ms is not None else None,
+                'db_ms': round(metrics.db_time * 1000, 2),
+                'queries': metrics.query_count,
+                **{f'{name}_ms': round(value * 1000, 2) for name, value in metrics.sections.items()},
+                'top_queries': metrics.top_queries(self.top),
+            }
+            logger.warning(json.dumps(entry), extra={'request_metrics': entry})
+
+    def server_timing(self, metrics, total_ms, view_ms):
+        parts = [f'db;dur={metrics.db_time * 1000:.2f};desc="{metrics.query_count} queries"']
+        parts += [f'{name};dur={value * 1000:.2f}' for name, value in metrics.sections.items()]
+        if view_ms is not None:
+            parts.append(f'view;dur={view_ms:.2f}')
+        parts.append(f'total;dur={total_ms:.2f}')
+        return ', '.join(parts)
@@ -0,0 +1,247 @@
+"""
+Bulk invite-code import from CSV / JSONL.
+
+Rows are processed in fixed-size batches: each batch is validated and
+de-duplicated against the database with two `__in` queries, given
+collision-free MILANI-NAME codes, then inserted in one statement
+(`bulk_create`, or `COPY` on PostgreSQL). Duplicates are reported per row
+instead of failing the import.
+"""
+import csv
+import io
+import json
+import re
+import secrets
+import unicodedata
+from itertools import islice
+
+from django.contrib.auth.models import BaseUserManager
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from .models import InviteCode
+
+CODE_PREFIX = 'MILANI-'
+# No 0/O/1/I so codes read back unambiguously
+SUFFIX_ALPHABET = 'ABCDEFGHJKLMNPQRSTUVWXYZ23456789'
+DEFAULT_BATCH_SIZE = 1000
+MAX_CODE_ATTEMPTS = 10
+
+FORMATS = ('csv', 'jsonl')
+
+
+def code_base(first_name):
+    """
+    'Sarah-Jane' -> 'MILANI-SARAHJANE'
+    """
+    ascii_name = unicodedata.normalize('NFKD', first_name).encode('ascii', 'ignore').decode()
+    name = re.sub(r'[^A-Z0-9]', '', ascii_name.upper())[:30]
+    return CODE_PREFIX + (name or 'CREATOR')
+
+
+def _with_suffix(base):
+    return base + '-' + ''.join(secrets.choice(SUFFIX_ALPHABET) for _ in range(4))
+
+
+def guess_format(filename):
+    return 'jsonl' if filename.lower().endswith(('.jsonl', '.ndjson', '.json')) else 'csv'
+
+
+def read_rows(stream, fmt):
+    """
+    Yield (line_number, row_dict) from a CSV (with header) or JSONL text stream.
+    Unparseable JSONL lines yield None as the row.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+    elif fmt == 'jsonl':
+        for line_number, line in enumerate(stream, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                row = None
+            yield line_number, row if isinstance(row, dict) else None
+    else:
+        raise ValueError(f'Unsupported format: {fmt}')
+
+
+def import_invites(rows, tier=None, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Import (line_number, row) pairs and return a report dict:
+    {'created': int, 'duplicates': [...], 'errors': [...]}.
+    """
+    report = {'created': 0, 'duplicates': [], 'errors': []}
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        pending = _prepare_batch(batch, tier, report)
+        if pending:
+            report['created'] += _insert_batch(pending, report)
+    return report
+
+
+def _text(row, key):
+    value = row.get(key)
+    if value is None:
+        return ''
+    if not isinstance(value, str):
+        # e.g. a number or object in a JSON upload
+        raise ValidationError(f'{key} must be text.')
+    return value.strip()
+
+
+def _clean_row(row, tier):
+    if not isinstance(row, dict):
+        raise ValidationError('Could not parse row.')
+
+    email = BaseUserManager.normalize_email(_text(row, 'email'))
+    validate_email(email)
+    first_name = _text(row, 'first_name')
+    if not first_name:
+        raise ValidationError('first_name is required.')
+    code = _text(row, 'code').upper()
+    if len(code) > InviteCode._meta.get_field('code').max_length:
+        raise ValidationError('code is too long.')
+
+    return InviteCode(
+        code=code,
+        email=email,
+        first_name=first_name[:100],
+        tier=(_text(row, 'tier') or tier or InviteCode._meta.get_field('tier').default)[:50],
+    )
+
+
+def _prepare_batch(batch, tier, report):
+    """
+    Validate a batch and drop rows that clash on email or explicit code.
+    Returns [(line, InviteCode)] ready to insert, with codes assigned.
+    """
+    cleaned = []
+    for line, row in batch:
+        try:
+            cleaned.append((line, _clean_row(row, tier)))
+        except ValidationError as e:
+            email = row.get('email') if isinstance(row, dict) else None
+            report['errors'].append({'line': line, 'email': email, 'reason': ' '.join(e.messages)})
+
+    existing_emails = set(InviteCode.objects.filter(
+        email__in=[invite.email for _, invite in cleaned]
+    ).values_list('email', flat=True))
+    existing_codes = set(InviteCode.objects.filter(
+        code__in=[invite.code for _, invite in cleaned if invite.code]
+    ).values_list('code', flat=True))
+
+    pending = []
+    seen_emails = set()
+    seen_codes = set()
+    for line, invite in cleaned:
+        if invite.email in existing_emails or invite.email in seen_emails:
+            reason = 'email already invited'
+        elif invite.code and (invite.code in existing_codes or invite.code in seen_codes):
+            reason = 'code already exists'
+        else:
+            seen_emails.add(invite.email)
+            if invite.code:
+                seen_codes.add(invite.code)
+            pending.append((line, invite))
+            continue
+        report['duplicates'].append({'line': line, 'email': invite.email, 'reason': reason})
+
+    _assign_codes([invite for _, invite in pending if not invite.code], seen_codes)
+    return pending
+
+
+def _assign_codes(invites, reserved):
+    """
+    Give each invite a unique MILANI-NAME code, adding a random suffix on
+    collision. Each round costs one query for the whole batch.
+    """
+    for invite in invites:
+        invite.code = code_base(invite.first_name)
+
+    unresolved = invites
+    for _ in range(MAX_CODE_ATTEMPTS):
+        taken = set(InviteCode.objects.filter(
+            code__in=[invite.code for invite in unresolved]
+        ).values_list('code', flat=True))
+
+        retry = []
+        for invite in unresolved:
+            if invite.code in taken or invite.code in reserved:
+                invite.code = _with_suffix(code_base(invite.first_name))
+                retry.append(invite)
+            else:
+                reserved.add(invite.code)
+        if not retry:
+            return
+        unresolved = retry
+
+    raise RuntimeError('Could not generate unique invite codes.')
+
+
+def _insert_batch(pending, report):
+    if connection.vendor == 'postgresql':
+        return _copy_batch(pending, report)
+
+    try:
+        with transaction.atomic():
+            InviteCode.objects.bulk_create([invite for _, invite in pending])
+        return len(pending)
+    except IntegrityError:
+        pass
+
+    # Lost a race with a concurrent import: retry this batch row by row
+    created = 0
+    for line, invite in pending:
+        invite.pk = None
+        try:
+            with transaction.atomic():
+                invite.save(force_insert=True)
+            created += 1
+        except IntegrityError:
+            report['duplicates'].append({'line': line, 'email': invite.email, 'reason': 'code or email already exists'})
+    return created
+
+
+def _copy_batch(pending, report):
+    """
+    PostgreSQL: COPY into a temp table, then one INSERT ... ON CONFLICT DO
+    NOTHING so concurrent duplicates are skipped instead of aborting.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for line, invite in pending:
+        writer.writerow([invite.code, invite.email, invite.first_name, invite.tier, line])
+    buffer.seek(0)
+
+    table = connection.ops.quote_name(InviteCode._meta.db_table)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            'CREATE TEMP TABLE invite_import ('
+            'code varchar(50), email varchar(254), first_name varchar(100), tier varchar(50), line integer'
+            ') ON COMMIT DROP'
+        )
+        cursor.copy_expert(
+            'COPY invite_import (code, email, first_name, tier, line) FROM STDIN WITH (FORMAT csv)',
+            buffer,
+        )
+        cursor.execute(
+            f'INSERT INTO {table} (code, email, first_name, tier, is_used, created_at) '
+            'SELECT code, email, first_name, tier, false, %s FROM invite_import ORDER BY line '
+            'ON CONFLICT DO NOTHING RETURNING email',
+            [timezone.now()],
+        )
+        inserted = {row[0] for row in cursor.fetchall()}
+
+    for line, invite in pending:
+        if invite.email not in inserted:
+            report['duplicates'].append({'line': line, 'email': invite.email, 'reason': 'code or email already exists'})
+    return len(inserted)
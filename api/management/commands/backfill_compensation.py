@@ -0,0 +1,53 @@
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+
+from api.models import Campaign, ContentSubmission, CreatorProfile
+from api.money import parse_amount
+from api.payouts import sync_ledger
+
+
+class Command(BaseCommand):
+    help = (
+        "Parse the compensation strings on campaigns and profiles into their decimal amount columns, "
+        "then record payout ledger entries for approved submissions that have none."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--skip-ledger', action='store_true', help="Only parse the amounts.")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        self._parse(Campaign.objects.all(), 'compensation_rate', 'compensation_amount', batch_size)
+        self._parse(
+            CreatorProfile.objects.exclude(personalized_compensation__isnull=True).exclude(personalized_compensation=''),
+            'personalized_compensation', 'personalized_compensation_amount', batch_size,
+        )
+        if options['skip_ledger']:
+            return
+
+        submission_ids = (
+            ContentSubmission.objects.filter(status='approved', payout__isnull=True).order_by('pk')
+            .values_list('pk', flat=True).iterator(chunk_size=batch_size)
+        )
+        created = 0
+        while batch := list(islice(submission_ids, batch_size)):
+            created += sync_ledger(batch, backfill=True)[0]
+        self.stdout.write(self.style.SUCCESS(f"Recorded {created} payout entries."))
+
+    def _parse(self, queryset, source, target, batch_size):
+        rows = queryset.only('pk', source, target).order_by('pk').iterator(chunk_size=batch_size)
+        parsed, unparsed = 0, []
+        while batch := list(islice(rows, batch_size)):
+            for row in batch:
+                setattr(row, target, parse_amount(getattr(row, source)))
+                if getattr(row, target) is None:
+                    unparsed.append(getattr(row, source))
+            queryset.model.objects.bulk_update(batch, [target])
+            parsed += len(batch)
+
+        label = queryset.model._meta.verbose_name_plural
+        self.stdout.write(f"Parsed {source} on {parsed - len(unparsed)} of {parsed} {label}.")
+        for value in sorted(set(unparsed))[:20]:
+            self.stderr.write(f"  Couldn't parse {value!r}")
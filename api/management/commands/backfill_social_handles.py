@@ -0,0 +1,23 @@
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+
+from api.models import CreatorProfile
+from api.social import sync_handles
+
+
+class Command(BaseCommand):
+    help = "Rebuild the normalized SocialHandle rows from every profile's social_links (backfill / repair)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        profiles = CreatorProfile.objects.order_by('pk').values_list('creator_id', 'social_links').iterator(
+            chunk_size=options['batch_size']
+        )
+        total = 0
+        while batch := dict(islice(profiles, options['batch_size'])):
+            sync_handles(batch)
+            total += len(batch)
+        self.stdout.write(self.style.SUCCESS(f"Synced social handles for {total} profiles."))
@@ -0,0 +1,290 @@
+import base64
+import json
+import platform
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from api import urls as api_urls
+from api.benchmarking import QueryCounter, auth_header, benchmark_database, sample_jpeg, seed
+from api.models import Campaign, Creator, CreatorProfile, InviteCode
+from api.uploads import open_session, sign_chunk
+
+BENCH_PASSWORD = 'bench-password'
+UPLOAD_BYTES = 256 * 1024
+# Throttles stay on (their cost is part of the measurement) but never trigger
+UNLIMITED = '1000000/min'
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile of a sorted list.
+    """
+    if not values:
+        return None
+    index = max(0, min(len(values) - 1, round(pct / 100 * len(values) + 0.5) - 1))
+    return values[index]
+
+
+class Context:
+    """
+    Seeded objects the route plans draw from.
+    """
+
+    def __init__(self, users, iterations, blob_kb):
+        self.users = users
+        self.headers = [auth_header(user) for user in users]
+        staff = Creator.objects.create_superuser('staff@bench.test', 'bench-staff', BENCH_PASSWORD)
+        self.staff_header = auth_header(staff)
+        self.campaign_ids = list(Campaign.objects.values_list('pk', flat=True))
+        self.blob_keys = list(
+            CreatorProfile.objects.exclude(id_front_blob=None).values_list('id_front_blob', flat=True)
+        )
+
+        image = sample_jpeg(blob_kb or 100)
+        self.image_data_uri = 'data:image/jpeg;base64,' + base64.b64encode(image).decode()
+
+        # Separate invite pools so signups never consume the codes being verified
+        total = iterations + 10
+        InviteCode.objects.bulk_create(
+            [InviteCode(code=f'MILANI-CHECK{i}', email=f'check{i}@bench.test', first_name='Check') for i in range(total)]
+            + [InviteCode(code=f'MILANI-JOIN{i}', email=f'join{i}@bench.test', first_name='Join') for i in range(total)]
+        )
+
+        # One single-chunk upload session per request, so every
+        # detail / chunk / complete call has its own session to work on
+        self.upload_body = bytes(UPLOAD_BYTES)
+        self.uploads = [
+            open_session(
+                self.user(i), 'bench.mp4', UPLOAD_BYTES, 'video/mp4',
+                campaign=self.campaign_ids[0] if self.campaign_ids else None,
+            )
+            for i in range(total)
+        ]
+
+    def user(self, i):
+        return self.users[i % len(self.users)]
+
+    def header(self, i):
+        return self.headers[i % len(self.headers)]
+
+
+def _json(data):
+    return {'data': json.dumps(data), 'content_type': 'application/json'}
+
+
+# (url name, method, request builder). Builders return Client kwargs.
+ROUTE_PLANS = [
+    ('routes', 'GET', lambda ctx, i: {}),
+    ('verify_invite', 'POST', lambda ctx, i: _json({'code': f'MILANI-CHECK{i % 10}'})),
+    ('token_obtain_pair', 'POST', lambda ctx, i: _json({'email': ctx.user(i).email, 'password': BENCH_PASSWORD})),
+    ('signup', 'POST', lambda ctx, i: _json({
+        'code': f'MILANI-JOIN{i}', 'email': f'join{i}@bench.test',
+        'username': f'joiner{i}', 'password': 'Bench-passw0rd!',
+    })),
+    ('current_user', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.header(i)}),
+    ('throttle_stats', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.staff_header}),
+    ('invite_import', 'POST', lambda ctx, i: {
+        'HTTP_AUTHORIZATION': ctx.staff_header,
+        'data': {'file': SimpleUploadedFile('invites.csv', (
+            'email,first_name\n' + ''.join(f'import{i}-{n}@bench.test,Guest{n}\n' for n in range(50))
+        ).encode())},
+    }),
+    ('dashboard', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.header(i)}),
+    ('profile', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.header(i)}),
+    ('profile', 'PATCH', lambda ctx, i: {
+        'HTTP_AUTHORIZATION': ctx.header(i), **_json({'bio': f'Updated bio {i}'}),
+    }),
+    ('profile_verify', 'POST', lambda ctx, i: {
+        'HTTP_AUTHORIZATION': ctx.header(i),
+        **_json({'id_front': ctx.image_data_uri, 'id_back': ctx.image_data_uri, 'selfie': ctx.image_data_uri}),
+    }),
+    ('verification_thumbnail', 'GET', lambda ctx, i: {
+        'HTTP_AUTHORIZATION': ctx.staff_header, 'args': [ctx.blob_keys[i % len(ctx.blob_keys)]],
+    }),
+    ('creator_search', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.staff_header, 'data': {'q': f'creator{i}'}}),
+    ('social_handles', 'GET', lambda ctx, i: {
+        'HTTP_AUTHORIZATION': ctx.staff_header, 'data': {'handle': f'@{ctx.user(i).username}', 'platform': 'tiktok'},
+    }),
+    ('social_handle_stats', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.staff_header}),
+    ('campaigns', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.header(i)}),
+    ('campaign_progress', 'GET', lambda ctx, i: {
+        'HTTP_AUTHORIZATION': ctx.staff_header, 'args': [ctx.campaign_ids[i % len(ctx.campaign_ids)]],
+    }),
+    ('submissions', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.header(i)}),
+    ('submissions', 'POST', lambda ctx, i: {
+        'HTTP_AUTHORIZATION': ctx.header(i), **_json({
+            'creator': ctx.user(i).pk, 'campaign': ctx.campaign_ids[0] if ctx.campaign_ids else None,
+            'content_url': f'https://cdn.bench.test/new/{i}.mp4', 'platform': 'tiktok',
+        }),
+    }),
+    ('submission_review', 'POST', lambda ctx, i: {
+        'HTTP_AUTHORIZATION': ctx.staff_header,
+        **_json({'ids': list(range(1 + i * 200, 201 + i * 200)), 'status': 'approved', 'feedback': 'Looks great'}),
+    }),
+    ('payout_report', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.staff_header}),
+    ('export', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.staff_header, 'args': ['submissions', 'csv']}),
+    ('uploads', 'POST', lambda ctx, i: {
+        'HTTP_AUTHORIZATION': ctx.header(i),
+        **_json({'filename': 'clip.mp4', 'size': 50 * 1024 ** 2, 'content_type': 'video/mp4'}),
+    }),
+    ('upload_detail', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.header(i), 'args': [ctx.uploads[i].pk]}),
+    ('upload_chunk', 'PUT', lambda ctx, i: {
+        'args': [sign_chunk(ctx.uploads[i], 0)], 'data': ctx.upload_body, 'content_type': 'application/octet-stream',
+    }),
+    ('upload_complete', 'POST', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.header(i), 'args': [ctx.uploads[i].pk]}),
+    ('async_current_user', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.header(i)}),
+    ('async_profile', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.header(i)}),
+    ('async_campaigns', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.header(i)}),
+    ('async_submissions', 'GET', lambda ctx, i: {'HTTP_AUTHORIZATION': ctx.header(i)}),
+]
+
+# Plans that can't run without these Context fixtures (e.g. --blob-kb 0 seeds no blobs)
+PLAN_FIXTURES = {
+    'verification_thumbnail': 'blob_keys',
+    'campaign_progress': 'campaign_ids',
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a throwaway database and drive every route in api/urls.py through the "
+        "test client, reporting p50/p95/p99 latency, query counts and response bytes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--creators', type=int, default=200)
+        parser.add_argument('--campaigns', type=int, default=5)
+        parser.add_argument('--submissions', type=int, default=5000)
+        parser.add_argument('--blob-kb', type=int, default=150, help="Size of each seeded verification image.")
+        parser.add_argument('--iterations', type=int, default=50, help="Measured requests per route.")
+        parser.add_argument('--warmup', type=int, default=3)
+        parser.add_argument('--only', nargs='*', help="Only run these URL names.")
+        parser.add_argument('--output', help="Write results as JSON to this file.")
+        parser.add_argument('--compare', help="A previous --output file to diff against.")
+
+    def handle(self, *args, **options):
+        if options['iterations'] < 1:
+            raise CommandError("--iterations must be at least 1.")
+        if options['warmup'] < 0:
+            raise CommandError("--warmup can't be negative.")
+
+        rest_framework = dict(settings.REST_FRAMEWORK)
+        rest_framework['DEFAULT_THROTTLE_RATES'] = {
+            scope: UNLIMITED for scope in settings.REST_FRAMEWORK.get('DEFAULT_THROTTLE_RATES', {})
+        }
+
+        with tempfile.TemporaryDirectory() as media_root, \
+                override_settings(DEBUG=False, ALLOWED_HOSTS=['*'], REST_FRAMEWORK=rest_framework,
+                                  SLOW_REQUEST_THRESHOLD_MS=None,
+                                  BLOB_STORE={'OPTIONS': {'root': f'{media_root}/blobs'}},
+                                  THUMBNAIL_ROOT=f'{media_root}/thumbnails',
+                                  UPLOADS={'OPTIONS': {'root': f'{media_root}/uploads'}}), \
+                benchmark_database():
+            started = time.perf_counter()
+            users = seed(
+                creators=options['creators'], campaigns=options['campaigns'],
+                submissions=options['submissions'], blob_kb=options['blob_kb'],
+            )
+            warmup, iterations = options['warmup'], options['iterations']
+            ctx = Context(users, warmup + iterations, options['blob_kb'])
+            self.stderr.write(f"Seeded in {time.perf_counter() - started:.1f}s")
+
+            self._warn_uncovered()
+            results = []
+            for name, method, build in ROUTE_PLANS:
+                if options['only'] and name not in options['only']:
+                    continue
+                fixture = PLAN_FIXTURES.get(name)
+                if fixture and not getattr(ctx, fixture):
+                    self.stderr.write(self.style.WARNING(f"Skipping '{name}' {method}: nothing seeded for {fixture}"))
+                    continue
+                results.append(self._run_route(ctx, name, method, build, warmup, iterations))
+
+        report = {
+            'meta': {
+                'timestamp': timezone.now().isoformat(),
+                'python': platform.python_version(),
+                'database': connection.vendor,
+                **{key: options[key] for key in ('creators', 'campaigns', 'submissions', 'blob_kb', 'iterations')},
+            },
+            'endpoints': results,
+        }
+        self._print(results, self._load(options['compare']))
+        if options['output']:
+            with open(options['output'], 'w') as out:
+                json.dump(report, out, indent=2)
+
+    def _warn_uncovered(self):
+        planned = {name for name, _, _ in ROUTE_PLANS}
+        for pattern in api_urls.urlpatterns:
+            if pattern.name and pattern.name not in planned:
+                self.stderr.write(self.style.WARNING(f"No benchmark plan for route '{pattern.name}'"))
+
+    def _run_route(self, ctx, name, method, build, warmup, iterations):
+        client = Client()
+        call = getattr(client, method.lower())
+        timings, queries, sizes, errors = [], [], [], 0
+
+        for i in range(warmup + iterations):
+            kwargs = build(ctx, i)
+            path = reverse(name, args=kwargs.pop('args', None) or None)
+
+            with QueryCounter() as captured:
+                started = time.perf_counter()
+                response = call(path, **kwargs)
+                body = b''.join(response.streaming_content) if response.streaming else response.content
+                elapsed = time.perf_counter() - started
+
+            if i < warmup:
+                continue
+            timings.append(elapsed * 1000)
+            queries.append(captured.count)
+            sizes.append(len(body))
+            if response.status_code >= 400:
+                errors += 1
+
+        timings.sort()
+        return {
+            'route': name,
+            'method': method,
+            'requests': iterations,
+            'errors': errors,
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p95_ms': round(percentile(timings, 95), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+            'queries_avg': round(sum(queries) / len(queries), 2),
+            'queries_max': max(queries),
+            'bytes_avg': round(sum(sizes) / len(sizes)),
+        }
+
+    def _load(self, path):
+        if not path:
+            return {}
+        with open(path) as f:
+            previous = json.load(f)
+        return {(row['route'], row['method']): row for row in previous['endpoints']}
+
+    def _print(self, results, previous):
+        self.stdout.write(
+            f"{'route':<24} {'method':<6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+            f"{'queries':>8} {'bytes':>9} {'errors':>6}"
+        )
+        for row in results:
+            line = (
+                f"{row['route']:<24} {row['method']:<6} {row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} "
+                f"{row['p99_ms']:>9.2f} {row['queries_avg']:>8.1f} {row['bytes_avg']:>9} {row['errors']:>6}"
+            )
+            before = previous.get((row['route'], row['method']))
+            if before:
+                delta = (row['p50_ms'] - before['p50_ms']) / before['p50_ms'] * 100 if before['p50_ms'] else 0
+                line += f"   p50 {delta:+.0f}%, queries {row['queries_avg'] - before['queries_avg']:+.1f}"
+            self.stdout.write(line)
@@ -0,0 +1,67 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.benchmarking import benchmark_database, seed
+from api.models import Campaign, ContentSubmission
+from api.serializers import CampaignSerializer, ContentSubmissionSerializer, campaign_rows, submission_rows
+
+PLANS = (
+    ('campaigns', CampaignSerializer, campaign_rows, lambda: Campaign.objects.order_by('pk')),
+    ('submissions', ContentSubmissionSerializer, submission_rows,
+     lambda: ContentSubmission.objects.select_related('campaign').order_by('pk')),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Per-row serialization cost of the ModelSerializers vs their .values() "
+        "fast path, in-process against a throwaway database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--creators', type=int, default=50)
+        parser.add_argument('--campaigns', type=int, default=200)
+        parser.add_argument('--submissions', type=int, default=5000)
+        parser.add_argument('--repeat', type=int, default=5, help="Best of this many passes.")
+        parser.add_argument('--json', help="Write results to this file.")
+
+    def handle(self, *args, **options):
+        results = []
+        with benchmark_database():
+            seed(creators=options['creators'], campaigns=options['campaigns'], submissions=options['submissions'])
+            for name, serializer_class, fast, queryset in PLANS:
+                # Fetch first: only the serializing is timed
+                instances = list(queryset())
+                rows = list(fast.values(queryset()))
+                drf = self._best(lambda: serializer_class(instances, many=True).data, options['repeat'])
+                rendered = self._best(lambda: fast.serialize(rows), options['repeat'])
+                results.append({
+                    'serializer': name,
+                    'rows': len(rows),
+                    'drf_us_per_row': drf / len(rows) * 1e6,
+                    'fast_us_per_row': rendered / len(rows) * 1e6,
+                    'speedup': drf / rendered,
+                })
+
+        self.stdout.write(f"{'serializer':<12} {'rows':>6} {'drf µs/row':>11} {'fast µs/row':>12} {'speedup':>8}")
+        for row in results:
+            self.stdout.write(
+                f"{row['serializer']:<12} {row['rows']:>6} {row['drf_us_per_row']:>11.2f} "
+                f"{row['fast_us_per_row']:>12.2f} {row['speedup']:>7.1f}x"
+            )
+
+        if options['json']:
+            with open(options['json'], 'w') as out:
+                json.dump({'options': {k: options[k] for k in (
+                    'creators', 'campaigns', 'submissions', 'repeat'
+                )}, 'results': results}, out, indent=2)
+
+    def _best(self, work, repeat):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            work()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand
+from django.core.wsgi import get_wsgi_application
+from django.test.utils import override_settings
+
+from api.benchmarking import (
+    asgi_get,
+    auth_header,
+    benchmark_database,
+    seed,
+    simulated_db_latency,
+    wsgi_get
+)
+
+ENDPOINTS = ('auth/me/', 'profile/', 'campaigns/', 'submissions/')
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare throughput of the sync (WSGI) and async (ASGI) read endpoints "
+        "at a fixed worker count, in-process against a throwaway database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4, help="Sync threads / async event loops.")
+        parser.add_argument('--concurrency', type=int, default=25, help="In-flight requests per async worker.")
+        parser.add_argument('--requests', type=int, default=400, help="Requests per endpoint per stack.")
+        parser.add_argument('--db-latency-ms', type=float, default=5.0, help="Simulated per-query latency.")
+        parser.add_argument('--creators', type=int, default=50)
+        parser.add_argument('--submissions', type=int, default=1000)
+        parser.add_argument('--json', help="Write results to this file.")
+
+    def handle(self, *args, **options):
+        with override_settings(DEBUG=False, ALLOWED_HOSTS=['*']), benchmark_database():
+            users = seed(creators=options['creators'], submissions=options['submissions'])
+            headers = [auth_header(user) for user in users]
+            wsgi_app = get_wsgi_application()
+            asgi_app = get_asgi_application()
+
+            results = []
+            with simulated_db_latency(options['db_latency_ms'] / 1000):
+                for endpoint in ENDPOINTS:
+                    sync_path = f'/api/{endpoint}'
+                    async_path = f'/api/async/{endpoint}'
+                    results.append(self._run_sync(wsgi_app, sync_path, headers, options))
+                    results.append(self._run_async(asgi_app, async_path, headers, options))
+
+        self.stdout.write(f"{'stack':<6} {'endpoint':<28} {'req/s':>9} {'errors':>7}")
+        for row in results:
+            self.stdout.write(f"{row['stack']:<6} {row['path']:<28} {row['rps']:>9.1f} {row['errors']:>7}")
+
+        if options['json']:
+            with open(options['json'], 'w') as out:
+                json.dump({'options': {k: options[k] for k in (
+                    'workers', 'concurrency', 'requests', 'db_latency_ms', 'creators', 'submissions'
+                )}, 'results': results}, out, indent=2)
+
+    def _run_sync(self, app, path, headers, options):
+        def one(_):
+            return wsgi_get(app, path, random.choice(headers))[0]
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['workers']) as pool:
+            statuses = list(pool.map(one, range(options['requests'])))
+        return self._result('sync', path, statuses, time.perf_counter() - started)
+
+    def _run_async(self, app, path, headers, options):
+        workers = options['workers']
+        per_worker = [options['requests'] // workers + (i < options['requests'] % workers) for i in range(workers)]
+        statuses = []
+        lock = threading.Lock()
+
+        async def loop(count):
+            limit = asyncio.Semaphore(options['concurrency'])
+
+            async def one():
+                async with limit:
+                    return (await asgi_get(app, path, random.choice(headers)))[0]
+
+            done = await asyncio.gather(*(one() for _ in range(count)))
+            with lock:
+                statuses.extend(done)
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=asyncio.run, args=(loop(count),)) for count in per_worker]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self._result('async', path, statuses, time.perf_counter() - started)
+
+    def _result(self, stack, path, statuses, elapsed):
+        return {
+            'stack': stack,
+            'path': path,
+            'requests': len(statuses),
+            'errors': sum(1 for code in statuses if code != 200),
+            'seconds': round(elapsed, 3),
+            'rps': len(statuses) / elapsed if elapsed else 0.0,
+        }
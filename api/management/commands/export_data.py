@@ -0,0 +1,40 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.exports import DEFAULT_CHUNK_SIZE, EXPORTS, FORMATS, export_rows, stream_export
+from api.routers import any_replica
+
+
+class Command(BaseCommand):
+    help = "Stream creators, profiles, submissions or invites to CSV / JSONL with constant memory."
+
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=sorted(EXPORTS))
+        parser.add_argument('--format', choices=FORMATS, default='csv')
+        parser.add_argument('--campaign', help="Campaign id.")
+        parser.add_argument('--status', help="Submission/verification status, or used/available for invites.")
+        parser.add_argument('--since', help="ISO date or datetime (inclusive).")
+        parser.add_argument('--until', help="ISO date (whole day included) or datetime.")
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+        parser.add_argument('--output', help="File to write; defaults to stdout.")
+        parser.add_argument('--database', help="Database alias to read (default: a replica if configured).")
+
+    def handle(self, *args, **options):
+        try:
+            columns, rows = export_rows(
+                options['kind'], campaign=options['campaign'], status=options['status'],
+                since=options['since'], until=options['until'], chunk_size=options['chunk_size'],
+                using=options['database'] or any_replica(),
+            )
+            content = stream_export(options['format'], columns, rows)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        out = open(options['output'], 'w', newline='', encoding='utf-8') if options['output'] else sys.stdout
+        try:
+            for line in content:
+                out.write(line)
+        finally:
+            if out is not sys.stdout:
+                out.close()
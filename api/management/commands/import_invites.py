@@ -0,0 +1,37 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.invites import DEFAULT_BATCH_SIZE, FORMATS, guess_format, import_invites, read_rows
+
+
+class Command(BaseCommand):
+    help = "Bulk-import invite codes from a CSV (email, first_name[, tier, code]) or JSONL file."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=FORMATS, help="Defaults to the file extension.")
+        parser.add_argument('--tier', help="Tier for rows that don't set one.")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--report', help="Write the full duplicate/error report to this JSON file.")
+
+    def handle(self, *args, **options):
+        fmt = options['format'] or guess_format(options['path'])
+        try:
+            with open(options['path'], newline='', encoding='utf-8-sig') as stream:
+                report = import_invites(
+                    read_rows(stream, fmt), tier=options['tier'], batch_size=options['batch_size']
+                )
+        except OSError as e:
+            raise CommandError(str(e))
+
+        if options['report']:
+            with open(options['report'], 'w') as out:
+                json.dump(report, out, indent=2)
+
+        for problem in report['errors'][:20]:
+            self.stderr.write(f"line {problem['line']}: {problem['reason']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {report['created']} invites, "
+            f"{len(report['duplicates'])} duplicates skipped, {len(report['errors'])} invalid rows."
+        ))
@@ -0,0 +1,101 @@
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+from django.core.management.base import BaseCommand
+
+from api.media import claim_jobs, complete_job, fail_job, queue_depth, requeue_stale
+from api.workers import init_worker_process, run_media_job
+
+
+class Command(BaseCommand):
+    help = (
+        "Process queued media jobs (metadata + poster frames) in a pool of worker processes. "
+        "Only claims as many jobs as the pool has room for."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=os.cpu_count() or 2)
+        parser.add_argument('--max-in-flight', type=int, help="Claimed but unfinished jobs (default 2x processes).")
+        parser.add_argument('--poll', type=float, default=2.0, help="Seconds between polls when idle.")
+        parser.add_argument('--stale-after', type=int, default=15 * 60, help="Requeue jobs running this long.")
+        parser.add_argument('--once', action='store_true', help="Exit when the queue is empty.")
+
+    def handle(self, *args, **options):
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        processes = options['processes']
+        max_in_flight = options['max_in_flight'] or processes * 2
+        worker = f'{socket.gethostname()}:{os.getpid()}'
+        self.stdout.write(f"Worker {worker}: {processes} processes, up to {max_in_flight} jobs in flight")
+
+        in_flight = {}
+        stats = {'done': 0, 'retried': 0, 'failed': 0}
+        next_stale_check = 0
+        # Spawn, not fork: children must not share the parent's DB connections
+        context = multiprocessing.get_context('spawn')
+        pool = ProcessPoolExecutor(max_workers=processes, mp_context=context, initializer=init_worker_process)
+        try:
+            while not (self.stopping and not in_flight):
+                if not self.stopping:
+                    if time.monotonic() >= next_stale_check:
+                        requeued, failed = requeue_stale(options['stale_after'])
+                        if requeued or failed:
+                            self.stderr.write(f"Requeued {requeued} stale jobs, failed {failed}")
+                        next_stale_check = time.monotonic() + 60
+
+                    # Backpressure: never claim more than the pool can work on
+                    for job in claim_jobs(worker, max_in_flight - len(in_flight)):
+                        in_flight[pool.submit(run_media_job, job.submission_id)] = job
+
+                if not in_flight:
+                    if options['once']:
+                        break
+                    time.sleep(options['poll'])
+                    continue
+
+                finished, _ = wait(in_flight, timeout=options['poll'], return_when=FIRST_COMPLETED)
+                broken = False
+                for future in finished:
+                    job = in_flight.pop(future)
+                    try:
+                        future.result()
+                    except BrokenProcessPool as e:
+                        # A child died (e.g. OOM on a huge file); retry its jobs on a fresh pool
+                        fail_job(job, e)
+                        stats['retried'] += 1
+                        broken = True
+                    except Exception as e:
+                        retrying = fail_job(job, e)
+                        stats['retried' if retrying else 'failed'] += 1
+                        self.stderr.write(f"Job {job.pk} (submission {job.submission_id}) failed: {e}")
+                    else:
+                        complete_job(job)
+                        stats['done'] += 1
+
+                if broken:
+                    for job in in_flight.values():
+                        fail_job(job, 'Worker process died.')
+                        stats['retried'] += 1
+                    in_flight.clear()
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = ProcessPoolExecutor(
+                        max_workers=processes, mp_context=context, initializer=init_worker_process
+                    )
+        finally:
+            pool.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Processed {stats['done']}, retrying {stats['retried']}, failed {stats['failed']}; "
+            f"{queue_depth()} still queued."
+        ))
+
+    def _stop(self, signum, frame):
+        # Finish what's in flight, claim nothing new
+        self.stopping = True
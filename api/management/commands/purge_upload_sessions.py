@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from api.uploads import purge_expired_sessions
+
+
+class Command(BaseCommand):
+    help = "Delete expired upload sessions and their chunks. Run it periodically (e.g. hourly from cron)."
+
+    def handle(self, *args, **options):
+        purged = purge_expired_sessions()
+        self.stdout.write(self.style.SUCCESS(f"Purged {purged} expired upload sessions."))
@@ -0,0 +1,20 @@
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+
+from api.dashboard import rebuild_snapshots
+from api.models import Creator
+
+
+class Command(BaseCommand):
+    help = "Rebuild every creator's dashboard snapshot from the source tables (backfill / repair)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        creators = Creator.objects.with_profile().order_by('pk').iterator(chunk_size=options['batch_size'])
+        total = 0
+        while batch := list(islice(creators, options['batch_size'])):
+            total += rebuild_snapshots(batch)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {total} dashboard snapshots."))
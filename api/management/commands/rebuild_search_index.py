@@ -0,0 +1,22 @@
+from itertools import islice
+
+from django.core.management.base import BaseCommand
+
+from api.models import Creator
+from api.search import index_creators
+
+
+class Command(BaseCommand):
+    help = "Rebuild every creator's search document from the source tables (backfill / repair)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        creator_ids = Creator.objects.order_by('pk').values_list('pk', flat=True).iterator(
+            chunk_size=options['batch_size']
+        )
+        total = 0
+        while batch := list(islice(creator_ids, options['batch_size'])):
+            total += index_creators(batch)
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} creators."))
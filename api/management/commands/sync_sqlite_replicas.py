@@ -0,0 +1,32 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+
+class Command(BaseCommand):
+    help = (
+        "Local development only: copy the SQLite primary onto each SQLite replica "
+        "(one-shot 'replication' for trying out replica routing)."
+    )
+
+    def handle(self, *args, **options):
+        primary = settings.DATABASES[DEFAULT_DB_ALIAS]
+        replicas = [settings.DATABASES[alias] for alias in settings.DATABASE_REPLICAS]
+        if not replicas:
+            raise CommandError("No replicas configured; set REPLICA_DATABASE_URLS.")
+        if any(db['ENGINE'] != 'django.db.backends.sqlite3' for db in [primary, *replicas]):
+            raise CommandError("Only SQLite primaries and replicas can be synced this way.")
+
+        source = sqlite3.connect(primary['NAME'])
+        try:
+            for alias, replica in zip(settings.DATABASE_REPLICAS, replicas):
+                target = sqlite3.connect(replica['NAME'])
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+                self.stdout.write(f"Copied {primary['NAME']} to {alias} ({replica['NAME']})")
+        finally:
+            source.close()
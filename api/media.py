@@ -0,0 +1,241 @@
+"""
+Background media processing for content submissions.
+
+Every new submission gets a MediaJob (queued on commit, see models.py).
+`manage.py process_media` claims ready jobs in small batches and runs them
+in a process pool. The worker only claims what it has room for, so a
+backlog waits in the table rather than in memory. Each job records the
+size, duration and resolution of the uploaded file and stores a poster
+JPEG in the blob store, so review pages show a thumbnail instead of
+loading the raw video.
+
+Failed jobs are retried with exponential backoff up to max_attempts.
+Jobs left `running` by a dead worker are requeued once they go stale.
+"""
+import datetime
+import io
+import json
+import logging
+import shutil
+import struct
+import subprocess
+
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from .blobstore import get_blob_store
+from .models import ContentSubmission, MediaJob
+from .thumbnails import THUMBNAIL_SIZES, get_thumbnail
+from .uploads import get_upload_backend
+
+logger = logging.getLogger(__name__)
+
+POSTER_SIZE = 600
+RETRY_BASE_DELAY = 30  # seconds, doubled per attempt
+RETRY_MAX_DELAY = 60 * 60
+TOOL_TIMEOUT = 120
+
+
+# --- Queue ------------------------------------------------------------------
+
+def claim_jobs(worker, limit):
+    """
+    Mark up to `limit` ready jobs as running for `worker` and return them.
+    Uses SKIP LOCKED where the database has it, so workers don't block
+    each other. The conditional UPDATE makes claiming safe without it.
+    """
+    if limit <= 0:
+        return []
+    now = timezone.now()
+    with transaction.atomic():
+        ready = MediaJob.objects.filter(status='queued', run_after__lte=now).order_by('run_after', 'pk')
+        if connection.features.has_select_for_update_skip_locked:
+            ready = ready.select_for_update(skip_locked=True)
+        ids = list(ready.values_list('pk', flat=True)[:limit])
+        if not ids:
+            return []
+        MediaJob.objects.filter(pk__in=ids, status='queued').update(
+            status='running', locked_by=worker, locked_at=now, attempts=F('attempts') + 1
+        )
+    return list(MediaJob.objects.filter(pk__in=ids, status='running', locked_by=worker, locked_at=now))
+
+
+def complete_job(job):
+    MediaJob.objects.filter(pk=job.pk).update(status='done', last_error='', finished_at=timezone.now())
+
+
+def fail_job(job, error):
+    """
+    Schedule a retry with exponential backoff, or give up after max_attempts.
+    """
+    message = str(error)[:2000] or error.__class__.__name__
+    if job.attempts >= job.max_attempts:
+        MediaJob.objects.filter(pk=job.pk).update(status='failed', last_error=message, finished_at=timezone.now())
+        return False
+    delay = min(RETRY_BASE_DELAY * 2 ** (job.attempts - 1), RETRY_MAX_DELAY)
+    MediaJob.objects.filter(pk=job.pk).update(
+        status='queued', last_error=message, locked_by='',
+        run_after=timezone.now() + datetime.timedelta(seconds=delay),
+    )
+    return True
+
+
+def requeue_stale(stale_after):
+    """
+    Requeue jobs whose worker died mid-run (or fail them when out of attempts).
+    """
+    cutoff = timezone.now() - datetime.timedelta(seconds=stale_after)
+    stale = MediaJob.objects.filter(status='running', locked_at__lt=cutoff)
+    failed = stale.filter(attempts__gte=F('max_attempts')).update(
+        status='failed', last_error='Worker timed out.', finished_at=timezone.now()
+    )
+    requeued = stale.update(status='queued', locked_by='', run_after=timezone.now())
+    return requeued, failed
+
+
+def queue_depth():
+    return MediaJob.objects.filter(status='queued', run_after__lte=timezone.now()).count()
+
+
+# --- Probing ----------------------------------------------------------------
+
+def _mp4_boxes(f, end):
+    while f.tell() + 8 <= end:
+        start = f.tell()
+        size, kind = struct.unpack('>I4s', f.read(8))
+        if size == 1:
+            size = struct.unpack('>Q', f.read(8))[0]
+        elif size == 0:
+            size = end - start
+        if size < 8:
+            return
+        yield kind, f.tell(), start + size
+        f.seek(start + size)
+
+
+def probe_mp4(path):
+    """
+    Duration and display size from an MP4/MOV header, read with seeks so
+    the media data itself is never loaded.
+    """
+    info = {}
+    with open(path, 'rb') as f:
+        f.seek(0, 2)
+        total = f.tell()
+        f.seek(0)
+        for kind, body, end in _mp4_boxes(f, total):
+            if kind != b'moov':
+                continue
+            f.seek(body)
+            for child, child_body, child_end in _mp4_boxes(f, end):
+                if child == b'mvhd':
+                    f.seek(child_body)
+                    version = f.read(4)[0]
+                    if version == 1:
+                        timescale, duration = struct.unpack('>16xIQ', f.read(28))
+                    else:
+                        timescale, duration = struct.unpack('>8xII', f.read(16))
+                    if timescale:
+                        info['duration'] = duration / timescale
+                elif child == b'trak' and 'width' not in info:
+                    f.seek(child_body)
+                    for grandchild, tkhd, _ in _mp4_boxes(f, child_end):
+                        if grandchild == b'tkhd':
+                            f.seek(tkhd)
+                            version = f.read(4)[0]
+                            f.seek(tkhd + (88 if version == 1 else 76))
+                            width, height = struct.unpack('>II', f.read(8))
+                            if width and height:
+                                info['width'], info['height'] = width >> 16, height >> 16
+                            break
+                f.seek(child_end)
+            break
+    return info
+
+
+def probe_ffprobe(path):
+    output = subprocess.run(
+        ['ffprobe', '-v', 'error', '-print_format', 'json', '-show_format', '-show_streams', str(path)],
+        capture_output=True, check=True, timeout=TOOL_TIMEOUT,
+    ).stdout
+    data = json.loads(output)
+    info = {}
+    if data.get('format', {}).get('duration'):
+        info['duration'] = float(data['format']['duration'])
+    video = next((s for s in data.get('streams', []) if s.get('codec_type') == 'video'), None)
+    if video:
+        info['width'], info['height'] = video.get('width'), video.get('height')
+    return info
+
+
+def _jpeg(image):
+    image = ImageOps.exif_transpose(image)
+    image.thumbnail((POSTER_SIZE, POSTER_SIZE))
+    buffer = io.BytesIO()
+    image.convert('RGB').save(buffer, 'JPEG', quality=80)
+    return buffer.getvalue()
+
+
+def video_poster(path):
+    """
+    A frame one second in (or the first frame for shorter clips), as JPEG.
+    Needs ffmpeg; returns None without it.
+    """
+    if not shutil.which('ffmpeg'):
+        return None
+    for offset in ('1', '0'):
+        frame = subprocess.run(
+            ['ffmpeg', '-v', 'error', '-ss', offset, '-i', str(path), '-frames:v', '1',
+             '-f', 'image2pipe', '-vcodec', 'png', 'pipe:1'],
+            capture_output=True, check=True, timeout=TOOL_TIMEOUT,
+        ).stdout
+        if frame:
+            with Image.open(io.BytesIO(frame)) as image:
+                return _jpeg(image)
+    return None
+
+
+def analyse(path, file_type):
+    """
+    (metadata dict, poster JPEG bytes or None) for a local media file.
+    """
+    info = {'size': path.stat().st_size}
+    if file_type == 'image':
+        with Image.open(path) as image:
+            # Before draft(), which makes JPEGs report their downscaled size
+            info['width'], info['height'] = image.size
+            image.draft('RGB', (POSTER_SIZE, POSTER_SIZE))
+            return info, _jpeg(image)
+
+    info.update(probe_ffprobe(path) if shutil.which('ffprobe') else probe_mp4(path))
+    return info, video_poster(path)
+
+
+# --- Jobs ---------------------------------------------------------------------
+
+def process_submission(submission_id):
+    """
+    Run in a worker process. Stores metadata and a poster on the submission.
+    Media that isn't in our upload storage (external links) is marked
+    processed with nothing extracted.
+    """
+    submission = ContentSubmission.objects.filter(pk=submission_id).only('content_url', 'file_type').first()
+    if submission is None:
+        return 'deleted'
+
+    fields = {'media_processed_at': timezone.now()}
+    with get_upload_backend().local_copy(submission.content_url) as path:
+        if path is not None:
+            info, poster = analyse(path, submission.file_type)
+            fields.update({f'media_{name}': value for name, value in info.items()})
+            if poster:
+                key = get_blob_store().save([poster])
+                for size in THUMBNAIL_SIZES:
+                    get_thumbnail(key, size)  # Warm the review-page thumbnails
+                fields['preview_blob'] = key
+
+    # update(), not save(): never overwrite a reviewer's concurrent status edit
+    ContentSubmission.objects.filter(pk=submission_id).update(**fields)
+    return 'processed' if path is not None else 'external'
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.8 on 2026-10-17 19:59
+
+from django.db import migrations, models
+
+IMAGE_TO_BLOB = (
+    ('id_front_image', 'id_front_blob'),
+    ('id_back_image', 'id_back_blob'),
+    ('selfie_image', 'selfie_blob'),
+)
+
+
+def move_images_to_blob_store(apps, schema_editor):
+    from api.blobstore import get_blob_store, store_upload
+
+    CreatorProfile = apps.get_model('api', 'CreatorProfile')
+    db_alias = schema_editor.connection.alias
+    store = get_blob_store()
+    profiles = CreatorProfile.objects.using(db_alias).exclude(
+        id_front_image__isnull=True, id_back_image__isnull=True, selfie_image__isnull=True
+    ).only('pk')
+
+    for pk in profiles.values_list('pk', flat=True).iterator():
+        # Load one profile's images at a time to keep memory flat
+        profile = CreatorProfile.objects.using(db_alias).only(*(old for old, _ in IMAGE_TO_BLOB)).get(pk=pk)
+        updates = {
+            new: store_upload(getattr(profile, old), store=store)
+            for old, new in IMAGE_TO_BLOB
+        }
+        CreatorProfile.objects.using(db_alias).filter(pk=pk).update(**updates)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_invitecode'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='creatorprofile',
+            name='personalized_compensation',
+            field=models.CharField(blank=True, help_text="Overrides default campaign rate (e.g. '$1,500')", max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='creatorprofile',
+            name='personalized_deadline',
+            field=models.DateField(blank=True, help_text='Overrides default campaign deadline', null=True),
+        ),
+        migrations.AddField(
+            model_name='creatorprofile',
+            name='id_front_blob',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='creatorprofile',
+            name='id_back_blob',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='creatorprofile',
+            name='selfie_blob',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.RunPython(move_images_to_blob_store, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='creatorprofile',
+            name='id_front_image',
+        ),
+        migrations.RemoveField(
+            model_name='creatorprofile',
+            name='id_back_image',
+        ),
+        migrations.RemoveField(
+            model_name='creatorprofile',
+            name='selfie_image',
+        ),
+    ]
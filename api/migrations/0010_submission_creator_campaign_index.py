@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-17 20:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_verification_blobs'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contentsubmission',
+            index=models.Index(fields=['creator', 'campaign'], name='submission_creator_campaign'),
+        ),
+    ]
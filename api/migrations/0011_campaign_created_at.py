@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-17 20:03
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_submission_creator_campaign_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
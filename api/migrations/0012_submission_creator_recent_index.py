@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-17 20:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_campaign_created_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contentsubmission',
+            index=models.Index(fields=['creator', '-created_at', '-id'], name='submission_creator_recent'),
+        ),
+    ]
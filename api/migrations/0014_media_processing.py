@@ -0,0 +1,64 @@
+# Generated by Django 5.2.8 on 2026-10-17 20:20
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_upload_session'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contentsubmission',
+            name='media_duration',
+            field=models.FloatField(blank=True, help_text='Seconds', null=True),
+        ),
+        migrations.AddField(
+            model_name='contentsubmission',
+            name='media_height',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='contentsubmission',
+            name='media_processed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='contentsubmission',
+            name='media_size',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='contentsubmission',
+            name='media_width',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='contentsubmission',
+            name='preview_blob',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.CreateModel(
+            name='MediaJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='queued', max_length=20)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('max_attempts', models.PositiveSmallIntegerField(default=5)),
+                ('run_after', models.DateTimeField(default=django.utils.timezone.now)),
+                ('locked_by', models.CharField(blank=True, max_length=100)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('submission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='media_jobs', to='api.contentsubmission')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'run_after'], name='mediajob_ready')],
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.8 on 2026-10-17 20:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counters(apps, schema_editor):
+    ContentSubmission = apps.get_model('api', 'ContentSubmission')
+    CampaignSubmissionCounter = apps.get_model('api', 'CampaignSubmissionCounter')
+    db_alias = schema_editor.connection.alias
+    rows = (
+        ContentSubmission.objects.using(db_alias).filter(campaign__isnull=False).order_by()
+        .values('campaign_id', 'status', 'platform').annotate(n=Count('id'))
+    )
+    CampaignSubmissionCounter.objects.using(db_alias).bulk_create([
+        CampaignSubmissionCounter(
+            campaign_id=row['campaign_id'], status=row['status'], platform=row['platform'], count=row['n']
+        )
+        for row in rows
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_dashboard_snapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CampaignSubmissionCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending Review'), ('approved', 'Approved'), ('rejected', 'Changes Requested')], max_length=20)),
+                ('platform', models.CharField(choices=[('instagram', 'Instagram'), ('tiktok', 'TikTok'), ('youtube', 'YouTube')], max_length=50)),
+                ('count', models.IntegerField(default=0)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='submission_counters', to='api.campaign')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('campaign', 'status', 'platform'), name='unique_campaign_counter')],
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 5.2.8 on 2026-10-17 20:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+POSTGRES_FORWARDS = [
+    "CREATE INDEX api_creatorsearch_trgm ON api_creatorsearchdocument USING gin (document gin_trgm_ops)",
+]
+POSTGRES_BACKWARDS = ["DROP INDEX IF EXISTS api_creatorsearch_trgm"]
+
+# External-content FTS5 table over api_creatorsearchdocument (rowid = creator id),
+# kept in step by triggers. The trigram tokenizer needs SQLite 3.34+.
+SQLITE_FORWARDS = [
+    """CREATE VIRTUAL TABLE api_creator_fts USING fts5(
+        document, content='api_creatorsearchdocument', content_rowid='creator_id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER api_creator_fts_insert AFTER INSERT ON api_creatorsearchdocument BEGIN
+        INSERT INTO api_creator_fts(rowid, document) VALUES (new.creator_id, new.document);
+    END""",
+    """CREATE TRIGGER api_creator_fts_delete AFTER DELETE ON api_creatorsearchdocument BEGIN
+        INSERT INTO api_creator_fts(api_creator_fts, rowid, document) VALUES ('delete', old.creator_id, old.document);
+    END""",
+    """CREATE TRIGGER api_creator_fts_update AFTER UPDATE ON api_creatorsearchdocument BEGIN
+        INSERT INTO api_creator_fts(api_creator_fts, rowid, document) VALUES ('delete', old.creator_id, old.document);
+        INSERT INTO api_creator_fts(rowid, document) VALUES (new.creator_id, new.document);
+    END""",
+]
+SQLITE_BACKWARDS = [
+    "DROP TRIGGER IF EXISTS api_creator_fts_update",
+    "DROP TRIGGER IF EXISTS api_creator_fts_delete",
+    "DROP TRIGGER IF EXISTS api_creator_fts_insert",
+    "DROP TABLE IF EXISTS api_creator_fts",
+]
+
+
+def _run(schema_editor, statements):
+    for sql in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def create_search_index(apps, schema_editor):
+    _run(schema_editor, {'postgresql': POSTGRES_FORWARDS, 'sqlite': SQLITE_FORWARDS})
+
+
+def drop_search_index(apps, schema_editor):
+    _run(schema_editor, {'postgresql': POSTGRES_BACKWARDS, 'sqlite': SQLITE_BACKWARDS})
+
+
+def backfill_documents(apps, schema_editor):
+    Creator = apps.get_model('api', 'Creator')
+    CreatorSearchDocument = apps.get_model('api', 'CreatorSearchDocument')
+    db_alias = schema_editor.connection.alias
+    rows = Creator.objects.using(db_alias).values_list('pk', 'email', 'username', 'profile__bio', 'profile__social_links')
+    documents = []
+    for pk, email, username, bio, social_links in rows.iterator(chunk_size=2000):
+        handles = [value for value in (social_links or {}).values() if isinstance(value, str)]
+        document = '\n'.join(part for part in (email, username, bio, *handles) if part).lower()
+        documents.append(CreatorSearchDocument(creator_id=pk, document=document))
+    CreatorSearchDocument.objects.using(db_alias).bulk_create(documents, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_campaign_submission_counters'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.CreateModel(
+            name='CreatorSearchDocument',
+            fields=[
+                ('creator', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='search_document', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('document', models.TextField()),
+            ],
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(backfill_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-17 20:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_creator_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SocialHandle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('platform', models.CharField(max_length=50)),
+                ('handle', models.CharField(max_length=255)),
+                ('creator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='social_handles', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['platform', 'handle'], name='socialhandle_platform_handle'), models.Index(fields=['handle'], name='socialhandle_handle')],
+                'constraints': [models.UniqueConstraint(fields=('creator', 'platform'), name='unique_creator_platform_handle')],
+            },
+        ),
+    ]
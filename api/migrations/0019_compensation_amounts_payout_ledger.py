@@ -0,0 +1,42 @@
+# Generated by Django 5.2.8 on 2026-10-17 20:32
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_social_handles'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='compensation_amount',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, help_text='Parsed from compensation_rate on save', max_digits=12, null=True),
+        ),
+        migrations.AddField(
+            model_name='creatorprofile',
+            name='personalized_compensation_amount',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, help_text='Parsed from personalized_compensation on save', max_digits=12, null=True),
+        ),
+        migrations.CreateModel(
+            name='PayoutEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tier', models.CharField(max_length=50)),
+                ('amount', models.DecimalField(blank=True, decimal_places=2, help_text='Empty if unpriced', max_digits=12, null=True)),
+                ('approved_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('paid_at', models.DateTimeField(blank=True, null=True)),
+                ('campaign', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='payouts', to='api.campaign')),
+                ('creator', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='payouts', to=settings.AUTH_USER_MODEL)),
+                ('submission', models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='payout', to='api.contentsubmission')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['approved_at'], name='payout_approved'), models.Index(fields=['campaign', 'approved_at'], name='payout_campaign_approved'), models.Index(fields=['tier', 'approved_at'], name='payout_tier_approved')],
+            },
+        ),
+    ]
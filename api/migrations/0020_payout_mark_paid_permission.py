@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-17 20:48
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0019_compensation_amounts_payout_ledger'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='payoutentry',
+            options={'permissions': [('mark_paid', 'Can mark payouts as paid')]},
+        ),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations
+
+# Admin search runs `UPPER(col::text) LIKE UPPER('%term%')` on PostgreSQL,
+# which these trigram indexes serve (pg_trgm is enabled in 0017). SQLite
+# scans; it only backs local development.
+POSTGRES_FORWARDS = [
+    "CREATE INDEX api_invitecode_code_trgm ON api_invitecode USING gin ((UPPER(code::text)) gin_trgm_ops)",
+    "CREATE INDEX api_invitecode_email_trgm ON api_invitecode USING gin ((UPPER(email::text)) gin_trgm_ops)",
+]
+POSTGRES_BACKWARDS = [
+    "DROP INDEX IF EXISTS api_invitecode_email_trgm",
+    "DROP INDEX IF EXISTS api_invitecode_code_trgm",
+]
+
+
+def _run(schema_editor, statements):
+    if schema_editor.connection.vendor == 'postgresql':
+        for sql in statements:
+            schema_editor.execute(sql)
+
+
+def create_search_indexes(apps, schema_editor):
+    _run(schema_editor, POSTGRES_FORWARDS)
+
+
+def drop_search_indexes(apps, schema_editor):
+    _run(schema_editor, POSTGRES_BACKWARDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0020_payout_mark_paid_permission'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -1,8 +1,89 @@
-from django.db import models
+import copy
+import uuid
+
+from collections import Counter
+from contextlib import nullcontext
+
+from django.db import DatabaseError, IntegrityError, connections, models, transaction
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
+from django.utils import timezone
+from .cache import bump_version, user_namespace
+from .money import set_parsed_amount
+
+# --- Dirty Field Tracking ---
+class DirtyFieldsMixin:
+    """
+    Remembers column values as loaded from the database so save() only
+    writes the ones that changed (and skips the UPDATE when none did).
+    """
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot(field_names)
+        return instance
+
+    def _snapshot(self, attnames):
+        loaded = self.__dict__.setdefault('_loaded_values', {})
+        for attname in attnames:
+            if attname in self.__dict__:
+                # Copy so in-place edits to JSON values are still detected
+                loaded[attname] = copy.deepcopy(self.__dict__[attname])
+
+    def get_dirty_fields(self):
+        """
+        Loaded columns whose value changed, plus deferred ones since assigned.
+        """
+        loaded = self.__dict__.get('_loaded_values', {})
+        return [
+            field.attname for field in self._meta.concrete_fields
+            if not field.primary_key and field.attname in self.__dict__
+            and (field.attname not in loaded or loaded[field.attname] != self.__dict__[field.attname])
+        ]
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._snapshot(fields or [f.attname for f in self._meta.concrete_fields])
+
+    def _diffable(self, kwargs):
+        # Only a row loaded from (and saved back to) the same database, with
+        # its primary key intact; anything else is a plain save
+        return (
+            kwargs.get('update_fields') is None and not kwargs.get('force_insert')
+            and not self._state.adding and self._state.db is not None and self.pk is not None
+            and (kwargs.get('using') or self._state.db) == self._state.db
+            and '_loaded_values' in self.__dict__
+        )
+
+    def save(self, **kwargs):
+        if not self._diffable(kwargs):
+            super().save(**kwargs)
+            saved = kwargs.get('update_fields')
+            self._snapshot(saved if saved is not None else [f.attname for f in self._meta.concrete_fields])
+            return
+
+        dirty = self.get_dirty_fields()
+        if not dirty:
+            # Nothing to write. Django sends no signals for this either, so
+            # models that cascade saves do it in save() (see Creator)
+            return
+        connection = connections[self._state.db]
+        try:
+            # In a transaction, a savepoint keeps the failure below recoverable
+            with transaction.atomic(using=self._state.db) if connection.in_atomic_block else nullcontext():
+                super().save(update_fields=dirty, **kwargs)
+        except DatabaseError:
+            # Deferred fields make a plain save an update_fields save too
+            stored = type(self)._base_manager.using(self._state.db).filter(pk=self.pk)
+            if self.get_deferred_fields() or stored.exists():
+                raise
+            # Deleted since it was loaded: a plain save re-inserts the row
+            super().save(**kwargs)
+            dirty = [f.attname for f in self._meta.concrete_fields]
+        self._snapshot(dirty)
+
 
 # --- Custom User Manager ---
 class CreatorManager(BaseUserManager):
@@ -19,8 +100,16 @@ class CreatorManager(BaseUserManager):
         extra_fields.setdefault('is_superuser', True)
         return self.create_user(email, username, password, **extra_fields)
 
+    def with_profile(self):
+        """
+        Join the profile in the same query, leaving its heavy columns deferred.
+        """
+        return self.select_related('profile').defer(
+            *(f'profile__{name}' for name in CreatorProfile.HEAVY_FIELDS)
+        )
+
 # --- Custom User ---
-class Creator(AbstractBaseUser, PermissionsMixin):
+class Creator(DirtyFieldsMixin, AbstractBaseUser, PermissionsMixin):
     email = models.EmailField(unique=True)
     username = models.CharField(max_length=150, unique=True)
     is_active = models.BooleanField(default=True)
@@ -33,8 +122,37 @@ class Creator(AbstractBaseUser, PermissionsMixin):
 
     def __str__(self): return self.email
 
+    def save(self, **kwargs):
+        adding = self._state.adding
+        super().save(**kwargs)
+        # Only a profile already loaded on this user can hold unsaved edits;
+        # its save() writes just the changed columns, or nothing at all.
+        # Here rather than in post_save, which isn't sent when the creator
+        # itself had nothing to write.
+        if not adding and Creator.profile.is_cached(self):
+            self.profile.save()
+
 # --- Creator Profile ---
-class CreatorProfile(models.Model):
+class CreatorProfileQuerySet(models.QuerySet):
+    def with_verification(self):
+        """
+        Opt back in to the heavy verification columns (admin review, exports).
+        """
+        return self.defer(None)
+
+
+class CreatorProfileManager(models.Manager.from_queryset(CreatorProfileQuerySet)):
+    """
+    Defers the verification columns by default; the API never serializes them.
+    """
+    def get_queryset(self):
+        return super().get_queryset().defer(*CreatorProfile.HEAVY_FIELDS)
+
+
+class CreatorProfile(DirtyFieldsMixin, models.Model):
+    # Columns only needed for verification review, never by the creator API
+    HEAVY_FIELDS = ('w9_data_encrypted', 'id_front_blob', 'id_back_blob', 'selfie_blob')
+
     creator = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='profile')
     
     # Public Persona
@@ -51,10 +169,10 @@ class CreatorProfile(models.Model):
     w9_complete = models.BooleanField(default=False)
     w9_data_encrypted = models.TextField(blank=True, null=True)
     
-    # ID Images
-    id_front_image = models.TextField(blank=True, null=True)
-    id_back_image = models.TextField(blank=True, null=True)
-    selfie_image = models.TextField(blank=True, null=True)
+    # ID Images (SHA-256 keys into the blob store, see api/blobstore.py)
+    id_front_blob = models.CharField(max_length=64, blank=True, null=True)
+    id_back_blob = models.CharField(max_length=64, blank=True, null=True)
+    selfie_blob = models.CharField(max_length=64, blank=True, null=True)
 
     # Campaign Specifics (Per Creator)
     contract_signed = models.BooleanField(default=False)
@@ -62,18 +180,63 @@ class CreatorProfile(models.Model):
     tracking_number = models.CharField(max_length=100, blank=True, null=True)
     tracking_url = models.URLField(blank=True, null=True)
     personalized_compensation = models.CharField(max_length=100, blank=True, null=True, help_text="Overrides default campaign rate (e.g. '$1,500')")
+    personalized_compensation_amount = models.DecimalField(
+        max_digits=12, decimal_places=2, blank=True, null=True, editable=False,
+        help_text="Parsed from personalized_compensation on save"
+    )
     personalized_deadline = models.DateField(blank=True, null=True, help_text="Overrides default campaign deadline")
 
+    objects = CreatorProfileManager()
 
     def __str__(self): return f"{self.creator.username}'s Profile"
 
+    def save(self, **kwargs):
+        set_parsed_amount(self, 'personalized_compensation', 'personalized_compensation_amount', kwargs)
+        super().save(**kwargs)
+
 # --- Signals ---
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
-def create_or_save_creator_profile(sender, instance, created, **kwargs):
+def create_creator_profile(sender, instance, created, **kwargs):
+    # Edits to a loaded profile are saved by Creator.save()
     if created:
         CreatorProfile.objects.create(creator=instance)
-    else:
-        instance.profile.save()
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_creator_cache(sender, instance, **kwargs):
+    # After commit, so a concurrent read can't re-cache the old row under the new version
+    namespace = user_namespace(instance.pk)
+    transaction.on_commit(lambda: bump_version(namespace))
+
+@receiver(post_save, sender=CreatorProfile)
+@receiver(post_delete, sender=CreatorProfile)
+def invalidate_profile_cache(sender, instance, **kwargs):
+    namespace = user_namespace(instance.creator_id)
+    transaction.on_commit(lambda: bump_version(namespace))
+
+# --- Social Handles ---
+class SocialHandle(models.Model):
+    """
+    One row per entry in a profile's social_links, with the handle
+    normalized (no '@' or profile URL, lowercase) so owners and platform
+    membership can be looked up by index. Kept in sync by api/social.py.
+    """
+    creator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='social_handles')
+    platform = models.CharField(max_length=50)
+    handle = models.CharField(max_length=255)
+
+    class Meta:
+        constraints = [
+            # social_links is keyed by platform, so one handle each
+            models.UniqueConstraint(fields=['creator', 'platform'], name='unique_creator_platform_handle'),
+        ]
+        indexes = [
+            # Owner lookups, per-platform listings and duplicate detection
+            models.Index(fields=['platform', 'handle'], name='socialhandle_platform_handle'),
+            models.Index(fields=['handle'], name='socialhandle_handle'),
+        ]
+
+    def __str__(self): return f"{self.platform}: @{self.handle}"
 
 # --- Campaign Model ---
 class Campaign(models.Model):
@@ -91,12 +254,33 @@ class Campaign(models.Model):
     
     # Compensation Display
     compensation_rate = models.CharField(max_length=100, default="$100.00")
+    compensation_amount = models.DecimalField(
+        max_digits=12, decimal_places=2, blank=True, null=True, editable=False,
+        help_text="Parsed from compensation_rate on save"
+    )
     usage_rights = models.CharField(max_length=100, default="+ Usage Rights")
 
+    created_at = models.DateTimeField(auto_now_add=True)
+
     def __str__(self): return self.title
 
+    def save(self, *args, **kwargs):
+        set_parsed_amount(self, 'compensation_rate', 'compensation_amount', kwargs)
+        super().save(*args, **kwargs)
+
+@receiver(post_save, sender=Campaign)
+@receiver(post_delete, sender=Campaign)
+def invalidate_campaign_cache(sender, instance, **kwargs):
+    # After commit, so a concurrent reader can't re-cache the old row under the new version
+    transaction.on_commit(lambda: bump_version('campaigns'))
+
 # --- Content Submission ---
-class ContentSubmission(models.Model):
+PLATFORM_CHOICES = [('instagram', 'Instagram'), ('tiktok', 'TikTok'), ('youtube', 'YouTube')]
+
+# Columns that key CampaignSubmissionCounter rows
+COUNTER_FIELDS = ('campaign_id', 'status', 'platform')
+
+class ContentSubmission(DirtyFieldsMixin, models.Model):
     STATUS_CHOICES = [
         ('pending', 'Pending Review'),
         ('approved', 'Approved'),
@@ -113,7 +297,7 @@ class ContentSubmission(models.Model):
     # Platform Field (Fixed)
     platform = models.CharField(
         max_length=50, 
-        choices=[('instagram', 'Instagram'), ('tiktok', 'TikTok'), ('youtube', 'YouTube')], 
+        choices=PLATFORM_CHOICES, 
         default='tiktok'
     ) 
     
@@ -121,8 +305,237 @@ class ContentSubmission(models.Model):
     feedback = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Filled in by the media worker (see api/media.py)
+    media_size = models.BigIntegerField(blank=True, null=True)
+    media_duration = models.FloatField(blank=True, null=True, help_text="Seconds")
+    media_width = models.PositiveIntegerField(blank=True, null=True)
+    media_height = models.PositiveIntegerField(blank=True, null=True)
+    preview_blob = models.CharField(max_length=64, blank=True, null=True)  # Poster JPEG in the blob store
+    media_processed_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            # Dashboard submission-status lookup
+            models.Index(fields=['creator', 'campaign'], name='submission_creator_campaign'),
+            # Cursor-paginated submission list
+            models.Index(fields=['creator', '-created_at', '-id'], name='submission_creator_recent'),
+        ]
+
     def __str__(self): return f"{self.creator.username} - {self.status}"
 
+    def counter_key(self):
+        return tuple(getattr(self, attname) for attname in COUNTER_FIELDS)
+
+    def _saved_counter_key(self):
+        """
+        The (campaign, status, platform) stored for this row right now, or
+        None if it isn't in the database. Locks the row until commit. Read
+        from the database, not the loaded values: the row may have changed
+        since this instance was loaded (e.g. by bulk_review).
+        """
+        if self.pk is None:
+            return None
+        return (
+            type(self)._base_manager.select_for_update().filter(pk=self.pk)
+            .values_list(*COUNTER_FIELDS).first()
+        )
+
+    def save(self, **kwargs):
+        # The counter update commits (or rolls back) together with the row
+        with transaction.atomic():
+            before = self._saved_counter_key()
+            # For post_save handlers that also refresh the campaign it left (dashboard)
+            self._previous_campaign_id = before[0] if before else None
+            super().save(**kwargs)
+            # An update only writes the dirty columns, so the stored key can
+            # mix this instance's values with ones written by someone else
+            after = self.counter_key() if before is None else self._saved_counter_key()
+            CampaignSubmissionCounter.objects.move(before, after)
+
+@receiver(post_delete, sender=ContentSubmission)
+def decrement_submission_counter(sender, instance, **kwargs):
+    # Runs inside the deletion's transaction, including cascades from Creator
+    CampaignSubmissionCounter.objects.move(instance.counter_key(), None)
+
+@receiver(post_save, sender=ContentSubmission)
+def enqueue_media_processing(sender, instance, created, **kwargs):
+    if created:
+        # After commit, so a worker never picks up a submission that rolled back
+        transaction.on_commit(lambda: MediaJob.objects.create(submission_id=instance.pk))
+
+# --- Campaign Submission Counters ---
+class CampaignSubmissionCounterManager(models.Manager):
+    def apply(self, deltas):
+        """
+        Add {(campaign id, status, platform): delta} to the counters. Call
+        inside the transaction that changed the submissions. Keys are applied
+        in sorted order so concurrent writers lock rows in the same order.
+        """
+        for key in sorted(key for key, delta in deltas.items() if delta and key[0] is not None):
+            campaign_id, status, platform = key
+            counter = self.filter(campaign_id=campaign_id, status=status, platform=platform)
+            if counter.update(count=models.F('count') + deltas[key]):
+                continue
+            try:
+                with transaction.atomic():
+                    self.create(campaign_id=campaign_id, status=status, platform=platform, count=deltas[key])
+            except IntegrityError:
+                # Another transaction created the row first
+                counter.update(count=models.F('count') + deltas[key])
+
+    def move(self, before, after):
+        """
+        One submission went from key `before` to `after` (None = didn't exist).
+        """
+        if before != after:
+            deltas = Counter()
+            if before:
+                deltas[before] -= 1
+            if after:
+                deltas[after] += 1
+            self.apply(deltas)
+
+class CampaignSubmissionCounter(models.Model):
+    """
+    Submission count per (campaign, status, platform), kept in step with
+    ContentSubmission writes. Repair with `manage.py reconcile_campaign_counters`.
+    """
+    campaign = models.ForeignKey(Campaign, on_delete=models.CASCADE, related_name='submission_counters')
+    status = models.CharField(max_length=20, choices=ContentSubmission.STATUS_CHOICES)
+    platform = models.CharField(max_length=50, choices=PLATFORM_CHOICES)
+    count = models.IntegerField(default=0)
+
+    objects = CampaignSubmissionCounterManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['campaign', 'status', 'platform'], name='unique_campaign_counter'),
+        ]
+
+    def __str__(self): return f"{self.campaign_id} {self.status}/{self.platform}: {self.count}"
+
+# --- Payout Ledger ---
+class PayoutEntry(models.Model):
+    """
+    What an approved submission earns, priced when it was approved
+    (the creator's personalized amount, else the campaign's). Maintained by
+    api/payouts.py. Rows outlive the submission, creator or campaign.
+    """
+    submission = models.OneToOneField(
+        ContentSubmission, on_delete=models.SET_NULL, null=True, blank=True, related_name='payout'
+    )
+    creator = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='payouts'
+    )
+    campaign = models.ForeignKey(Campaign, on_delete=models.SET_NULL, null=True, blank=True, related_name='payouts')
+    tier = models.CharField(max_length=50)
+    amount = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True, help_text="Empty if unpriced")
+    approved_at = models.DateTimeField(default=timezone.now)
+    paid_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            # Report filters and month grouping
+            models.Index(fields=['approved_at'], name='payout_approved'),
+            models.Index(fields=['campaign', 'approved_at'], name='payout_campaign_approved'),
+            models.Index(fields=['tier', 'approved_at'], name='payout_tier_approved'),
+        ]
+        permissions = [('mark_paid', 'Can mark payouts as paid')]
+
+    def __str__(self): return f"Payout {self.amount} for submission {self.submission_id}"
+
+# --- Media Processing Queue ---
+class MediaJob(models.Model):
+    """
+    One metadata/preview job per submission, claimed by `manage.py process_media`.
+    """
+    STATUS_CHOICES = [('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')]
+
+    submission = models.ForeignKey(ContentSubmission, on_delete=models.CASCADE, related_name='media_jobs')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)  # Pushed back on each retry
+
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        indexes = [
+            # Worker claim query: next ready jobs
+            models.Index(fields=['status', 'run_after'], name='mediajob_ready'),
+        ]
+
+    def __str__(self): return f"Media job {self.pk} ({self.status})"
+
+# --- Dashboard Snapshot ---
+class DashboardSnapshot(models.Model):
+    """
+    Denormalized dashboard for one creator, kept current by the signal
+    handlers in api/dashboard.py and read with a single primary-key lookup.
+    """
+    creator = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name='dashboard_snapshot'
+    )
+    data = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self): return f"Dashboard for creator {self.creator_id}"
+
+# --- Creator Search Index ---
+class CreatorSearchDocument(models.Model):
+    """
+    Lowercased email, username, bio and social handles for one creator,
+    indexed for substring search (see api/search.py).
+    """
+    creator = models.OneToOneField(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name='search_document'
+    )
+    document = models.TextField()
+
+    def __str__(self): return f"Search document for creator {self.creator_id}"
+
+# --- Resumable Uploads ---
+class UploadSession(models.Model):
+    """
+    A chunked upload in progress (see api/uploads.py). Chunks live in the
+    upload backend, not here; completing the session creates the submission.
+    """
+    STATUS_CHOICES = [('open', 'Open'), ('complete', 'Complete')]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    creator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='upload_sessions')
+    campaign = models.ForeignKey(Campaign, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    platform = models.CharField(max_length=50, choices=PLATFORM_CHOICES, default='tiktok')
+    file_type = models.CharField(max_length=10, default='video')
+
+    filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100)
+    size = models.BigIntegerField()
+    chunk_size = models.PositiveIntegerField()
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='open')
+    submission = models.OneToOneField(
+        ContentSubmission, on_delete=models.SET_NULL, null=True, blank=True, related_name='upload_session'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+
+    @property
+    def chunk_count(self):
+        return -(-self.size // self.chunk_size)
+
+    def chunk_length(self, index):
+        """Expected byte length of chunk `index` (only the last may be short)."""
+        if index == self.chunk_count - 1:
+            return self.size - index * self.chunk_size
+        return self.chunk_size
+
+    def __str__(self): return f"{self.filename} ({self.status})"
+
 class InviteCode(models.Model):
     code = models.CharField(max_length=50, unique=True) # e.g. "MILANI-SARAH"
     email = models.EmailField(unique=True) # Lock this code to one email
@@ -0,0 +1,45 @@
+"""
+Parsing of the free-text compensation strings ("$1,500", "$100.00",
+"2.5k") into Decimal amounts for the payout ledger and reports.
+"""
+import re
+from decimal import Decimal, InvalidOperation
+
+CENTS = Decimal('0.01')
+MAX_AMOUNT = Decimal('9999999999.99')  # DecimalField(max_digits=12, decimal_places=2)
+
+_NUMBER = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*([kK]\b)?')
+
+
+def parse_amount(text):
+    """
+    The single amount in `text`, or None when there is none (or several,
+    e.g. a range), so ambiguous strings are never guessed at.
+    """
+    if not text:
+        return None
+    numbers = _NUMBER.findall(str(text))
+    if len(numbers) != 1:
+        return None
+    digits, thousands = numbers[0]
+    try:
+        amount = Decimal(digits.replace(',', ''))
+    except InvalidOperation:
+        return None
+    if thousands:
+        amount *= 1000
+    amount = amount.quantize(CENTS)
+    return amount if amount <= MAX_AMOUNT else None
+
+
+def set_parsed_amount(instance, source, target, save_kwargs):
+    """
+    Refresh `instance.<target>` from the `<source>` string before a save,
+    adding it to update_fields when the source is being saved.
+    """
+    if source not in instance.__dict__:
+        return  # Deferred, so unchanged by this save
+    setattr(instance, target, parse_amount(getattr(instance, source)))
+    update_fields = save_kwargs.get('update_fields')
+    if update_fields is not None and source in update_fields:
+        save_kwargs['update_fields'] = {*update_fields, target}
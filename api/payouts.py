@@ -0,0 +1,160 @@
+"""
+Payout ledger and finance report.
+
+Every approved submission gets one PayoutEntry, priced when it is
+approved. Only staff reviews book approvals: `sync_ledger` runs inside
+the transaction of bulk_review (the review API and admin actions) and of
+submission saves in the admin. Other writes (creators can't set status,
+scripts, queryset.update()) don't touch the ledger; repair it with
+`manage.py backfill_compensation`. Entries for submissions that leave
+`approved` are removed unless already paid. An unpaid entry whose submission moved to
+another campaign follows it and is repriced; paid entries never change.
+
+Totals by campaign / tier / month are one GROUP BY over the ledger,
+cached in the 'payouts' namespace until the ledger changes.
+"""
+import datetime
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncMonth
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .cache import bump_version, get_or_build
+from .models import ContentSubmission, PayoutEntry
+from .money import CENTS
+
+CACHE_NAMESPACE = 'payouts'
+REPORT_GROUPS = ('campaign', 'tier', 'month')
+
+
+# --- Ledger -----------------------------------------------------------------------
+
+def _invalidate_report():
+    transaction.on_commit(lambda: bump_version(CACHE_NAMESPACE))
+
+
+def sync_ledger(submission_ids, backfill=False):
+    """
+    Record approved submissions that have no entry yet, move unpaid entries
+    whose submission changed campaign, and drop unpaid entries of ones no
+    longer approved. New entries are dated now, or by the submission's
+    created_at when backfilling (the approval time isn't stored).
+    Returns (created, removed).
+    """
+    submission_ids = list(submission_ids)
+    with transaction.atomic():
+        approved = list(
+            ContentSubmission.objects.filter(pk__in=submission_ids, status='approved').values_list(
+                'pk', 'creator_id', 'campaign_id', 'created_at', 'creator__profile__tier',
+                'creator__profile__personalized_compensation_amount', 'campaign__compensation_amount',
+            )
+        )
+        recorded = {
+            entry.submission_id: entry
+            for entry in PayoutEntry.objects.filter(submission_id__in=submission_ids).only(
+                'submission_id', 'campaign_id', 'amount', 'paid_at'
+            )
+        }
+        now = timezone.now()
+        new, moved = [], []
+        for pk, creator_id, campaign_id, created_at, tier, personalized, campaign_amount in approved:
+            amount = personalized if personalized is not None else campaign_amount
+            entry = recorded.get(pk)
+            if entry is None:
+                new.append(PayoutEntry(
+                    submission_id=pk, creator_id=creator_id, campaign_id=campaign_id, tier=tier or '',
+                    amount=amount, approved_at=created_at if backfill else now,
+                ))
+            elif entry.paid_at is None and entry.campaign_id != campaign_id:
+                entry.campaign_id, entry.amount = campaign_id, amount
+                moved.append(entry)
+        created = PayoutEntry.objects.bulk_create(new)
+        PayoutEntry.objects.bulk_update(moved, ['campaign', 'amount'])
+        removed, _ = (
+            PayoutEntry.objects.filter(submission_id__in=submission_ids, paid_at__isnull=True)
+            .exclude(submission_id__in=[row[0] for row in approved]).delete()
+        )
+        if created or moved or removed:
+            _invalidate_report()
+    return len(created), removed
+
+
+@receiver(pre_delete, sender=ContentSubmission)
+def submission_ledger_deleted(sender, instance, **kwargs):
+    # Paid entries are history and stay (their submission is set to NULL)
+    if PayoutEntry.objects.filter(submission=instance, paid_at__isnull=True).delete()[0]:
+        _invalidate_report()
+
+
+def mark_paid(queryset, paid_at=None):
+    updated = queryset.filter(paid_at__isnull=True).update(paid_at=paid_at or timezone.now())
+    if updated:
+        _invalidate_report()
+    return updated
+
+
+# --- Report -----------------------------------------------------------------------
+
+def _report_rows(groups, since, until):
+    entries = PayoutEntry.objects.all()
+    if since:
+        entries = entries.filter(approved_at__gte=since)
+    if until:
+        entries = entries.filter(approved_at__lt=until)
+
+    keys = {
+        'campaign': ('campaign_id', 'campaign__title'),
+        'tier': ('tier',),
+        'month': ('month',),
+    }
+    if 'month' in groups:
+        entries = entries.annotate(month=TruncMonth('approved_at'))
+    totals = {
+        'total': Sum('amount'),
+        'paid': Sum('amount', filter=Q(paid_at__isnull=False)),
+        'entries': Count('id'),
+        'unpriced': Count('id', filter=Q(amount__isnull=True)),
+    }
+    if not groups:
+        return [_report_row({}, entries.aggregate(**totals))]
+    columns = [column for group in groups for column in keys[group]]
+    return [
+        _report_row({name: row[column] for column, name in zip(columns, _labels(groups))}, row)
+        for row in entries.values(*columns).annotate(**totals).order_by(*columns)
+    ]
+
+
+def _labels(groups):
+    for group in groups:
+        yield from (('campaign', 'campaign_title') if group == 'campaign' else (group,))
+
+
+def _report_row(keys, row):
+    if 'month' in keys:
+        keys['month'] = keys['month'].strftime('%Y-%m')
+    # Money as exact decimal strings, never floats
+    return {
+        **keys,
+        'total': str((row['total'] or Decimal(0)).quantize(CENTS)),
+        'paid': str((row['paid'] or Decimal(0)).quantize(CENTS)),
+        'entries': row['entries'],
+        'unpriced': row['unpriced'],
+    }
+
+
+def payout_report(groups=REPORT_GROUPS, since=None, until=None):
+    """
+    Ledger totals grouped by any of campaign / tier / month, cached until
+    the ledger next changes. `since` / `until` are dates (until exclusive).
+    """
+    groups = [group for group in REPORT_GROUPS if group in groups]
+    bounds = [
+        timezone.make_aware(datetime.datetime.combine(day, datetime.time())) if day else None
+        for day in (since, until)
+    ]
+    name = f"report:{','.join(groups)}:{since}:{until}"
+    return get_or_build(CACHE_NAMESPACE, name, lambda: _report_rows(groups, *bounds))
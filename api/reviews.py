@@ -0,0 +1,72 @@
+"""
+Bulk review of content submissions.
+
+A batch of approvals/rejections is applied in one transaction with a
+single UPDATE, instead of a model save() per row. Campaign counters and
+the payout ledger are adjusted in the same transaction. Anything else
+that must react to review decisions listens to `submissions_reviewed`,
+which is sent after commit in batches, so the UPDATE isn't held up by
+follow-up work.
+"""
+from collections import Counter
+from itertools import islice
+
+from django.db import transaction
+from django.dispatch import Signal
+
+from .models import CampaignSubmissionCounter, ContentSubmission
+from .payouts import sync_ledger
+
+MAX_REVIEW_BATCH = 5000
+DEFAULT_FANOUT_BATCH_SIZE = 500
+
+# Sent after commit with `reviews`: [(submission id, creator id, campaign id,
+# previous status), ...], plus the new `status` and `feedback`
+submissions_reviewed = Signal()
+
+
+def _batches(items, size):
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _fan_out(reviews, status, feedback, batch_size):
+    for batch in _batches(reviews, batch_size):
+        submissions_reviewed.send(sender=ContentSubmission, reviews=batch, status=status, feedback=feedback)
+
+
+def bulk_review(ids, status, feedback=None, batch_size=DEFAULT_FANOUT_BATCH_SIZE):
+    """
+    Set `status` (and `feedback`, unless None) on the given submissions.
+    Returns {'updated': count, 'missing': [ids not found]}.
+    """
+    if status not in dict(ContentSubmission.STATUS_CHOICES):
+        raise ValueError(f"Unknown status: {status}")
+    ids = set(ids)
+    if len(ids) > MAX_REVIEW_BATCH:
+        raise ValueError(f"At most {MAX_REVIEW_BATCH} submissions per review.")
+
+    changes = {'status': status}
+    if feedback is not None:
+        changes['feedback'] = feedback
+
+    with transaction.atomic():
+        # Lock the rows so the previous statuses we report stay accurate
+        rows = list(
+            ContentSubmission.objects.select_for_update().filter(pk__in=ids)
+            .order_by('pk').values_list('pk', 'creator_id', 'campaign_id', 'status', 'platform')
+        )
+        reviews = [row[:4] for row in rows]
+        found = [row[0] for row in rows]
+        updated = ContentSubmission.objects.filter(pk__in=found).update(**changes) if found else 0
+
+        deltas = Counter()
+        for _, _, campaign_id, previous, platform in rows:
+            deltas[(campaign_id, previous, platform)] -= 1
+            deltas[(campaign_id, status, platform)] += 1
+        CampaignSubmissionCounter.objects.apply(deltas)
+        sync_ledger(found)
+        transaction.on_commit(lambda: _fan_out(reviews, status, feedback, batch_size))
+
+    return {'updated': updated, 'missing': sorted(ids.difference(found))}
@@ -0,0 +1,167 @@
+"""
+Read replica routing.
+
+Settings list the replica aliases in DATABASE_REPLICAS. Reads go to the
+primary unless a view opts in: views with ReplicaReadMixin call
+`use_replica` once the user is authenticated, and the rest of that
+request's reads go to one replica. Writes always go to the primary.
+
+Read-your-writes:
+  * Once a request writes, its remaining reads go to the primary.
+  * ReplicaRoutingMiddleware then pins the user to the primary for
+    REPLICA_PIN_SECONDS, so the next reads see the write even if the
+    replicas lag behind.
+
+Outside a request (commands, workers, tests) everything uses the primary,
+except where a caller passes `read_alias()` explicitly.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.functional import SimpleLazyObject, empty
+
+DEFAULT_PIN_SECONDS = 10
+
+_state = ContextVar('db_routing', default=None)
+
+
+class RoutingState:
+    __slots__ = ('replica', 'wrote')
+
+    def __init__(self):
+        self.replica = None
+        self.wrote = False
+
+
+def replica_aliases():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def _pin_key(user_id):
+    return f'api:db-pin:{user_id}'
+
+
+def is_pinned(user):
+    return bool(user and user.is_authenticated and cache.get(_pin_key(user.pk)))
+
+
+def pin_to_primary(user):
+    timeout = getattr(settings, 'REPLICA_PIN_SECONDS', DEFAULT_PIN_SECONDS)
+    cache.set(_pin_key(user.pk), True, timeout)
+
+
+def any_replica():
+    """
+    A replica alias, or the primary when none are configured.
+    """
+    replicas = replica_aliases()
+    return random.choice(replicas) if replicas else DEFAULT_DB_ALIAS
+
+
+def use_replica(user):
+    """
+    Send the current request's remaining reads to a replica, unless it has
+    written or `user` wrote recently. Returns the alias reads will use.
+    """
+    state = _state.get()
+    if state is not None and replica_aliases() and not state.wrote and not is_pinned(user):
+        state.replica = any_replica()
+    return read_alias()
+
+
+@contextmanager
+def primary_reads():
+    """
+    Read from the primary inside the block, e.g. while filling a shared
+    cache entry that a lagging replica would otherwise fill with old data.
+    """
+    state = _state.get()
+    replica = state.replica if state is not None else None
+    if state is not None:
+        state.replica = None
+    try:
+        yield
+    finally:
+        if state is not None:
+            state.replica = replica
+
+
+def read_alias():
+    """
+    Where the current request reads from, for work that outlives the
+    routing context (e.g. a streamed export) and must name it with .using().
+    """
+    state = _state.get()
+    if state is None or state.wrote or state.replica is None:
+        return DEFAULT_DB_ALIAS
+    return state.replica
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return read_alias()
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, **hints):
+        # Replicas get their schema through replication
+        return db not in replica_aliases()
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Sets up per-request routing state, and pins users who wrote to the primary.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = RoutingState()
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+            self.finish(request, state)
+        finally:
+            _state.reset(token)
+        return response
+
+    async def __acall__(self, request):
+        state = RoutingState()
+        token = _state.set(state)
+        try:
+            response = await self.get_response(request)
+            self.finish(request, state)
+        finally:
+            _state.reset(token)
+        return response
+
+    def finish(self, request, state):
+        if not state.wrote:
+            return
+        # DRF and the async views put the authenticated user (JWT included)
+        # on the request. A lazy user nobody looked at isn't loaded for this.
+        user = getattr(request, 'user', None)
+        if isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+            return
+        if user is not None and user.is_authenticated:
+            pin_to_primary(user)
@@ -0,0 +1,101 @@
+"""
+Indexed creator search.
+
+Each creator has one CreatorSearchDocument row: their email, username,
+bio and social handles, lowercased. The signal handlers below rewrite it
+whenever one of those fields changes. Substring matches then use an index
+instead of `UPPER(...) LIKE '%x%'` scans over creators joined to profiles:
+
+    PostgreSQL  pg_trgm GIN index on the document column
+    SQLite      FTS5 trigram table (api_creator_fts), synced by triggers
+
+Both are created in migration 0017. The staff search API and the creator /
+profile admin changelists both filter with `matching_creator_ids`.
+"""
+from django.db import connection
+from django.db.models import F
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Creator, CreatorProfile, CreatorSearchDocument
+
+FTS_TABLE = 'api_creator_fts'
+MIN_FTS_TERM = 3  # Trigram matching needs at least one trigram
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+DOCUMENT_FIELDS = ('email', 'username', 'profile__bio', 'profile__social_links')
+CREATOR_FIELDS = {'email', 'username'}
+PROFILE_FIELDS = {'bio', 'social_links'}
+
+
+# --- Indexing -------------------------------------------------------------------
+
+def search_document(email, username, bio, social_links):
+    handles = [value for value in (social_links or {}).values() if isinstance(value, str)]
+    return '\n'.join(part for part in (email, username, bio, *handles) if part).lower()
+
+
+def index_creators(creator_ids):
+    """
+    Rewrite the search documents for these creators: one read, one upsert.
+    """
+    rows = Creator.objects.filter(pk__in=creator_ids).values_list('pk', *DOCUMENT_FIELDS)
+    documents = [CreatorSearchDocument(creator_id=pk, document=search_document(*fields)) for pk, *fields in rows]
+    CreatorSearchDocument.objects.bulk_create(
+        documents, update_conflicts=True, unique_fields=['creator'], update_fields=['document'],
+    )
+    return len(documents)
+
+
+@receiver(post_save, sender=Creator)
+def index_creator_changed(sender, instance, created, **kwargs):
+    update_fields = kwargs.get('update_fields')
+    if created or (update_fields is not None and not CREATOR_FIELDS & set(update_fields)):
+        # New creators are indexed when their profile is created
+        return
+    index_creators([instance.pk])
+
+
+@receiver(post_save, sender=CreatorProfile)
+def index_profile_changed(sender, instance, created, **kwargs):
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and not PROFILE_FIELDS & set(update_fields):
+        return
+    index_creators([instance.creator_id])
+
+
+# --- Searching ------------------------------------------------------------------
+
+def normalize_term(term):
+    return ' '.join(term.split()).lower()
+
+
+def matching_creator_ids(term):
+    """
+    A subquery of creator ids whose document contains `term`, for use in
+    `pk__in=` / `creator_id__in=` filters.
+    """
+    term = normalize_term(term)
+    if connection.vendor == 'sqlite' and len(term) >= MIN_FTS_TERM:
+        # Quoted, so the term is matched as one substring rather than FTS syntax
+        phrase = '"{}"'.format(term.replace('"', '""'))
+        return RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [phrase])
+    # The document is already lowercase, so a plain LIKE is enough (and
+    # is what the trigram index serves)
+    return CreatorSearchDocument.objects.filter(document__contains=term).values('creator_id')
+
+
+def search_creators(term, limit=DEFAULT_LIMIT):
+    """
+    Newest matching creators first, with their profile summary.
+    """
+    return list(
+        Creator.objects.filter(pk__in=matching_creator_ids(term)).order_by('-pk').values(
+            'id', 'email', 'username', 'date_joined',
+            tier=F('profile__tier'),
+            verification_status=F('profile__verification_status'),
+            social_links=F('profile__social_links'),
+        )[:limit]
+    )
@@ -1,7 +1,24 @@
+import hashlib
+import json
+
 from rest_framework import serializers
+from rest_framework.utils.encoders import JSONEncoder
+from .cache import aget_or_build, get_or_build
+from .fast_serializers import FastSerializer
+from .instrumentation import timed
 from .models import Creator, CreatorProfile, Campaign, ContentSubmission
+from .reviews import MAX_REVIEW_BATCH
 from django.contrib.auth.password_validation import validate_password
 
+class TimedSerializerMixin:
+    """
+    Counts to_representation() towards the request's `serialize` timing.
+    """
+
+    def to_representation(self, instance):
+        with timed('serialize'):
+            return super().to_representation(instance)
+
 # --- Auth ---
 class CreatorSignUpSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, validators=[validate_password])
@@ -14,7 +31,7 @@ class CreatorSignUpSerializer(serializers.ModelSerializer):
         return Creator.objects.create_user(**validated_data)
 
 # --- Profile ---
-class CreatorProfileSerializer(serializers.ModelSerializer):
+class CreatorProfileSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = CreatorProfile
         fields = [
@@ -29,7 +46,7 @@ class CreatorProfileSerializer(serializers.ModelSerializer):
         ]
 
 # --- Main User ---
-class CreatorSerializer(serializers.ModelSerializer):
+class CreatorSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     profile = CreatorProfileSerializer(read_only=True)
     
     # We'll include the active campaign status here for easy frontend access
@@ -40,31 +57,119 @@ class CreatorSerializer(serializers.ModelSerializer):
         model = Creator
         fields = ['id', 'username', 'email', 'profile', 'active_campaign', 'submission_status']
 
+    def _active_campaign(self):
+        # Both method fields need it; resolve once per serializer.
+        # Async views pass it in the context instead.
+        if 'active_campaign' in self.context:
+            return self.context['active_campaign']
+        if not hasattr(self, '_active_campaign_data'):
+            self._active_campaign_data = get_active_campaign_data()
+        return self._active_campaign_data
+
     def get_active_campaign(self, obj):
         # Logic: Get the most recent active campaign
-        campaign = Campaign.objects.filter(is_active=True).first()
-        if campaign:
-            return CampaignSerializer(campaign).data
-        return None
+        return self._active_campaign()
+
     def get_submission_status(self, obj):
-        campaign = Campaign.objects.filter(is_active=True).first()
+        if 'submission_status' in self.context:
+            return self.context['submission_status']
+        campaign = self._active_campaign()
         if not campaign:
             return "no_campaign"
 
-        submission = ContentSubmission.objects.filter(creator=obj, campaign=campaign).first()
-        
-        if submission:
-            return submission.status # Returns 'pending', 'approved', or 'rejected'
-        return "pending_upload" # Default if no submission found
+        # Returns 'pending', 'approved', or 'rejected'; default if no submission found
+        return submission_status_queryset(obj, campaign).first() or "pending_upload"
 
 # --- Campaign ---
-class CampaignSerializer(serializers.ModelSerializer):
+class CampaignSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     class Meta:
         model = Campaign
         fields = '__all__'
 
+class CampaignSummarySerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    class Meta:
+        model = Campaign
+        fields = ['id', 'title', 'phase', 'cover_image', 'deadline', 'compensation_rate']
+
 # --- Submissions ---
-class ContentSubmissionSerializer(serializers.ModelSerializer):
+class ContentSubmissionSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    # Embedded so the frontend doesn't need a follow-up call per campaign
+    campaign_detail = CampaignSummarySerializer(source='campaign', read_only=True)
+
     class Meta:
         model = ContentSubmission
-        fields = '__all__'
\ No newline at end of file
+        fields = '__all__'
+        read_only_fields = [
+            # Set by staff review only (and approval books a payout, see api/payouts.py)
+            'status', 'feedback',
+            # Written by the media worker (api/media.py); reviewers rely on them
+            'media_size', 'media_duration', 'media_width', 'media_height',
+            'preview_blob', 'media_processed_at',
+        ]
+
+
+# Read-only list responses, rendered straight from .values() rows
+campaign_rows = FastSerializer(CampaignSerializer)
+submission_rows = FastSerializer(ContentSubmissionSerializer)
+
+
+class BulkReviewSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False, max_length=MAX_REVIEW_BATCH)
+    status = serializers.ChoiceField(choices=ContentSubmission.STATUS_CHOICES)
+    feedback = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+
+def submission_status_queryset(creator, campaign_data):
+    # Latest submission wins, in the same order as the dashboard (api/dashboard.py)
+    return ContentSubmission.objects.filter(
+        creator=creator, campaign_id=campaign_data['id']
+    ).order_by('-created_at', '-id').values_list('status', flat=True)
+
+
+def active_campaigns_queryset():
+    return Campaign.objects.filter(is_active=True).order_by('-created_at', '-pk')
+
+
+def campaign_list_payload(rows):
+    """
+    (strong ETag, serialized data) for a list of campaign_rows rows.
+    """
+    data = campaign_rows.serialize(rows)
+    body = json.dumps(data, cls=JSONEncoder, sort_keys=True).encode()
+    return f'"{hashlib.sha1(body).hexdigest()}"', data
+
+
+def get_active_campaign_data():
+    """
+    Serialized active campaign (or None), cached until any Campaign changes.
+    """
+    def build():
+        campaign = Campaign.objects.filter(is_active=True).order_by('pk').first()
+        return CampaignSerializer(campaign).data if campaign else None
+
+    return get_or_build('campaigns', 'active', build)
+
+
+async def aget_active_campaign_data():
+    async def build():
+        campaign = await Campaign.objects.filter(is_active=True).order_by('pk').afirst()
+        return CampaignSerializer(campaign).data if campaign else None
+
+    return await aget_or_build('campaigns', 'active', build)
+
+
+def get_campaign_list_data():
+    """
+    Serialized active campaigns plus a strong ETag of the payload,
+    cached until any Campaign changes.
+    """
+    return get_or_build(
+        'campaigns', 'list', lambda: campaign_list_payload(campaign_rows.values(active_campaigns_queryset()))
+    )
+
+
+async def aget_campaign_list_data():
+    async def build():
+        return campaign_list_payload([row async for row in campaign_rows.values(active_campaigns_queryset())])
+
+    return await aget_or_build('campaigns', 'list', build)
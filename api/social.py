@@ -0,0 +1,157 @@
+"""
+Normalized social handles.
+
+CreatorProfile.social_links is free-form JSON ({'tiktok': '@name', ...}),
+which can't be indexed. SocialHandle mirrors it as (creator, platform,
+handle) rows. The post_save handler below resyncs them whenever
+social_links is saved, from the profile API or the admin. "Who owns
+@name", "everyone on TikTok" and duplicate-handle reports are then
+index lookups instead of a scan of every profile's JSON.
+"""
+from urllib.parse import urlsplit
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import CreatorProfile, SocialHandle
+
+PLATFORM_MAX_LENGTH = SocialHandle._meta.get_field('platform').max_length
+HANDLE_MAX_LENGTH = SocialHandle._meta.get_field('handle').max_length
+
+
+# --- Normalizing ----------------------------------------------------------------
+
+def normalize_platform(platform):
+    return str(platform).strip().lower()
+
+
+def normalize_handle(value):
+    """
+    '@Name', 'name' and 'https://www.tiktok.com/@Name/' all become 'name'.
+    In a profile URL the handle is the '@' segment, else the first one
+    ('youtube.com/@Name/videos', 'instagram.com/name/').
+    """
+    value = str(value).strip()
+    if '/' in value:
+        parsed = urlsplit(value if '//' in value else f'//{value}')
+        segments = [segment for segment in parsed.path.split('/') if segment]
+        value = next((segment for segment in segments if segment.startswith('@')), segments[0] if segments else '')
+    return value.lstrip('@').lower()
+
+
+def handles_from_links(social_links):
+    """
+    {platform: handle} for the usable entries of a social_links value.
+    """
+    if not isinstance(social_links, dict):
+        return {}
+    handles = {}
+    for platform, value in social_links.items():
+        if not isinstance(value, str):
+            continue
+        platform, handle = normalize_platform(platform), normalize_handle(value)
+        if platform and handle and len(platform) <= PLATFORM_MAX_LENGTH and len(handle) <= HANDLE_MAX_LENGTH:
+            handles[platform] = handle
+    return handles
+
+
+# --- Syncing ----------------------------------------------------------------------
+
+def sync_handles(links_by_creator):
+    """
+    Make SocialHandle match {creator id: social_links} for these creators.
+    Unchanged rows are left alone.
+    """
+    wanted = {
+        (creator_id, platform): handle
+        for creator_id, links in links_by_creator.items()
+        for platform, handle in handles_from_links(links).items()
+    }
+    with transaction.atomic():
+        existing = {
+            (creator_id, platform): (pk, handle)
+            for pk, creator_id, platform, handle in (
+                SocialHandle.objects.filter(creator_id__in=links_by_creator)
+                .values_list('pk', 'creator_id', 'platform', 'handle')
+            )
+        }
+        stale = [pk for key, (pk, handle) in existing.items() if wanted.get(key) != handle]
+        if stale:
+            SocialHandle.objects.filter(pk__in=stale).delete()
+        SocialHandle.objects.bulk_create([
+            SocialHandle(creator_id=creator_id, platform=platform, handle=handle)
+            for (creator_id, platform), handle in wanted.items()
+            if existing.get((creator_id, platform), (None, None))[1] != handle
+        ])
+
+
+@receiver(post_save, sender=CreatorProfile)
+def sync_profile_handles(sender, instance, created, **kwargs):
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and 'social_links' not in update_fields:
+        return
+    if created and not instance.social_links:
+        return
+    sync_handles({instance.creator_id: instance.social_links})
+
+
+# --- Lookups ----------------------------------------------------------------------
+
+def find_owners(handle, platform=None):
+    """
+    Creators using `handle` (on `platform`, or on any platform).
+    """
+    queryset = SocialHandle.objects.filter(handle=normalize_handle(handle))
+    if platform:
+        queryset = queryset.filter(platform=normalize_platform(platform))
+    return list(
+        queryset.order_by('platform', 'creator_id')
+        .values('platform', 'handle', 'creator_id', username=F('creator__username'), email=F('creator__email'))
+    )
+
+
+def creators_on_platform(platform, after=None, after_creator=None, limit=100):
+    """
+    A page of a platform's handles in (handle, creator) order; pass the
+    last row's handle and creator_id as `after` / `after_creator` for the
+    next page. Served by the (platform, handle) index.
+    """
+    queryset = SocialHandle.objects.filter(platform=normalize_platform(platform))
+    if after:
+        after = normalize_handle(after)
+        # Several creators can share a handle, so the cursor needs both
+        following = Q(handle__gt=after)
+        if after_creator is not None:
+            following |= Q(handle=after, creator_id__gt=after_creator)
+        queryset = queryset.filter(following)
+    return list(
+        queryset.order_by('handle', 'creator_id')
+        .values('platform', 'handle', 'creator_id', username=F('creator__username'), email=F('creator__email'))[:limit]
+    )
+
+
+def platform_counts():
+    """
+    {platform: number of creators with a handle there}, from the index.
+    """
+    return dict(
+        SocialHandle.objects.order_by('platform').values('platform')
+        .annotate(n=Count('id')).values_list('platform', 'n')
+    )
+
+
+def duplicate_handles(platform=None, limit=100):
+    """
+    Handles claimed by more than one creator on the same platform.
+    """
+    queryset = SocialHandle.objects.all()
+    if platform:
+        queryset = queryset.filter(platform=normalize_platform(platform))
+    duplicates = (
+        queryset.order_by().values('platform', 'handle')
+        .annotate(creators=Count('creator_id')).filter(creators__gt=1)
+        .order_by('-creators', 'platform', 'handle')[:limit]
+    )
+    return list(duplicates)
@@ -1,3 +1,549 @@
-from django.test import TestCase
+import datetime
+import io
+import json
+import tempfile
+from unittest import mock
+from decimal import Decimal
+from pathlib import Path
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.admin.sites import site
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+from rest_framework.test import APIClient
+from rest_framework.utils.encoders import JSONEncoder
+
+from .admin import SubmissionAdmin
+from .counters import campaign_progress, reconcile_chunk
+from .dashboard import dashboard_payload
+from .media import POSTER_SIZE, analyse
+from .models import Campaign, ContentSubmission, Creator, CreatorProfile, InviteCode, PayoutEntry, UploadSession
+from .money import parse_amount
+from .payouts import mark_paid, payout_report
+from .reviews import bulk_review
+from .routers import is_pinned
+from .serializers import CampaignSerializer, ContentSubmissionSerializer, campaign_rows, submission_rows
+from .social import normalize_handle
+from .throttling import _local
+from .uploads import LocalUploadBackend, complete_session, purge_expired_sessions
+
+
+def writes(queries, table):
+    return [
+        q['sql'] for q in queries
+        if q['sql'].startswith(('INSERT', 'UPDATE', 'DELETE')) and f'"{table}"' in q['sql']
+    ]
+
+
+class LoginWriteTests(TestCase):
+    def setUp(self):
+        self.creator = Creator.objects.create_user('sarah@example.com', 'sarah', 'Str0ng-pass!')
+        self.client = APIClient()
+
+    # Not override_settings: simplejwt's serializers keep the api_settings they imported
+    @mock.patch('rest_framework_simplejwt.serializers.api_settings.UPDATE_LAST_LOGIN', True)
+    def test_jwt_login_only_updates_last_login(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                '/api/auth/login/',
+                {'email': 'sarah@example.com', 'password': 'Str0ng-pass!'},
+                format='json'
+            )
+        self.assertEqual(response.status_code, 200)
+
+        creator_writes = writes(queries, 'api_creator')
+        self.assertEqual(len(creator_writes), 1)
+        self.assertIn('SET "last_login"', creator_writes[0])
+        self.assertNotIn('"password"', creator_writes[0])
+        self.assertEqual(writes(queries, 'api_creatorprofile'), [])
+
+    def test_session_login_skips_profile_save(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(self.client.login(email='sarah@example.com', password='Str0ng-pass!'))
+
+        self.assertEqual(len(writes(queries, 'api_creator')), 1)
+        self.assertEqual(writes(queries, 'api_creatorprofile'), [])
+
+
+class LoginThrottleTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        # Blocked keys are also remembered in-process
+        _local.blocked.clear()
+        self.addCleanup(_local.blocked.clear)
+        self.addCleanup(cache.clear)
+        Creator.objects.create_user('sarah@example.com', 'sarah', 'Str0ng-pass!')
+        self.client = APIClient()
+
+    def login(self, email, password='wrong'):
+        return self.client.post('/api/auth/login/', {'email': email, 'password': password}, format='json')
+
+    def test_email_locked_out_after_limit(self):
+        # login_email allows 5 a minute
+        for _ in range(5):
+            self.assertEqual(self.login('sarah@example.com').status_code, 401)
+
+        with mock.patch.object(Creator, 'check_password') as check_password:
+            response = self.login('Sarah@example.com', 'Str0ng-pass!')
+        self.assertEqual(response.status_code, 429)
+        self.assertGreater(int(response['Retry-After']), 0)
+        # Rejected before any password hashing
+        check_password.assert_not_called()
+
+        # Other accounts from the same address still get through
+        self.assertEqual(self.login('other@example.com').status_code, 401)
+
+    @override_settings(REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK,
+        'DEFAULT_THROTTLE_RATES': {**settings.REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'], 'login_ip': '3/min'},
+    })
+    def test_ip_locked_out_across_emails(self):
+        for number in range(3):
+            self.assertEqual(self.login(f'user{number}@example.com').status_code, 401)
+
+        response = self.login('sarah@example.com', 'Str0ng-pass!')
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+
+
+class DirtyFieldsTests(TestCase):
+    def setUp(self):
+        self.creator = Creator.objects.create_user('sarah@example.com', 'sarah', 'Str0ng-pass!')
+
+    def test_unchanged_save_writes_nothing(self):
+        profile = CreatorProfile.objects.get(creator=self.creator)
+        with CaptureQueriesContext(connection) as queries:
+            profile.save()
+        self.assertEqual(len(queries), 0)
+
+    def test_save_writes_only_changed_columns(self):
+        profile = CreatorProfile.objects.get(creator=self.creator)
+        profile.bio = 'Hello'
+        profile.social_links['tiktok'] = '@sarah'
+        with CaptureQueriesContext(connection) as queries:
+            profile.save()
+
+        [update] = writes(queries, 'api_creatorprofile')
+        self.assertIn('"bio"', update)
+        self.assertIn('"social_links"', update)
+        self.assertNotIn('"tier"', update)
+
+        profile.refresh_from_db()
+        self.assertEqual(profile.social_links, {'tiktok': '@sarah'})
+
+    def test_profile_edit_saved_through_creator(self):
+        creator = Creator.objects.select_related('profile').get(pk=self.creator.pk)
+        creator.username = 'sarah.m'
+        creator.profile.tier = 'Icon Tier'
+        with CaptureQueriesContext(connection) as queries:
+            creator.save()
+
+        self.assertEqual(len(writes(queries, 'api_creator')), 1)
+        [update] = writes(queries, 'api_creatorprofile')
+        self.assertIn('SET "tier"', update)
+        self.assertEqual(CreatorProfile.objects.get(creator=creator).tier, 'Icon Tier')
+
+    def test_profile_edit_saved_through_unchanged_creator(self):
+        creator = Creator.objects.select_related('profile').get(pk=self.creator.pk)
+        creator.profile.tier = 'Icon Tier'
+        with CaptureQueriesContext(connection) as queries:
+            creator.save()
+
+        self.assertEqual(writes(queries, 'api_creator'), [])
+        self.assertEqual(CreatorProfile.objects.get(creator=creator).tier, 'Icon Tier')
+
+    def test_save_after_delete_reinserts(self):
+        # As a plain save would, rather than failing the update_fields save
+        creator = Creator.objects.get(pk=self.creator.pk)
+        Creator.objects.filter(pk=creator.pk).delete()
+        creator.username = 'sarah.m'
+        creator.save()
+
+        self.assertEqual(Creator.objects.get(pk=creator.pk).username, 'sarah.m')
+
+
+class SubmissionCounterTests(TestCase):
+    def setUp(self):
+        self.creator = Creator.objects.create_user('sarah@example.com', 'sarah', 'Str0ng-pass!')
+        self.campaign = Campaign.objects.create(title='Face Set', description='Brief')
+
+    def submit(self, **fields):
+        return ContentSubmission.objects.create(
+            creator=self.creator, campaign=self.campaign, content_url='https://example.com/a.mp4', **fields
+        )
+
+    def test_counters_follow_saves_and_deletes(self):
+        submission = self.submit()
+        other = self.submit(platform='youtube')
+        submission.status = 'approved'
+        submission.save()
+        other.delete()
+
+        progress = campaign_progress(self.campaign)
+        self.assertEqual(progress['total'], 1)
+        self.assertEqual(progress['breakdown']['approved']['tiktok'], 1)
+        self.assertEqual(reconcile_chunk([self.campaign.pk], dry_run=True), {})
+
+    def test_stale_instance_saved_after_bulk_review(self):
+        submission = self.submit()
+        stale = ContentSubmission.objects.get(pk=submission.pk)
+        bulk_review([submission.pk], 'approved')
+
+        stale.status = 'rejected'
+        stale.save()
+
+        progress = campaign_progress(self.campaign)
+        self.assertEqual(progress['by_status'], {'pending': 0, 'approved': 0, 'rejected': 1})
+        self.assertEqual(reconcile_chunk([self.campaign.pk], dry_run=True), {})
+
+
+class NormalizeHandleTests(SimpleTestCase):
+    def test_handles_and_profile_urls(self):
+        cases = {
+            '@Name': 'name',
+            ' name ': 'name',
+            'https://www.tiktok.com/@Name/': 'name',
+            'https://www.youtube.com/@Name/videos': 'name',
+            'tiktok.com/@name/video/123': 'name',
+            'https://www.instagram.com/Name/': 'name',
+            'instagram.com/name/reels/': 'name',
+            'https://www.tiktok.com/': '',
+        }
+        for value, handle in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(normalize_handle(value), handle)
+
+
+class InviteImportTests(TestCase):
+    def test_csv_saved_by_excel_imports(self):
+        staff = Creator.objects.create_user('staff@example.com', 'staff', 'Str0ng-pass!', is_staff=True)
+        client = APIClient()
+        client.force_authenticate(staff)
+        upload = SimpleUploadedFile('invites.csv', 'email,first_name\r\nsarah@example.com,Sarah\r\n'.encode('utf-8-sig'))
+
+        response = client.post('/api/invites/import/', {'file': upload}, format='multipart')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data['created'], response.data['errors']), (1, []))
+        self.assertTrue(InviteCode.objects.filter(email='sarah@example.com').exists())
+
+
+class PayoutTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.creator = Creator.objects.create_user('sarah@example.com', 'sarah', 'Str0ng-pass!')
+        self.face = Campaign.objects.create(title='Face Set', description='', compensation_rate='$1,500')
+        self.mind = Campaign.objects.create(title='Mind Set', description='', compensation_rate='2.5k')
+
+    def submit(self, campaign):
+        return ContentSubmission.objects.create(
+            creator=self.creator, campaign=campaign, content_url='https://example.com/a.mp4'
+        )
+
+    def test_parse_amount(self):
+        cases = {
+            '$1,500': Decimal('1500.00'),
+            '$100.00': Decimal('100.00'),
+            '2.5k': Decimal('2500.00'),
+            'USD 99.999': Decimal('100.00'),
+            '$1,000 - $2,000': None,
+            'TBD': None,
+            '': None,
+            None: None,
+            '$99,999,999,999': None,
+        }
+        for text, amount in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(parse_amount(text), amount)
+
+    def test_creator_cannot_approve_own_submission(self):
+        client = APIClient()
+        client.force_authenticate(self.creator)
+        response = client.post('/api/submissions/', {
+            'creator': self.creator.pk, 'campaign': self.face.pk, 'content_url': 'https://example.com/a.mp4',
+            'status': 'approved', 'feedback': 'Looks great',
+        }, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['status'], 'pending')
+        self.assertIsNone(response.data['feedback'])
+        self.assertFalse(PayoutEntry.objects.exists())
+
+    def test_ledger_follows_reviews(self):
+        submission = self.submit(self.face)
+        bulk_review([submission.pk], 'approved')
+        self.assertEqual(PayoutEntry.objects.get(submission=submission).amount, Decimal('1500.00'))
+
+        bulk_review([submission.pk], 'rejected')
+        self.assertFalse(PayoutEntry.objects.exists())
+
+        bulk_review([submission.pk], 'approved')
+        mark_paid(PayoutEntry.objects.all())
+        bulk_review([submission.pk], 'rejected')
+        self.assertTrue(PayoutEntry.objects.filter(submission=submission, paid_at__isnull=False).exists())
+
+    def test_personalized_amount_wins(self):
+        profile = CreatorProfile.objects.get(creator=self.creator)
+        profile.personalized_compensation = '$2,000'
+        profile.save()
+        submission = self.submit(self.face)
+        bulk_review([submission.pk], 'approved')
+        self.assertEqual(PayoutEntry.objects.get(submission=submission).amount, Decimal('2000.00'))
+
+    def test_admin_campaign_change_moves_unpaid_entry(self):
+        submission = self.submit(self.face)
+        bulk_review([submission.pk], 'approved')
+
+        submission.refresh_from_db()
+        submission.campaign = self.mind
+        SubmissionAdmin(ContentSubmission, site).save_model(None, submission, None, True)
+
+        entry = PayoutEntry.objects.get(submission=submission)
+        self.assertEqual((entry.campaign_id, entry.amount), (self.mind.pk, Decimal('2500.00')))
+
+    def test_report_totals(self):
+        submissions = [self.submit(self.face), self.submit(self.face), self.submit(self.mind)]
+        with self.captureOnCommitCallbacks(execute=True):
+            bulk_review([submission.pk for submission in submissions], 'approved')
+            mark_paid(PayoutEntry.objects.filter(submission=submissions[0]))
+
+        rows = {row['campaign_title']: row for row in payout_report(groups=('campaign',))}
+        self.assertEqual(rows['Face Set']['total'], '3000.00')
+        self.assertEqual(rows['Face Set']['paid'], '1500.00')
+        self.assertEqual(rows['Face Set']['entries'], 2)
+        self.assertEqual(rows['Mind Set']['total'], '2500.00')
+        self.assertEqual(rows['Mind Set']['paid'], '0.00')
+        [overall] = payout_report(groups=())
+        self.assertEqual(overall['total'], '5500.00')
+
+
+class MediaTests(TestCase):
+    def setUp(self):
+        self.creator = Creator.objects.create_user('sarah@example.com', 'sarah', 'Str0ng-pass!')
+
+    def test_creator_cannot_write_media_metadata(self):
+        client = APIClient()
+        client.force_authenticate(self.creator)
+        response = client.post('/api/submissions/', {
+            'creator': self.creator.pk, 'content_url': 'https://example.com/a.mp4',
+            'media_size': 1, 'media_duration': 1.0, 'media_width': 1, 'media_height': 1,
+            'preview_blob': 'a' * 64, 'media_processed_at': '2026-01-01T00:00:00Z',
+        }, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        submission = ContentSubmission.objects.get(pk=response.data['id'])
+        self.assertEqual(
+            [submission.media_size, submission.media_duration, submission.media_width,
+             submission.media_height, submission.preview_blob, submission.media_processed_at],
+            [None] * 6,
+        )
+
+    def test_image_size_is_the_original(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = Path(root) / 'large.jpg'
+            Image.new('RGB', (4000, 3000), 'pink').save(path, 'JPEG')
+            info, poster = analyse(path, 'image')
+
+        self.assertEqual((info['width'], info['height']), (4000, 3000))
+        with Image.open(io.BytesIO(poster)) as image:
+            self.assertEqual(image.size, (POSTER_SIZE, POSTER_SIZE * 3 // 4))
+
+
+class UploadTests(TestCase):
+    def setUp(self):
+        root = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(override_settings(
+            UPLOADS={'BACKEND': 'api.uploads.LocalUploadBackend', 'OPTIONS': {'root': root}},
+            UPLOAD_CHUNK_SIZE=4,
+        ))
+        self.backend = LocalUploadBackend(root)
+        self.creator = Creator.objects.create_user('sarah@example.com', 'sarah', 'Str0ng-pass!')
+        self.client = APIClient()
+        self.client.force_authenticate(self.creator)
+        response = self.client.post('/api/uploads/', {
+            'filename': 'clip.mp4', 'size': 10, 'content_type': 'video/mp4',
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.session = UploadSession.objects.get(pk=response.data['id'])
+        self.targets = response.data['targets']
+
+    def put(self, url, body):
+        return self.client.generic('PUT', url, body, content_type='application/octet-stream')
+
+    def expire(self, **delta):
+        UploadSession.objects.filter(pk=self.session.pk).update(
+            expires_at=timezone.now() - datetime.timedelta(**delta)
+        )
+
+    def test_resume_lists_missing_chunks(self):
+        self.assertEqual([target['index'] for target in self.targets], [0, 1, 2])
+        self.assertEqual(self.put(self.targets[1]['url'], b'5678').status_code, 204)
+
+        response = self.client.get(f'/api/uploads/{self.session.pk}/')
+        self.assertEqual(response.data['received'], 1)
+        self.assertEqual([target['index'] for target in response.data['targets']], [0, 2])
+
+    def test_duplicate_and_concurrent_complete_create_one_submission(self):
+        for target, body in zip(self.targets, (b'1234', b'5678', b'90')):
+            self.assertEqual(self.put(target['url'], body).status_code, 204)
+        # Loaded before either complete commits, as a second request would be
+        racing = UploadSession.objects.get(pk=self.session.pk)
+
+        first = self.client.post(f'/api/uploads/{self.session.pk}/complete/')
+        again = self.client.post(f'/api/uploads/{self.session.pk}/complete/')
+        self.assertEqual((first.status_code, again.status_code), (201, 201))
+        self.assertEqual(first.data['id'], again.data['id'])
+
+        self.assertEqual(complete_session(racing, backend=self.backend).pk, first.data['id'])
+        self.assertEqual(ContentSubmission.objects.filter(creator=self.creator).count(), 1)
+
+        # Chunks are refused once the session is complete
+        self.assertEqual(self.put(self.targets[0]['url'], b'1234').status_code, 410)
+        self.assertEqual(self.client.get(f'/api/uploads/{self.session.pk}/').status_code, 410)
+
+    def test_bad_signature_is_refused(self):
+        url = self.targets[0]['url']
+        token = url.rstrip('/').rsplit('/', 1)[-1]
+        forged = url.replace(token, token[:-1] + ('A' if token[-1] != 'A' else 'B'))
+        self.assertEqual(self.put(forged, b'1234').status_code, 403)
+        self.assertEqual(self.backend.received(self.session), set())
+
+    def test_expired_session_is_refused_and_purged(self):
+        self.assertEqual(self.put(self.targets[0]['url'], b'1234').status_code, 204)
+        self.expire(seconds=1)
+
+        self.assertEqual(self.put(self.targets[1]['url'], b'5678').status_code, 410)
+        self.assertEqual(self.client.get(f'/api/uploads/{self.session.pk}/').status_code, 410)
+        self.assertEqual(self.client.post(f'/api/uploads/{self.session.pk}/complete/').status_code, 409)
+
+        # Kept through the grace period, then deleted with its chunks
+        self.assertEqual(purge_expired_sessions(self.backend), 0)
+        self.expire(hours=2)
+        self.assertEqual(purge_expired_sessions(self.backend), 1)
+        self.assertFalse(UploadSession.objects.filter(pk=self.session.pk).exists())
+        self.assertFalse(self.backend.session_dir(self.session).exists())
+
+
+class DashboardTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.creator = Creator.objects.create_user('sarah@example.com', 'sarah', 'Str0ng-pass!')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.active = Campaign.objects.create(title='Face Set', description='')
+            self.other = Campaign.objects.create(title='Mind Set', description='', is_active=False)
+
+    def test_submission_moved_off_the_active_campaign(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            submission = ContentSubmission.objects.create(
+                creator=self.creator, campaign=self.active, content_url='https://example.com/a.mp4'
+            )
+        self.assertEqual(dashboard_payload(self.creator)['submission_status'], 'pending')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            submission.campaign = self.other
+            submission.save()
+
+        payload = dashboard_payload(self.creator)
+        self.assertEqual(payload['submission_status'], 'pending_upload')
+        self.assertIsNone(payload['latest_submission'])
+
+
+class FastSerializerParityTests(TestCase):
+    def setUp(self):
+        self.creator = Creator.objects.create_user('sarah@example.com', 'sarah', 'Str0ng-pass!')
+        # Campaign caches are invalidated on commit, which TestCase never reaches
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign = Campaign.objects.create(
+                title='Face Set', description='Brief', compensation_rate='$1,250.5',
+                deadline=datetime.date(2026, 3, 1), cover_image='https://example.com/cover.jpg',
+            )
+            Campaign.objects.create(title='Mind Set', description='', compensation_rate='TBD', is_active=False)
+        ContentSubmission.objects.create(
+            creator=self.creator, campaign=self.campaign, content_url='https://example.com/a.mp4',
+            platform='tiktok', status='approved', feedback='Great', media_size=10 ** 10,
+            media_duration=12.75, media_width=1080, media_height=1920,
+        )
+        ContentSubmission.objects.create(
+            creator=self.creator, campaign=None, content_url='https://example.com/b.jpg', file_type='image',
+        )
+
+    def assertSameJSON(self, fast, drf):
+        # Same keys in the same order, same values once rendered
+        self.assertEqual(json.dumps(fast, cls=JSONEncoder), json.dumps(drf, cls=JSONEncoder))
+
+    def test_campaigns_match_model_serializer(self):
+        campaigns = Campaign.objects.order_by('pk')
+        self.assertSameJSON(
+            campaign_rows.serialize(campaign_rows.values(campaigns)),
+            CampaignSerializer(campaigns, many=True).data,
+        )
+
+    def test_submissions_match_model_serializer(self):
+        submissions = ContentSubmission.objects.order_by('pk')
+        fast = submission_rows.serialize(submission_rows.values(submissions))
+        self.assertSameJSON(fast, ContentSubmissionSerializer(submissions, many=True).data)
+        self.assertEqual(fast[0]['campaign_detail']['title'], 'Face Set')
+        self.assertIsNone(fast[1]['campaign_detail'])
+
+    def test_list_views_match_model_serializer(self):
+        client = APIClient()
+        client.force_authenticate(self.creator)
+
+        response = client.get('/api/submissions/')
+        self.assertEqual(response.status_code, 200)
+        submissions = ContentSubmission.objects.order_by('-created_at', '-id')
+        self.assertSameJSON(response.data['results'], ContentSubmissionSerializer(submissions, many=True).data)
+
+        response = client.get('/api/campaigns/')
+        self.assertEqual(response.status_code, 200)
+        campaigns = Campaign.objects.filter(is_active=True).order_by('-created_at', '-pk')
+        self.assertSameJSON(response.data, CampaignSerializer(campaigns, many=True).data)
+
+
+@override_settings(DATABASE_REPLICAS=['test_replica'])
+class ReplicaRoutingTests(TestCase):
+    # Two databases: the replica only sees what a test copies onto it, like one lagging behind
+    databases = {'default', 'test_replica'}
+
+    def setUp(self):
+        cache.clear()
+        self.creator = Creator.objects.create_user('sarah@example.com', 'sarah', 'Str0ng-pass!')
+        Creator.objects.using('test_replica').bulk_create([
+            Creator(pk=self.creator.pk, email=self.creator.email, username=self.creator.username)
+        ])
+        ContentSubmission.objects.using('test_replica').bulk_create([
+            ContentSubmission(creator_id=self.creator.pk, content_url='https://example.com/replica.mp4')
+        ])
+        self.client = APIClient()
+        self.client.force_authenticate(self.creator)
+
+    def listed(self):
+        response = self.client.get('/api/submissions/')
+        self.assertEqual(response.status_code, 200)
+        return [row['content_url'] for row in response.data['results']]
+
+    def test_reads_use_the_replica(self):
+        self.assertEqual(self.listed(), ['https://example.com/replica.mp4'])
+        self.assertFalse(is_pinned(self.creator))
+
+    def test_writes_use_the_primary_and_pin_reads_to_it(self):
+        response = self.client.post('/api/submissions/', {
+            'creator': self.creator.pk, 'content_url': 'https://example.com/new.mp4',
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(ContentSubmission.objects.using('default').filter(pk=response.data['id']).exists())
+        self.assertFalse(
+            ContentSubmission.objects.using('test_replica').filter(content_url='https://example.com/new.mp4').exists()
+        )
+
+        # Pinned: the next read sees the write, not the lagging replica
+        self.assertTrue(is_pinned(self.creator))
+        self.assertEqual(self.listed(), ['https://example.com/new.mp4'])
+
+        cache.clear()
+        self.assertEqual(self.listed(), ['https://example.com/replica.mp4'])
@@ -0,0 +1,219 @@
+"""
+Sliding-window throttles for the unauthenticated auth endpoints.
+
+Each throttle counts requests per identifier (client IP, or a request
+field such as the email or invite code) in fixed buckets and estimates
+the sliding window as `previous * overlap + current`. Counters live in the
+shared Django cache so every worker sees the same totals; keys that are
+already over the limit are also remembered in-process so repeat offenders
+are rejected without a cache round-trip.
+
+Rates come from REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] by scope.
+"""
+import hashlib
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.core.cache import cache
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+# How often each process pushes its decision counters to the shared cache
+STATS_FLUSH_INTERVAL = 10
+STATS_KEY = 'api:throttle:stats'
+
+# Bound on in-process blocked keys before expired ones are pruned
+MAX_LOCAL_BLOCKS = 10000
+
+
+def parse_rate(rate):
+    """
+    '5/min' -> (5, 60)
+    """
+    num, period = rate.split('/')
+    return int(num), PERIODS[period[0]]
+
+
+class _LocalState:
+    """
+    Per-process fast path (blocked keys) and pending stats deltas.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.blocked = {}
+        self.stats = Counter()
+        self.last_flush = time.monotonic()
+
+    def blocked_until(self, key, now):
+        until = self.blocked.get(key)
+        if until is None:
+            return None
+        if until <= now:
+            with self.lock:
+                self.blocked.pop(key, None)
+            return None
+        return until
+
+    def block(self, key, until, now):
+        with self.lock:
+            if len(self.blocked) >= MAX_LOCAL_BLOCKS:
+                self.blocked = {k: v for k, v in self.blocked.items() if v > now}
+            self.blocked[key] = until
+
+    def record(self, scope, outcome):
+        with self.lock:
+            self.stats[f'{scope}:{outcome}'] += 1
+            due = time.monotonic() - self.last_flush >= STATS_FLUSH_INTERVAL
+            if not due:
+                return
+            pending, self.stats = self.stats, Counter()
+            self.last_flush = time.monotonic()
+        flush_stats(pending)
+
+
+_local = _LocalState()
+
+
+def flush_stats(pending=None):
+    """
+    Add this process's pending counters to the shared totals.
+    """
+    if pending is None:
+        with _local.lock:
+            pending, _local.stats = _local.stats, Counter()
+    for name, count in pending.items():
+        key = f'{STATS_KEY}:{name}'
+        cache.add(key, 0, timeout=None)
+        try:
+            cache.incr(key, count)
+        except ValueError:
+            cache.set(key, count, timeout=None)
+    if pending:
+        names = set(cache.get(STATS_KEY) or ()) | set(pending)
+        cache.set(STATS_KEY, sorted(names), timeout=None)
+
+
+def get_stats():
+    """
+    Shared counters, e.g. {'login_ip:allowed': 120, 'login_email:rejected': 4}.
+    """
+    flush_stats()
+    names = cache.get(STATS_KEY) or []
+    values = cache.get_many([f'{STATS_KEY}:{name}' for name in names])
+    return {name: values.get(f'{STATS_KEY}:{name}', 0) for name in names}
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    """
+    Throttle keyed by client IP, or by `field` from the request body if set.
+    Requests without that field are not counted by field throttles.
+    """
+    scope = None
+    field = None
+
+    def __init__(self):
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+        self.num_requests, self.duration = parse_rate(rate) if rate else (None, None)
+        self.retry_after = None
+
+    def get_ident_value(self, request):
+        if self.field is None:
+            return self.get_ident(request)
+        value = request.data.get(self.field) if hasattr(request.data, 'get') else None
+        if not isinstance(value, str) or not value.strip():
+            return None
+        return value.strip().lower()
+
+    def cache_key(self, ident):
+        digest = hashlib.sha1(ident.encode()).hexdigest()[:20]
+        return f'api:throttle:{self.scope}:{digest}'
+
+    def allow_request(self, request, view):
+        if self.num_requests is None:
+            return True
+        ident = self.get_ident_value(request)
+        if ident is None:
+            return True
+
+        key = self.cache_key(ident)
+        now = time.time()
+
+        # Fast path: already over the limit in this process
+        until = _local.blocked_until(key, now)
+        if until is not None:
+            self.retry_after = until - now
+            _local.record(self.scope, 'rejected_local')
+            return False
+
+        bucket = int(now // self.duration)
+        current_key = f'{key}:{bucket}'
+        previous_key = f'{key}:{bucket - 1}'
+
+        cache.add(current_key, 0, timeout=self.duration * 2)
+        try:
+            current = cache.incr(current_key)
+        except ValueError:
+            # Evicted between add and incr
+            cache.set(current_key, 1, timeout=self.duration * 2)
+            current = 1
+        previous = cache.get(previous_key) or 0
+
+        overlap = 1 - (now % self.duration) / self.duration
+        if previous * overlap + current <= self.num_requests:
+            _local.record(self.scope, 'allowed')
+            return True
+
+        self.retry_after = self._retry_after(previous, current, now)
+        _local.block(key, now + self.retry_after, now)
+        _local.record(self.scope, 'rejected')
+        logger.warning('Throttled %s request (scope=%s)', request.path, self.scope)
+        return False
+
+    def _retry_after(self, previous, current, now):
+        elapsed = now % self.duration
+        # Room left in this bucket for one more request
+        allowance = self.num_requests - current - 1
+        if allowance >= 0 and previous:
+            # Wait for enough of the previous bucket to slide out of the window
+            return max(0, (1 - allowance / previous) * self.duration - elapsed)
+        # This bucket alone is over the limit: wait for the next one, then for this one to slide out
+        return (self.duration - elapsed) + self.duration * max(0, 1 - (self.num_requests - 1) / current)
+
+    def wait(self):
+        return self.retry_after
+
+
+# --- Auth endpoint throttles ---------------------------------------------------
+
+class LoginIPThrottle(SlidingWindowThrottle):
+    scope = 'login_ip'
+
+
+class LoginEmailThrottle(SlidingWindowThrottle):
+    scope = 'login_email'
+    field = 'email'
+
+
+class SignUpIPThrottle(SlidingWindowThrottle):
+    scope = 'signup_ip'
+
+
+class SignUpEmailThrottle(SlidingWindowThrottle):
+    scope = 'signup_email'
+    field = 'email'
+
+
+class InviteIPThrottle(SlidingWindowThrottle):
+    scope = 'invite_ip'
+
+
+class InviteCodeThrottle(SlidingWindowThrottle):
+    scope = 'invite_code'
+    field = 'code'
@@ -0,0 +1,71 @@
+"""
+On-disk thumbnail cache for verification images.
+
+Thumbnails are generated once per (blob key, size) and reused forever:
+the key is a content hash, so a cached file can never go stale.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .blobstore import get_blob_store, is_valid_key
+
+# Allowed edge lengths (px). Anything else is rejected so the cache stays bounded.
+THUMBNAIL_SIZES = (150, 600)
+DEFAULT_THUMBNAIL_SIZE = 150
+
+
+def thumbnail_root():
+    return Path(getattr(settings, 'THUMBNAIL_ROOT', os.path.join(settings.MEDIA_ROOT, 'thumbnails')))
+
+
+def thumbnail_path(key, size):
+    return thumbnail_root() / str(size) / key[:2] / f'{key}.jpg'
+
+
+def thumbnail_etag(key, size):
+    return f'"{key}-{size}"'
+
+
+def get_thumbnail(key, size=DEFAULT_THUMBNAIL_SIZE):
+    """
+    Return the path of the cached JPEG thumbnail, generating it if needed.
+    Raises FileNotFoundError for unknown blobs and ValueError for non-images.
+    """
+    if not is_valid_key(key):
+        raise ValueError(f'Invalid blob key: {key!r}')
+    if size not in THUMBNAIL_SIZES:
+        raise ValueError(f'Unsupported thumbnail size: {size}')
+
+    path = thumbnail_path(key, size)
+    if path.exists():
+        return path
+
+    store = get_blob_store()
+    if not store.exists(key):
+        raise FileNotFoundError(key)
+
+    try:
+        with store.open(key) as blob, Image.open(blob) as image:
+            image.draft('RGB', (size, size))  # cheap JPEG downscale on decode
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((size, size))
+            image = image.convert('RGB')
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.thumb-')
+            try:
+                with os.fdopen(fd, 'wb') as tmp:
+                    image.save(tmp, 'JPEG', quality=80, optimize=True)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+    except UnidentifiedImageError:
+        raise ValueError(f'Blob {key} is not an image')
+
+    # Atomic so concurrent requests never serve a half-written file
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,314 @@
+"""
+Resumable, chunked uploads of submission content straight to storage.
+
+1. POST /api/uploads/ opens a session and returns one signed PUT target per
+   chunk. Targets carry their own authorisation, so with an object-storage
+   backend they point at the bucket and the bytes never touch a worker.
+2. The client PUTs chunks in any order and retries any that fail.
+   GET /api/uploads/<id>/ lists the chunks still missing, with fresh targets.
+3. POST /api/uploads/<id>/complete/ assembles the object and creates the
+   ContentSubmission in one transaction. Completing twice is harmless.
+
+Chunks and targets are only accepted for open sessions that haven't expired.
+`manage.py purge_upload_sessions` (run it from cron) deletes expired
+sessions and their chunks.
+
+The backend is chosen by settings.UPLOADS. LocalUploadBackend is a disk
+stand-in whose targets are this app's own chunk endpoint; it streams every
+chunk and the assembled file in small pieces.
+"""
+import datetime
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core import signing
+from django.db import transaction
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .blobstore import CHUNK_SIZE, LocalBlobStore, is_valid_key
+from .models import Campaign, ContentSubmission, UploadSession
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_SIZE = 5 * 1024 ** 3
+DEFAULT_SESSION_TTL = 24 * 60 * 60
+# Lets a chunk PUT that started just before expiry finish before its chunks are purged
+PURGE_GRACE = datetime.timedelta(hours=1)
+PURGE_BATCH_SIZE = 500
+
+SIGNING_SALT = 'api.uploads.chunk'
+
+FILE_TYPES = {'video/': 'video', 'image/': 'image'}
+
+
+def session_ttl():
+    return getattr(settings, 'UPLOAD_SESSION_TTL', DEFAULT_SESSION_TTL)
+
+
+# --- Signed chunk targets -----------------------------------------------------
+
+def sign_chunk(session, index):
+    return signing.dumps({'s': str(session.pk), 'i': index}, salt=SIGNING_SALT)
+
+
+def unsign_chunk(token):
+    """
+    (session id, chunk index) from a chunk token. Raises
+    signing.BadSignature (or SignatureExpired) for bad or stale tokens.
+    """
+    data = signing.loads(token, salt=SIGNING_SALT, max_age=session_ttl())
+    return data['s'], data['i']
+
+
+# --- Backends ---------------------------------------------------------------
+
+class UploadBackend:
+    """
+    Where chunks go and how they become one object. An S3-style backend
+    would map sessions to multipart uploads and targets to presigned
+    UploadPart URLs.
+    """
+
+    def targets(self, session, indexes):
+        """List of {'index', 'method', 'url'} the client uploads chunks to."""
+        raise NotImplementedError
+
+    def received(self, session):
+        """Set of chunk indexes fully stored so far."""
+        raise NotImplementedError
+
+    def assemble(self, session):
+        """Join the chunks into the final object and return its URL."""
+        raise NotImplementedError
+
+    def discard(self, session):
+        """Drop any leftover chunks for the session."""
+        raise NotImplementedError
+
+    @contextmanager
+    def local_copy(self, url):
+        """
+        Yield a local file path for an object this backend stored, or None
+        for URLs it doesn't own (remote backends would download to a temp file).
+        """
+        yield None
+
+
+class LocalUploadBackend(UploadBackend):
+    """
+    Chunks under <root>/sessions/<id>/, finished files in a content-addressed
+    store under <root>/objects/ served from `base_url`.
+    """
+
+    def __init__(self, root=None, base_url=None):
+        self.root = Path(root or os.path.join(settings.MEDIA_ROOT, 'uploads'))
+        self.objects = LocalBlobStore(self.root / 'objects')
+        self.base_url = base_url or f'{settings.MEDIA_URL}uploads/objects/'
+
+    def session_dir(self, session):
+        return self.root / 'sessions' / str(session.pk)
+
+    def targets(self, session, indexes):
+        return [
+            {'index': index, 'method': 'PUT', 'url': reverse('upload_chunk', args=[sign_chunk(session, index)])}
+            for index in indexes
+        ]
+
+    def write_chunk(self, session, index, stream, length):
+        """
+        Copy `length` bytes from `stream` into place. Chunks are written to a
+        temp file and renamed, so a dropped connection never leaves a partial
+        chunk that counts as received.
+        """
+        if length != session.chunk_length(index):
+            raise ValueError(f"Chunk {index} must be {session.chunk_length(index)} bytes.")
+
+        directory = self.session_dir(session)
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.chunk-')
+        try:
+            written = 0
+            with os.fdopen(fd, 'wb') as tmp:
+                while written < length:
+                    piece = stream.read(min(CHUNK_SIZE, length - written))
+                    if not piece:
+                        break
+                    tmp.write(piece)
+                    written += len(piece)
+            if written != length:
+                raise ValueError(f"Chunk {index} ended after {written} of {length} bytes.")
+            os.replace(tmp_path, directory / f'{index:06d}')
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def received(self, session):
+        try:
+            names = os.listdir(self.session_dir(session))
+        except FileNotFoundError:
+            return set()
+        return {int(name) for name in names if name.isdigit()}
+
+    def _read_chunks(self, session):
+        directory = self.session_dir(session)
+        for index in range(session.chunk_count):
+            with open(directory / f'{index:06d}', 'rb') as chunk:
+                while piece := chunk.read(CHUNK_SIZE):
+                    yield piece
+
+    def assemble(self, session):
+        key = self.objects.save(self._read_chunks(session))
+        return f'{self.base_url}{key[:2]}/{key[2:4]}/{key}'
+
+    def discard(self, session):
+        shutil.rmtree(self.session_dir(session), ignore_errors=True)
+
+    @contextmanager
+    def local_copy(self, url):
+        path = urlparse(url or '').path
+        base = urlparse(self.base_url).path
+        key = path.rsplit('/', 1)[-1]
+        if path.startswith(base) and is_valid_key(key) and self.objects.exists(key):
+            yield self.objects.path(key)
+        else:
+            yield None
+
+
+def get_upload_backend():
+    """
+    Build the backend configured in settings.UPLOADS.
+    """
+    config = getattr(settings, 'UPLOADS', {})
+    backend = import_string(config.get('BACKEND', 'api.uploads.LocalUploadBackend'))
+    return backend(**config.get('OPTIONS', {}))
+
+
+# --- Sessions -----------------------------------------------------------------
+
+def open_session(creator, filename, size, content_type, campaign=None, platform='tiktok'):
+    """
+    Validate and create an upload session. Raises ValueError for bad input.
+    """
+    try:
+        size = int(size)
+    except (TypeError, ValueError):
+        raise ValueError("size must be a number of bytes.")
+    max_size = getattr(settings, 'UPLOAD_MAX_SIZE', DEFAULT_MAX_SIZE)
+    if not 0 < size <= max_size:
+        raise ValueError(f"size must be between 1 and {max_size} bytes.")
+    if not filename:
+        raise ValueError("filename is required.")
+
+    content_type = (content_type or '').lower()
+    file_type = next((kind for prefix, kind in FILE_TYPES.items() if content_type.startswith(prefix)), None)
+    if file_type is None:
+        raise ValueError("Only video and image uploads are supported.")
+    if platform not in dict(UploadSession._meta.get_field('platform').choices):
+        raise ValueError(f"Unknown platform: {platform}")
+    if campaign in (None, ''):
+        campaign = None
+    else:
+        try:
+            campaign = int(campaign)
+        except (TypeError, ValueError):
+            raise ValueError("campaign must be a campaign id.")
+        if not Campaign.objects.filter(pk=campaign, is_active=True).exists():
+            raise ValueError("campaign must be an active campaign.")
+
+    return UploadSession.objects.create(
+        creator=creator, campaign_id=campaign, platform=platform, file_type=file_type,
+        filename=os.path.basename(filename)[:255], content_type=content_type, size=size,
+        chunk_size=getattr(settings, 'UPLOAD_CHUNK_SIZE', DEFAULT_CHUNK_SIZE),
+        expires_at=timezone.now() + datetime.timedelta(seconds=session_ttl()),
+    )
+
+
+def check_open(session):
+    """
+    Raise ValueError unless chunks may still be uploaded to the session.
+    """
+    if session.status != 'open':
+        raise ValueError("Upload session is already complete.")
+    if session.expires_at <= timezone.now():
+        raise ValueError("Upload session has expired.")
+
+
+def session_state(session, backend=None):
+    """
+    What the client needs to (re)start uploading: missing chunks and targets.
+    """
+    state = {
+        'id': str(session.pk),
+        'status': session.status,
+        'size': session.size,
+        'chunk_size': session.chunk_size,
+        'chunk_count': session.chunk_count,
+        'expires_at': session.expires_at,
+        'submission': session.submission_id,
+    }
+    if session.status == 'open':
+        backend = backend or get_upload_backend()
+        missing = sorted(set(range(session.chunk_count)) - backend.received(session))
+        state['received'] = session.chunk_count - len(missing)
+        state['targets'] = backend.targets(session, missing)
+    return state
+
+
+def complete_session(session, request=None, backend=None):
+    """
+    Assemble the uploaded chunks and create the submission. The object is
+    written before the transaction; the session row is locked so concurrent
+    completes create exactly one submission.
+    """
+    if session.status == 'complete':
+        return session.submission
+    check_open(session)
+
+    backend = backend or get_upload_backend()
+    missing = set(range(session.chunk_count)) - backend.received(session)
+    if missing:
+        raise ValueError(f"{len(missing)} chunk(s) still missing.")
+
+    content_url = backend.assemble(session)
+    if request is not None:
+        content_url = request.build_absolute_uri(content_url)
+
+    with transaction.atomic():
+        locked = UploadSession.objects.select_for_update().get(pk=session.pk)
+        if locked.status == 'complete':
+            return locked.submission
+        submission = ContentSubmission.objects.create(
+            creator_id=locked.creator_id, campaign_id=locked.campaign_id,
+            content_url=content_url, file_type=locked.file_type, platform=locked.platform,
+        )
+        locked.status = 'complete'
+        locked.submission = submission
+        locked.save(update_fields=['status', 'submission'])
+        transaction.on_commit(lambda: backend.discard(locked))
+
+    session.status, session.submission = locked.status, submission
+    return submission
+
+
+def purge_expired_sessions(backend=None):
+    """
+    Delete open sessions that expired more than PURGE_GRACE ago, and their
+    chunks. Chunks go first, so a failed discard leaves the row for the
+    next run to retry. Returns the number of sessions deleted.
+    """
+    backend = backend or get_upload_backend()
+    cutoff = timezone.now() - PURGE_GRACE
+    purged = 0
+    while batch := list(UploadSession.objects.filter(status='open', expires_at__lt=cutoff)[:PURGE_BATCH_SIZE]):
+        for session in batch:
+            backend.discard(session)
+        UploadSession.objects.filter(pk__in=[session.pk for session in batch]).delete()
+        purged += len(batch)
+    return purged
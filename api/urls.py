@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import async_views, views
 
 urlpatterns = [
     # --- Test ---
@@ -7,18 +7,47 @@ urlpatterns = [
     
     # --- Auth ---
     path('auth/verify-invite/', views.VerifyInviteView.as_view(), name='verify_invite'),
+    path('invites/import/', views.InviteImportView.as_view(), name='invite_import'),
     path('auth/login/', views.CustomTokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('auth/signup/', views.SignUpView.as_view(), name='signup'),
     path('auth/me/', views.CurrentCreatorView.as_view(), name='current_user'),
+    path('auth/throttle-stats/', views.ThrottleStatsView.as_view(), name='throttle_stats'),
 
     # --- Dashboard / Profile ---
+    path('dashboard/', views.DashboardView.as_view(), name='dashboard'),
     path('profile/', views.CreatorProfileView.as_view(), name='profile'),
     # FIX: This line maps the frontend's API call to the backend view
     path('profile/verify/', views.SubmitVerificationView.as_view(), name='profile_verify'), 
+    path('profile/verify/thumbnails/<str:key>/', views.VerificationThumbnailView.as_view(), name='verification_thumbnail'),
+
+    # --- Staff search / lookups ---
+    path('creators/search/', views.CreatorSearchView.as_view(), name='creator_search'),
+    path('social-handles/', views.SocialHandleLookupView.as_view(), name='social_handles'),
+    path('social-handles/stats/', views.SocialHandleStatsView.as_view(), name='social_handle_stats'),
 
     #Campaign
     path('campaigns/', views.CampaignListView.as_view(), name='campaigns'),
+    path('campaigns/<int:campaign_id>/progress/', views.CampaignProgressView.as_view(), name='campaign_progress'),
 
     path('submissions/', views.SubmissionListView.as_view(), name='submissions'),
+    path('submissions/review/', views.SubmissionReviewView.as_view(), name='submission_review'),
+
+    # --- Finance ---
+    path('payouts/report/', views.PayoutReportView.as_view(), name='payout_report'),
+
+    # --- Resumable uploads ---
+    path('uploads/', views.UploadSessionView.as_view(), name='uploads'),
+    path('uploads/<uuid:session_id>/', views.UploadSessionDetailView.as_view(), name='upload_detail'),
+    path('uploads/<uuid:session_id>/complete/', views.UploadCompleteView.as_view(), name='upload_complete'),
+    path('uploads/chunks/<str:token>/', views.upload_chunk, name='upload_chunk'),
+
+    # --- Ops exports ---
+    path('exports/<slug:kind>.<slug:fmt>', views.ExportView.as_view(), name='export'),
+
+    # --- Async read path (ASGI) ---
+    path('async/auth/me/', async_views.current_creator, name='async_current_user'),
+    path('async/profile/', async_views.creator_profile, name='async_profile'),
+    path('async/campaigns/', async_views.campaign_list, name='async_campaigns'),
+    path('async/submissions/', async_views.submission_list, name='async_submissions'),
 
 ]
\ No newline at end of file
@@ -2,17 +2,76 @@ from rest_framework.decorators import api_view
 from rest_framework.response import Response
 from rest_framework import permissions, status
 from rest_framework.views import APIView
+from rest_framework.authentication import SessionAuthentication
+from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.views import TokenObtainPairView
-from .models import Campaign, ContentSubmission, InviteCode
+from django.core import signing
+from django.db import transaction
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from django.utils.http import parse_etags
+from .blobstore import store_upload
+from .counters import campaign_progress
+from .dashboard import dashboard_payload
+from .exports import CONTENT_TYPES as EXPORT_CONTENT_TYPES, export_rows, stream_export
+from .invites import FORMATS as INVITE_FORMATS, guess_format, import_invites, read_rows
+from .pagination import SubmissionCursorPagination
+from .payouts import REPORT_GROUPS, payout_report
+from .reviews import bulk_review
+from .routers import read_alias, use_replica
+from .social import creators_on_platform, duplicate_handles, find_owners, platform_counts
+from .search import DEFAULT_LIMIT as SEARCH_DEFAULT_LIMIT, MAX_LIMIT as SEARCH_MAX_LIMIT, search_creators
+from .throttling import (
+    InviteCodeThrottle,
+    InviteIPThrottle,
+    LoginEmailThrottle,
+    LoginIPThrottle,
+    SignUpEmailThrottle,
+    SignUpIPThrottle,
+    get_stats as get_throttle_stats
+)
+from .uploads import check_open, complete_session, get_upload_backend, open_session, session_state, unsign_chunk
+from .thumbnails import DEFAULT_THUMBNAIL_SIZE, get_thumbnail, thumbnail_etag
+from .models import Campaign, ContentSubmission, InviteCode, UploadSession
 from .serializers import (
+    BulkReviewSerializer,
     CreatorSignUpSerializer,
     CreatorSerializer,
     CreatorProfileSerializer,
-    CampaignSerializer,
-    ContentSubmissionSerializer
+    ContentSubmissionSerializer,
+    get_campaign_list_data,
+    submission_rows,
 )
+import io
 import json
 
+
+class ReplicaReadMixin:
+    """
+    Serve safe (GET/HEAD) requests from a read replica once the user is
+    authenticated, unless they wrote recently (see api/routers.py).
+    """
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in permissions.SAFE_METHODS:
+            use_replica(request.user)
+
+
+def etag_matches(request, etag):
+    """
+    True if the request's If-None-Match already names `etag`.
+    """
+    if_none_match = request.headers.get('If-None-Match')
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    return '*' in etags or etag in etags
+
+
 # --- Optional: Test Route ---------------------------------------------------
 
 @api_view(['GET'])
@@ -36,8 +95,9 @@ def get_routes(request):
 class CustomTokenObtainPairView(TokenObtainPairView):
     """
     JWT login. Accepts email + password.
+    Throttled per IP and per email before any password hashing runs.
     """
-    pass
+    throttle_classes = (LoginIPThrottle, LoginEmailThrottle)
 
 class VerifyInviteView(APIView):
     """
@@ -45,6 +105,7 @@ class VerifyInviteView(APIView):
     Returns the user's pre-filled details.
     """
     permission_classes = (permissions.AllowAny,)
+    throttle_classes = (InviteIPThrottle, InviteCodeThrottle)
 
     def post(self, request):
         code = request.data.get('code', '').strip().upper()
@@ -73,8 +134,44 @@ class VerifyInviteView(APIView):
             )
 
 
+class InviteImportView(APIView):
+    """
+    Staff only. Bulk-imports invites from an uploaded CSV or JSONL `file`.
+    Duplicates are reported per row instead of failing the import.
+    """
+    permission_classes = (permissions.IsAdminUser,)
+
+    def post(self, request):
+        upload = request.FILES.get('file')
+        if not upload:
+            return Response({"detail": "A CSV or JSONL file is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+        fmt = request.data.get('format') or guess_format(upload.name)
+        if fmt not in INVITE_FORMATS:
+            return Response({"detail": f"Unsupported format: {fmt}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # utf-8-sig drops the byte-order mark Excel puts before the header
+        stream = io.TextIOWrapper(upload, encoding='utf-8-sig', newline='')
+        try:
+            report = import_invites(read_rows(stream, fmt), tier=request.data.get('tier'))
+        except UnicodeDecodeError:
+            return Response({"detail": "File must be UTF-8."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report, status=status.HTTP_201_CREATED)
+
+
+class ThrottleStatsView(APIView):
+    """
+    Staff only. Allowed/rejected counters per throttle scope, for monitoring.
+    """
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request):
+        return Response(get_throttle_stats())
+
+
 class SignUpView(APIView):
     permission_classes = (permissions.AllowAny,)
+    throttle_classes = (SignUpIPThrottle, SignUpEmailThrottle)
 
     def post(self, request):
         # 1. We expect the code to be passed along with the signup data
@@ -103,7 +200,7 @@ class SignUpView(APIView):
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-class CurrentCreatorView(APIView):
+class CurrentCreatorView(ReplicaReadMixin, APIView):
     """
     Protected. Returns:
     - User info
@@ -116,6 +213,17 @@ class CurrentCreatorView(APIView):
         return Response(serializer.data)
 
 
+class DashboardView(APIView):
+    """
+    Everything the creator dashboard shows in one response, read from the
+    creator's denormalized snapshot.
+    """
+    permission_classes = (permissions.IsAuthenticated,)
+
+    def get(self, request):
+        return Response(dashboard_payload(request.user))
+
+
 # --- Profile + Verification --------------------------------------------------
 
 class CreatorProfileView(APIView):
@@ -148,7 +256,9 @@ class CreatorProfileView(APIView):
         )
 
         if serializer.is_valid():
-            serializer.save()
+            # The profile and its SocialHandle rows are saved together
+            with transaction.atomic():
+                serializer.save()
             return Response(serializer.data)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -191,10 +301,17 @@ class SubmitVerificationView(APIView):
         
         profile = request.user.profile
 
-        # Save image fields (base64 strings)
-        profile.id_front_image = request.data.get('id_front')
-        profile.id_back_image = request.data.get('id_back')
-        profile.selfie_image = request.data.get('selfie')
+        # Stream images (multipart files or base64 strings) into the blob store
+        # and keep only their content keys on the profile
+        try:
+            profile.id_front_blob = store_upload(request.data.get('id_front'))
+            profile.id_back_blob = store_upload(request.data.get('id_back'))
+            profile.selfie_blob = store_upload(request.data.get('selfie'))
+        except ValueError:
+            return Response(
+                {"detail": "Invalid image data."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
         # W9 data (stored encrypted — replace with real encryption later)
         w9_data = request.data.get('w9')
@@ -212,38 +329,81 @@ class SubmitVerificationView(APIView):
         )
 
 
+class VerificationThumbnailView(APIView):
+    """
+    Staff only. Serves a cached thumbnail of a verification image.
+    Thumbnails are keyed by content hash, so they can be cached forever.
+    """
+    # Session auth so <img> tags in the Django admin work
+    authentication_classes = (SessionAuthentication, JWTAuthentication)
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request, key):
+        try:
+            size = int(request.query_params.get('size', DEFAULT_THUMBNAIL_SIZE))
+        except ValueError:
+            raise Http404
+
+        etag = thumbnail_etag(key, size)
+        cache_control = 'private, max-age=31536000, immutable'
+        if etag_matches(request, etag):
+            response = HttpResponseNotModified()
+        else:
+            try:
+                path = get_thumbnail(key, size)
+            except (FileNotFoundError, ValueError):
+                raise Http404
+            response = FileResponse(open(path, 'rb'), content_type='image/jpeg')
+
+        response['ETag'] = etag
+        response['Cache-Control'] = cache_control
+        return response
+
+
 # --- Campaigns --------------------------------------------------------------
 
-class CampaignListView(APIView):
+class CampaignListView(ReplicaReadMixin, APIView):
     """
     Returns list of active campaigns.
     """
     permission_classes = (permissions.IsAuthenticated,)
 
     def get(self, request):
-        campaigns = Campaign.objects.filter(
-            is_active=True
-        ).order_by('-created_at')
+        etag, data = get_campaign_list_data()
+        if etag_matches(request, etag):
+            response = HttpResponseNotModified()
+        else:
+            response = Response(data)
 
-        serializer = CampaignSerializer(campaigns, many=True)
-        return Response(serializer.data)
+        response['ETag'] = etag
+        # Clients must revalidate, which is a cheap 304 when nothing changed
+        response['Cache-Control'] = 'private, no-cache'
+        return response
 
 
 # --- Submissions ------------------------------------------------------------
 
-class SubmissionListView(APIView):
+def paginated_submissions(request, view=None):
+    """
+    One cursor page of the creator's submissions (shared with the async view).
+    """
+    # Rows come back as dicts; the cursor reads created_at from them too
+    submissions = submission_rows.values(ContentSubmission.objects.filter(creator=request.user))
+
+    paginator = SubmissionCursorPagination()
+    page = paginator.paginate_queryset(submissions, request, view=view)
+    return paginator.get_paginated_response(submission_rows.serialize(page))
+
+
+class SubmissionListView(ReplicaReadMixin, APIView):
     """
-    List + create content submissions for logged-in creator.
+    List (cursor-paginated, newest first) + create content submissions
+    for logged-in creator.
     """
     permission_classes = (permissions.IsAuthenticated,)
 
     def get(self, request):
-        submissions = ContentSubmission.objects.filter(
-            creator=request.user
-        ).order_by('-created_at')
-
-        serializer = ContentSubmissionSerializer(submissions, many=True)
-        return Response(serializer.data)
+        return paginated_submissions(request, view=self)
 
     def post(self, request):
         data = request.data.copy()
@@ -253,4 +413,237 @@ class SubmissionListView(APIView):
             serializer.save(creator=request.user)
             return Response(serializer.data, status=status.HTTP_201_CREATED)
 
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+class SubmissionReviewView(APIView):
+    """
+    Staff only. Approve / request changes on many submissions at once:
+    {"ids": [...], "status": "approved", "feedback": "..."}.
+    """
+    authentication_classes = (SessionAuthentication, JWTAuthentication)
+    permission_classes = (permissions.IsAdminUser,)
+
+    def post(self, request):
+        serializer = BulkReviewSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        return Response(bulk_review(**serializer.validated_data))
+
+
+# --- Creator Search -------------------------------------------------------------
+
+class CreatorSearchView(APIView):
+    """
+    Staff only. GET ?q=<text>[&limit=N] matches email, username, bio and
+    social handles through the search index.
+    """
+    authentication_classes = (SessionAuthentication, JWTAuthentication)
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request):
+        term = request.query_params.get('q', '').strip()
+        if not term:
+            return Response({"detail": "The q parameter is required."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = min(int(request.query_params.get('limit', SEARCH_DEFAULT_LIMIT)), SEARCH_MAX_LIMIT)
+        except ValueError:
+            return Response({"detail": "limit must be a number."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'results': search_creators(term, max(limit, 1))})
+
+
+class SocialHandleLookupView(APIView):
+    """
+    Staff only, from the normalized handle table:
+    GET ?handle=@name[&platform=tiktok] lists the creators using a handle;
+    GET ?platform=tiktok[&after=<last handle>&after_creator=<its creator_id>]
+    pages through a platform.
+    """
+    authentication_classes = (SessionAuthentication, JWTAuthentication)
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request):
+        handle = request.query_params.get('handle', '').strip()
+        platform = request.query_params.get('platform', '').strip()
+        if handle:
+            return Response({'results': find_owners(handle, platform)})
+        if platform:
+            after_creator = request.query_params.get('after_creator')
+            if after_creator is not None and not after_creator.isdigit():
+                return Response({"detail": "after_creator must be a creator id."}, status=status.HTTP_400_BAD_REQUEST)
+            return Response({'results': creators_on_platform(
+                platform, request.query_params.get('after'),
+                int(after_creator) if after_creator is not None else None,
+            )})
+        return Response({"detail": "A handle or platform parameter is required."}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class SocialHandleStatsView(APIView):
+    """
+    Staff only. Creators per platform, and handles claimed by more than one creator.
+    """
+    authentication_classes = (SessionAuthentication, JWTAuthentication)
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request):
+        return Response({
+            'platforms': platform_counts(),
+            'duplicates': duplicate_handles(request.query_params.get('platform')),
+        })
+
+
+# --- Analytics ----------------------------------------------------------------
+
+class CampaignProgressView(APIView):
+    """
+    Staff only. Submission counts for a campaign by status and platform,
+    read from the maintained counters rather than counted per request.
+    """
+    authentication_classes = (SessionAuthentication, JWTAuthentication)
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request, campaign_id):
+        campaign = get_object_or_404(Campaign.objects.only('id', 'title'), pk=campaign_id)
+        return Response(campaign_progress(campaign))
+
+
+class PayoutReportView(APIView):
+    """
+    Staff only. Payout ledger totals, cached until the ledger changes.
+    ?group=campaign,tier,month (any subset, default all) and optional
+    ?since= / ?until= dates (YYYY-MM-DD, until exclusive).
+    """
+    authentication_classes = (SessionAuthentication, JWTAuthentication)
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request):
+        params = request.query_params
+        groups = [group for group in params.get('group', ','.join(REPORT_GROUPS)).split(',') if group]
+        unknown = set(groups) - set(REPORT_GROUPS)
+        if unknown:
+            return Response(
+                {"detail": f"Unknown group: {', '.join(sorted(unknown))}"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        bounds = {}
+        for name in ('since', 'until'):
+            try:
+                bounds[name] = parse_date(params[name]) if params.get(name) else None
+            except ValueError:
+                bounds[name] = None
+            if params.get(name) and bounds[name] is None:
+                return Response({"detail": f"{name} must be a YYYY-MM-DD date."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({'groups': groups, 'rows': payout_report(groups, **bounds)})
+
+
+# --- Resumable Uploads -------------------------------------------------------
+
+class UploadSessionView(APIView):
+    """
+    Opens a chunked upload for a submission video/image and returns the
+    signed targets to PUT each chunk to.
+    """
+    permission_classes = (permissions.IsAuthenticated,)
+
+    def post(self, request):
+        data = request.data
+        try:
+            session = open_session(
+                request.user, filename=data.get('filename'), size=data.get('size'),
+                content_type=data.get('content_type'), campaign=data.get('campaign'),
+                platform=data.get('platform') or 'tiktok'
+            )
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(session_state(session), status=status.HTTP_201_CREATED)
+
+
+class UploadSessionDetailView(APIView):
+    """
+    Progress of an open upload, with fresh targets for the chunks still
+    missing. Expired and completed sessions are gone.
+    """
+    permission_classes = (permissions.IsAuthenticated,)
+
+    def get(self, request, session_id):
+        session = get_object_or_404(UploadSession, pk=session_id, creator=request.user)
+        try:
+            check_open(session)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_410_GONE)
+        return Response(session_state(session))
+
+
+class UploadCompleteView(APIView):
+    """
+    Assembles the chunks and creates the ContentSubmission.
+    """
+    permission_classes = (permissions.IsAuthenticated,)
+
+    def post(self, request, session_id):
+        session = get_object_or_404(UploadSession, pk=session_id, creator=request.user)
+        try:
+            submission = complete_session(session, request=request)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_409_CONFLICT)
+        return Response(ContentSubmissionSerializer(submission).data, status=status.HTTP_201_CREATED)
+
+
+@csrf_exempt
+@require_http_methods(['PUT'])
+def upload_chunk(request, token):
+    """
+    Chunk target for LocalUploadBackend. The signed token is the only
+    credential, like a presigned object-storage URL. The body is streamed
+    to disk, never read into memory whole.
+    """
+    backend = get_upload_backend()
+    if not hasattr(backend, 'write_chunk'):
+        raise Http404
+    try:
+        session_id, index = unsign_chunk(token)
+    except signing.BadSignature:
+        return JsonResponse({"detail": "Invalid or expired upload target."}, status=403)
+
+    session = UploadSession.objects.filter(pk=session_id).first()
+    if session is None or not 0 <= index < session.chunk_count:
+        raise Http404
+    try:
+        check_open(session)
+    except ValueError as e:
+        return JsonResponse({"detail": str(e)}, status=410)
+
+    try:
+        length = int(request.META.get('CONTENT_LENGTH') or 0)
+        backend.write_chunk(session, index, request, length)
+    except ValueError as e:
+        return JsonResponse({"detail": str(e)}, status=400)
+    return HttpResponse(status=204)
+
+
+# --- Exports ----------------------------------------------------------------
+
+class ExportView(ReplicaReadMixin, APIView):
+    """
+    Staff only. Streams creators, profiles, submissions or invites as CSV
+    or JSONL, e.g. /api/exports/submissions.csv?campaign=3&status=approved&since=2025-01-01
+    """
+    authentication_classes = (SessionAuthentication, JWTAuthentication)
+    permission_classes = (permissions.IsAdminUser,)
+
+    def get(self, request, kind, fmt):
+        params = request.query_params
+        try:
+            columns, rows = export_rows(
+                kind, campaign=params.get('campaign'), status=params.get('status'),
+                since=params.get('since'), until=params.get('until'),
+                # Rows are read while streaming, after the routing context has ended
+                using=read_alias(),
+            )
+            content = stream_export(fmt, columns, rows)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        response = StreamingHttpResponse(content, content_type=EXPORT_CONTENT_TYPES[fmt])
+        filename = f"{kind}-{timezone.now():%Y%m%d-%H%M%S}.{fmt}"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
@@ -0,0 +1,17 @@
+"""
+Entry points for worker processes. Importable before Django is set up,
+which spawned pool processes need (see `manage.py process_media`).
+"""
+import signal
+
+
+def init_worker_process():
+    import django
+    django.setup()
+    # Ctrl-C goes to the parent, which drains the pool itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def run_media_job(submission_id):
+    from .media import process_submission
+    return process_submission(submission_id)
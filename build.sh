@@ -9,4 +9,7 @@ pip install -r requirements.txt
 python manage.py collectstatic --no-input
 
 # Update Database structure
-python manage.py migrate
\ No newline at end of file
+python manage.py migrate
+
+# Shared cache table, used when REDIS_URL is not set (see settings.CACHES)
+python manage.py createcachetable
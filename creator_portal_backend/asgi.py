@@ -3,14 +3,46 @@ ASGI config for creator_portal_backend project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Only the async views (/api/async/, api/async_views.py) go through Django's
+ASGI handler. Everything else is the WSGI app, run on a thread pool by
+a2wsgi: sync views keep running concurrently instead of queueing on the
+ASGI handler's single thread-sensitive executor, and streamed responses
+(exports) are sent chunk by chunk instead of buffered whole.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
 
 import os
 
+from a2wsgi import WSGIMiddleware
 from django.core.asgi import get_asgi_application
+from django.core.handlers.asgi import ASGIHandler
+from django.core.signals import request_finished
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'creator_portal_backend.settings')
 
-application = get_asgi_application()
+ASYNC_PREFIX = '/api/async/'
+
+django_asgi = get_asgi_application()
+django_wsgi = WSGIMiddleware(get_wsgi_application(), workers=int(os.environ.get('WSGI_THREADS', 10)))
+
+
+def close_async_connections(**kwargs):
+    # Each ASGI request runs its ORM calls on a thread of its own, so a
+    # persistent (CONN_MAX_AGE) connection would be stranded there. The
+    # WSGI threads keep theirs.
+    for connection in connections.all(initialized_only=True):
+        connection.close()
+
+
+request_finished.connect(close_async_connections, sender=ASGIHandler)
+
+
+async def application(scope, receive, send):
+    if scope['type'] == 'http' and not scope['path'].startswith(ASYNC_PREFIX):
+        await django_wsgi(scope, receive, send)
+    else:
+        await django_asgi(scope, receive, send)
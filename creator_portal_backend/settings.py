@@ -3,6 +3,7 @@ Django settings for creator_portal_backend project.
 """
 
 import os
+import sys
 from pathlib import Path
 import dj_database_url  # CHANGED: Needed to connect to Render's Database
 
@@ -48,10 +49,27 @@ AUTH_USER_MODEL = 'api.Creator'
 # --- REST Framework Settings ---
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'api.authentication.CachedJWTAuthentication',
     ),
+    # Sliding-window limits for login/signup/invite checks (see api/throttling.py)
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': os.environ.get('THROTTLE_LOGIN_IP', '30/min'),
+        'login_email': os.environ.get('THROTTLE_LOGIN_EMAIL', '5/min'),
+        'signup_ip': os.environ.get('THROTTLE_SIGNUP_IP', '10/hour'),
+        'signup_email': os.environ.get('THROTTLE_SIGNUP_EMAIL', '5/hour'),
+        'invite_ip': os.environ.get('THROTTLE_INVITE_IP', '20/min'),
+        'invite_code': os.environ.get('THROTTLE_INVITE_CODE', '10/min'),
+    },
+    # Reverse proxies in front of the app. Client IPs are read that many hops
+    # back in X-Forwarded-For; 0 ignores the header entirely, so a client
+    # can't pick its own throttle key. Defaults to 1 on Render (its load
+    # balancer), else 0; set NUM_PROXIES to override for other deployments.
+    'NUM_PROXIES': int(os.environ.get('NUM_PROXIES', 1 if 'RENDER' in os.environ else 0)),
 }
 
+# Seconds a resolved creator + profile may be reused for read-only requests
+AUTH_USER_CACHE_TIMEOUT = 60
+
 # --- JWT (Login Token) Settings ---
 SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
@@ -61,6 +79,7 @@ SIMPLE_JWT = {
 
 # --- Middleware ---
 MIDDLEWARE = [
+    'api.instrumentation.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware', # CHANGED: This serves CSS/Images on Render
@@ -68,10 +87,17 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # After sessions, so their save on the way out doesn't count as a write
+    'api.routers.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Requests slower than this are logged to `api.requests` with their top
+# queries (see api/instrumentation.py). Staff always get a Server-Timing header.
+SLOW_REQUEST_THRESHOLD_MS = int(os.environ.get('SLOW_REQUEST_THRESHOLD_MS', 500))
+SLOW_REQUEST_TOP_QUERIES = 5
+
 # --- CORS (Cross-Origin) Settings ---
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
@@ -115,6 +141,55 @@ DATABASES = {
     )
 }
 
+# --- Read Replicas ---
+# Comma-separated REPLICA_DATABASE_URLS adds aliases replica1, replica2, ...
+# Views that opt in read from them; writes and everything else use the
+# primary (see api/routers.py). Tests mirror them onto the test primary.
+# Locally, two SQLite files stand in: set
+# REPLICA_DATABASE_URLS=sqlite:///replica.sqlite3 and run `manage.py sync_sqlite_replicas`
+# to copy the primary over (re-run it to "replicate").
+DATABASE_REPLICAS = []
+for number, url in enumerate(filter(None, os.environ.get('REPLICA_DATABASE_URLS', '').split(',')), start=1):
+    alias = f'replica{number}'
+    DATABASES[alias] = {**dj_database_url.parse(url.strip(), conn_max_age=600), 'TEST': {'MIRROR': 'default'}}
+    DATABASE_REPLICAS.append(alias)
+
+# `manage.py test` gets a second, separate SQLite database the routing tests
+# use as a replica (they list it in DATABASE_REPLICAS themselves).
+if sys.argv[1:2] == ['test']:
+    DATABASES['test_replica'] = {'ENGINE': 'django.db.backends.sqlite3', 'NAME': BASE_DIR / 'test_replica.sqlite3'}
+
+DATABASE_ROUTERS = ['api.routers.ReplicaRouter']
+
+# After a user writes, their reads stay on the primary for this long
+REPLICA_PIN_SECONDS = int(os.environ.get('REPLICA_PIN_SECONDS', 10))
+
+# --- Cache ---
+# Versioned API caches, login throttles and replica pins (see api/cache.py).
+# Every worker must see the same cache, or invalidations and lockouts only
+# reach one of them: Redis when REDIS_URL is set, else a database table
+# (build.sh runs createcachetable). Only DEBUG gets a per-process cache.
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+elif not DEBUG:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'api_cache',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # --- Password Validation ---
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -141,4 +216,30 @@ MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
 # --- Default primary key field type ---
-DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
\ No newline at end of file
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# --- Verification Image Storage ---
+# Content-addressed blob store for ID/selfie uploads (see api/blobstore.py).
+# Swap BACKEND for an S3-style implementation in production.
+BLOB_STORE = {
+    'BACKEND': 'api.blobstore.LocalBlobStore',
+    'OPTIONS': {
+        'root': os.environ.get('BLOB_STORE_ROOT', os.path.join(MEDIA_ROOT, 'blobs')),
+    },
+}
+
+# On-disk cache of admin preview thumbnails, keyed by blob hash (see api/thumbnails.py)
+THUMBNAIL_ROOT = os.environ.get('THUMBNAIL_ROOT', os.path.join(MEDIA_ROOT, 'thumbnails'))
+
+# --- Resumable Content Uploads ---
+# Chunked, signed upload sessions for submission videos (see api/uploads.py).
+# The local backend is a stand-in; production should hand out object-storage targets.
+UPLOADS = {
+    'BACKEND': 'api.uploads.LocalUploadBackend',
+    'OPTIONS': {
+        'root': os.environ.get('UPLOADS_ROOT', os.path.join(MEDIA_ROOT, 'uploads')),
+    },
+}
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+UPLOAD_MAX_SIZE = 5 * 1024 ** 3
+UPLOAD_SESSION_TTL = 24 * 60 * 60
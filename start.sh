@@ -0,0 +1,11 @@
+#!/usr/bin/env bash
+# Render start command: ./start.sh (after build.sh)
+# exit on error
+set -o errexit
+
+# The ASGI entrypoint runs the async views (/api/async/) on the event loop and
+# the rest of the app as WSGI on a thread pool (WSGI_THREADS per worker, see
+# creator_portal_backend/asgi.py). Workers default to WEB_CONCURRENCY.
+exec gunicorn creator_portal_backend.asgi:application \
+    --worker-class uvicorn_worker.UvicornWorker \
+    --bind "0.0.0.0:${PORT:-8000}"